@@ -0,0 +1,121 @@
+"""Benchmark of the paragraph extraction from .docx files.
+
+Compares the streaming ``gogol_cli.docx_text.iter_paragraphs`` with building
+the whole ``word/document.xml`` tree first (the previous implementation): time
+and peak traced memory per document, and checks that both extract the same
+paragraphs.
+
+Usage:
+    uv run python benchmarks/docx_paragraphs.py [<document.docx> ...] [--pages 300]
+
+Without documents, a synthetic catalogue of ``--pages`` pages is generated.
+"""
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from gogol_cli.docx_text import iter_paragraphs
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_PARAGRAPHS_PER_PAGE = 40
+_WORDS = "выставка книга издание бумага гравюра рисунок автор СССР Москва том".split()
+
+
+def _collapse_spaces(text: str) -> str:
+    """Replace non-breaking spaces, then collapse runs of spaces to one (as before)."""
+    text = text.replace("\xa0", " ")
+    return re.sub(r" {2,}", " ", text).strip()
+
+
+def tree_paragraphs(path: str) -> list[str]:
+    """Extract paragraphs like before: parse the whole tree, then walk ``.//w:p``."""
+    with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as f:
+        tree = ET.parse(f)
+
+    ns = {"w": _W_NS}
+    results: list[str] = []
+    for p in tree.findall(".//w:p", ns):
+        text = _collapse_spaces("".join(t.text or "" for t in p.findall(".//w:t", ns)))
+        if text:
+            results.append(text)
+    return results
+
+
+def streaming_paragraphs(path: str) -> list[str]:
+    """Extract paragraphs with the streaming extractor."""
+    return list(iter_paragraphs(path))
+
+
+_METHODS: dict[str, Callable[[str], list[str]]] = {
+    "tree": tree_paragraphs,
+    "iterparse": streaming_paragraphs,
+}
+
+
+def _synthetic_document(directory: Path, pages: int) -> Path:
+    """Write a .docx with *pages* pages of formatted paragraphs (several runs each)."""
+    rng = random.Random(0)
+    paragraphs = []
+    for _ in range(pages * _PARAGRAPHS_PER_PAGE):
+        runs = "".join(
+            f'<w:r><w:rPr><w:b w:val="{rng.randint(0, 1)}"/><w:sz w:val="24"/></w:rPr>'
+            f'<w:t xml:space="preserve">{" ".join(rng.choices(_WORDS, k=6))} </w:t></w:r>'
+            for _ in range(rng.randint(2, 6))
+        )
+        paragraphs.append(f'<w:p><w:pPr><w:jc w:val="both"/></w:pPr>{runs}</w:p>')
+    document = f'<w:document xmlns:w="{_W_NS}"><w:body>{"".join(paragraphs)}</w:body></w:document>'
+
+    path = directory / f"catalogue-{pages}-pages.docx"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("word/document.xml", document)
+    return path
+
+
+def _measure(method: Callable[[str], list[str]], path: Path) -> tuple[float, int, list[str]]:
+    """Run *method* on *path*; return (seconds, peak traced bytes, paragraphs)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    paragraphs = method(str(path))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, paragraphs
+
+
+def main() -> int:
+    """Run the benchmark and print one table row per document and method."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("documents", nargs="*", type=Path, help=".docx files to parse")
+    parser.add_argument("--pages", type=int, default=300, help="pages of the synthetic document")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.documents or [_synthetic_document(Path(tmp), args.pages)]
+
+        ok = True
+        print(f"{'document':<30} {'method':<10} {'paragraphs':>10} {'time, s':>8} {'peak, MB':>9}")
+        for path in paths:
+            results = {name: _measure(method, path) for name, method in _METHODS.items()}
+            ok = ok and results["tree"][2] == results["iterparse"][2]
+            for name, (elapsed, peak, paragraphs) in results.items():
+                print(
+                    f"{path.name[:30]:<30} {name:<10} {len(paragraphs):>10} "
+                    f"{elapsed:8.3f} {peak / 2**20:9.1f}"
+                )
+
+    if not ok:
+        print("FAIL: the extractors returned different paragraphs", file=sys.stderr)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Benchmark of the image resizing used for virtual exhibitions.
+
+Compares the draft-mode resize of ``gogol_cli.images.process_image_file`` (as
+run by the CLI) with a full decode followed by the same LANCZOS reduction
+(the previous implementation): time
+and peak RSS per image, each measured in a fresh process, and the PSNR of the
+two results as a quality-equivalence check.
+
+Usage:
+    uv run python benchmarks/resize_image.py [<image> ...] [--max-dim 1280] [--min-psnr 40]
+
+Without images, a synthetic 6000x8000 JPEG scan is generated.  The exit code
+is 1 if any image falls below ``--min-psnr``.
+"""
+
+import argparse
+import io
+import math
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+from gogol_cli import constants as const
+from gogol_cli.images import process_image_file
+from gogol_cli.schemas import ImageRef
+
+
+def full_decode_resize(path: Path, max_dim: int) -> tuple[bytes, int, int]:
+    """Resize like before draft mode: decode at full size, then LANCZOS."""
+    data = path.read_bytes()
+    with Image.open(io.BytesIO(data)) as img:
+        orig_format = img.format or "JPEG"
+        w, h = img.width, img.height
+        if max(w, h) <= max_dim:
+            return data, w, h
+        ratio = max_dim / max(w, h)
+        new_w = max(1, int(w * ratio))
+        new_h = max(1, int(h * ratio))
+        resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        resized.save(buf, format=orig_format, quality=90)
+        return buf.getvalue(), new_w, new_h
+
+
+def draft_resize(path: Path, max_dim: int) -> tuple[bytes, int, int]:
+    """Resize like the CLI does, with draft mode for JPEGs."""
+    resized, width, height = process_image_file(ImageRef(path=str(path)), max_dim)
+    return path.read_bytes() if resized is None else resized, width, height
+
+
+_METHODS = {"full decode": full_decode_resize, "draft": draft_resize}
+
+
+def _measure(method: str, path: Path, max_dim: int) -> tuple[float, int, bytes]:
+    """Resize *path* with *method*; return (seconds, peak RSS in bytes, result)."""
+    start = time.perf_counter()
+    result, _, _ = _METHODS[method](path, max_dim)
+    elapsed = time.perf_counter() - start
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return elapsed, max_rss if sys.platform == "darwin" else max_rss * 1024, result
+
+
+def _psnr(first: bytes, second: bytes) -> float:
+    """Peak signal-to-noise ratio of two encoded images of the same size, in dB."""
+    with Image.open(io.BytesIO(first)) as a, Image.open(io.BytesIO(second)) as b:
+        diff = ImageChops.difference(a.convert("RGB"), b.convert("RGB"))
+    stat = ImageStat.Stat(diff)
+    mse = sum(stat.sum2) / (len(stat.sum2) * diff.width * diff.height)
+    return math.inf if mse == 0 else 10 * math.log10(255**2 / mse)
+
+
+def _synthetic_scan(directory: Path) -> Path:
+    """Write a detailed 6000x8000 JPEG that resembles a scanned page."""
+    size = (6000, 8000)
+    base = Image.effect_mandelbrot((750, 1000), (-2.0, -1.5, 1.0, 1.5), 200)
+    base = base.resize(size, Image.Resampling.BICUBIC).filter(ImageFilter.DETAIL)
+    noise = Image.effect_noise(size, 12)
+    image = Image.merge("RGB", (base, ImageChops.add(base, noise, 2.0, -64), noise))
+
+    path = directory / "scan-6000x8000.jpg"
+    image.save(path, "JPEG", quality=92)
+    return path
+
+
+def main() -> int:
+    """Run the benchmark and print one table row per image and method."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("images", nargs="*", type=Path, help="JPEG files to resize")
+    parser.add_argument("--max-dim", type=int, default=const.VIRTUAL_EXHIBITION_MAX_IMAGE_DIM)
+    parser.add_argument("--min-psnr", type=float, default=40.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = args.images or [_synthetic_scan(Path(tmp))]
+
+        ok = True
+        print(f"{'image':<30} {'method':<12} {'time, s':>8} {'peak RSS, MB':>13} {'PSNR, dB':>9}")
+        for path in paths:
+            results = {}
+            for method in _METHODS:
+                # A fresh process per measurement, so that peak RSS is not shared.
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    results[method] = pool.submit(_measure, method, path, args.max_dim).result()
+
+            psnr = _psnr(results["full decode"][2], results["draft"][2])
+            ok = ok and psnr >= args.min_psnr
+            for method, (elapsed, max_rss, _) in results.items():
+                quality = f"{psnr:9.2f}" if method == "draft" else f"{'-':>9}"
+                print(
+                    f"{path.name[:30]:<30} {method:<12} {elapsed:8.3f} "
+                    f"{max_rss / 2**20:13.1f} {quality}"
+                )
+
+    if not ok:
+        print(f"FAIL: PSNR below {args.min_psnr} dB", file=sys.stderr)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
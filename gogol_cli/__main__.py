@@ -2,20 +2,27 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from calendar import monthrange
+from datetime import date, datetime, timedelta
 from typing import Annotated
 
 import typer
 import uvloop
 from dotenv import load_dotenv
 
+from gogol_cli import constants as const
+from gogol_cli.answers import Answers
 from gogol_cli.exporters.smtp import EmailConfig, SMTPConfig
 from gogol_cli.runner import copy_chronograph as run_chronograph
 from gogol_cli.runner import copy_event as run_copy_event
 from gogol_cli.runner import create_exhibition as run_create_exhibition
+from gogol_cli.runner import create_exhibitions as run_create_exhibitions
 from gogol_cli.runner import create_virtual_exhibition as run_create_virtual_exhibition
+from gogol_cli.runner import create_virtual_exhibitions as run_create_virtual_exhibitions
 from gogol_cli.runner import export_statistics as run_export
+from gogol_cli.runner import export_statistics_breakdown as run_export_breakdown
 from gogol_cli.runner import pin_event as run_pin_event
+from gogol_cli.schemas import BatchFolderResult, BatchOptions, Granularity, Recurrence
 from gogol_cli.ssh_file_manager import SSHConfig
 
 load_dotenv()
@@ -31,6 +38,19 @@ def pin(
     ssh_username: Annotated[str, typer.Option(help="SSH username", envvar="SSH_USERNAME")],
     ssh_key_path: Annotated[str, typer.Option(help="SSH key path", envvar="SSH_KEY_PATH")],
     ssh_base_path: Annotated[str, typer.Option(help="SSH base path", envvar="SSH_BASE_PATH")],
+    per_event_commit: Annotated[
+        bool,
+        typer.Option(
+            "--per-event-commit", help="Pin each event in its own transaction instead of one"
+        ),
+    ] = False,
+    link_pictures: Annotated[
+        bool,
+        typer.Option(
+            "--link-pictures",
+            help="Hard-link the pictures into their new paths instead of copying them",
+        ),
+    ] = False,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Dry run")] = False,
 ) -> None:
     """Pin the event(s)."""
@@ -41,24 +61,64 @@ def pin(
         key_path=ssh_key_path,
         base_path=ssh_base_path,
     )
-    asyncio.run(run_pin_event(database_uri, event_urls, dry_run, ssh_config))
+    asyncio.run(
+        run_pin_event(
+            database_uri, event_urls, dry_run, ssh_config, per_event_commit, link_pictures
+        )
+    )
 
 
 @app.command()
-def copy(
+def copy(  # noqa: PLR0913, PLR0917
     database_uri: Annotated[str, typer.Option(help="Database URI", envvar="DATABASE_URI")],
     event_url: Annotated[str, typer.Argument(help="Event URL")],
-    new_event_date_str: Annotated[str, typer.Argument(help="New event date (2024-10-20)")],
-    new_event_time_str: Annotated[str, typer.Argument(help="New event time (18-00)")],
     ssh_host: Annotated[str, typer.Option(help="SSH host", envvar="SSH_HOST")],
     ssh_username: Annotated[str, typer.Option(help="SSH username", envvar="SSH_USERNAME")],
     ssh_key_path: Annotated[str, typer.Option(help="SSH key path", envvar="SSH_KEY_PATH")],
     ssh_base_path: Annotated[str, typer.Option(help="SSH base path", envvar="SSH_BASE_PATH")],
+    new_event_date_str: Annotated[
+        str | None,
+        typer.Argument(help="New event date (2024-10-20); the first date with --every"),
+    ] = None,
+    new_event_time_str: Annotated[
+        str | None, typer.Argument(help="New event time (18-00)")
+    ] = None,
     new_price: (Annotated[str, typer.Option(help="New event price (100–300)")] | None) = None,
+    dates_str: Annotated[
+        str | None,
+        typer.Option("--dates", help="Comma-separated new event dates (2025-03-01,2025-03-08)"),
+    ] = None,
+    time_str: Annotated[
+        str | None, typer.Option("--time", help="New event time (18-00) for all dates")
+    ] = None,
+    every: Annotated[
+        Recurrence | None,
+        typer.Option(help="Repeat the new event date every day, week, or month until --until"),
+    ] = None,
+    until_str: Annotated[
+        str | None,
+        typer.Option("--until", help="Last possible date of the recurring schedule (2025-06-30)"),
+    ] = None,
+    link_pictures: Annotated[
+        bool,
+        typer.Option(
+            "--link-pictures",
+            help="Hard-link the pictures into their new paths instead of copying them",
+        ),
+    ] = False,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Dry run")] = False,
 ) -> None:
-    """Copy the event."""
+    """Copy the event to one or more new dates."""
     uvloop.install()
+
+    if time_str is not None and new_event_time_str is not None:
+        raise typer.BadParameter("Pass the new event time as an argument or with --time, not both")
+    new_event_time_str = time_str or new_event_time_str
+    if new_event_time_str is None:
+        raise typer.BadParameter("Pass the new event time as an argument or with --time")
+
+    new_event_date_strs = _copy_dates(new_event_date_str, dates_str, every, until_str)
+
     ssh_config = SSHConfig(
         host=ssh_host,
         username=ssh_username,
@@ -69,45 +129,179 @@ def copy(
         run_copy_event(
             database_uri,
             event_url,
-            new_event_date_str,
+            new_event_date_strs,
             new_event_time_str,
             new_price,
             dry_run,
             ssh_config,
+            link_pictures,
         )
     )
 
 
 @app.command()
-def export(
+def export(  # noqa: PLR0913, PLR0917
     database_uri: Annotated[str, typer.Option(help="Database URI", envvar="DATABASE_URI")],
-    month_number: Annotated[int, typer.Argument(help="Month number (1-12)")],
-    year_suffix: Annotated[
-        str, typer.Argument(help="Two last letters of the year (24, 25, and so on)")
-    ],
     smtp_host: Annotated[str, typer.Option(help="SMTP host", envvar="SMTP_HOST")],
     smtp_port: Annotated[int, typer.Option(help="SMTP port", envvar="SMTP_PORT")],
     smtp_username: Annotated[str, typer.Option(help="SMTP username", envvar="SMTP_USERNAME")],
     smtp_password: Annotated[str, typer.Option(help="SMTP password", envvar="SMTP_PASSWORD")],
     from_addr: Annotated[str, typer.Option(help="From address", envvar="FROM_ADDR")],
     to_addr: Annotated[str, typer.Option(help="To address", envvar="TO_ADDR")],
+    month_number: Annotated[
+        int | None, typer.Argument(help="Month number (1-12)", min=1, max=12)
+    ] = None,
+    year_suffix: Annotated[
+        str | None, typer.Argument(help="Two last letters of the year (24, 25, and so on)")
+    ] = None,
+    from_month_str: Annotated[
+        str | None,
+        typer.Option("--from", help="First month of a multi-month report (YYYY-MM)"),
+    ] = None,
+    to_month_str: Annotated[
+        str | None,
+        typer.Option("--to", help="Last month of a multi-month report (YYYY-MM). Default: --from"),
+    ] = None,
+    granularity: Annotated[
+        Granularity, typer.Option(help="Period of the rows of a multi-month report")
+    ] = Granularity.MONTH,
+    explain: Annotated[
+        bool, typer.Option("--explain", help="Print the query plans of the statistics queries")
+    ] = False,
+    refresh: Annotated[
+        bool, typer.Option("--refresh", help="Recount the month instead of using the local cache")
+    ] = False,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Dry run")] = False,
 ) -> None:
-    """Export monthly statistics."""
+    """Export monthly statistics, or a breakdown of several months with --from/--to."""
     uvloop.install()
     smtp_config = SMTPConfig(
         host=smtp_host, port=smtp_port, username=smtp_username, password=smtp_password
     )
+
+    if from_month_str is not None:
+        first_month = _parse_month(from_month_str, "--from")
+        last_month = _parse_month(to_month_str, "--to") if to_month_str else first_month
+        if last_month < first_month:
+            raise typer.BadParameter("--to must not be before --from")
+
+        email_config = EmailConfig(
+            from_addr=from_addr,
+            to_addr=to_addr,
+            subject=(
+                "Отчёт об удалённой работе за "
+                f"{first_month.strftime('%m.%Y')}–{last_month.strftime('%m.%Y')}"
+            ),
+        )
+        asyncio.run(
+            run_export_breakdown(
+                database_uri,
+                first_month,
+                last_month,
+                granularity,
+                dry_run,
+                smtp_config,
+                email_config,
+                explain,
+            )
+        )
+        return
+
+    if month_number is None or year_suffix is None:
+        raise typer.BadParameter("Pass MONTH_NUMBER and YEAR_SUFFIX, or --from YYYY-MM")
+
     email_config = EmailConfig(
         from_addr=from_addr,
         to_addr=to_addr,
         subject=f"Отчёт об удалённой работе за {str(month_number).zfill(2)}.20{year_suffix}",
     )
     asyncio.run(
-        run_export(database_uri, month_number, year_suffix, dry_run, smtp_config, email_config)
+        run_export(
+            database_uri,
+            month_number,
+            year_suffix,
+            dry_run,
+            smtp_config,
+            email_config,
+            explain,
+            refresh,
+        )
     )
 
 
+def _copy_dates(
+    new_event_date_str: str | None,
+    dates_str: str | None,
+    every: Recurrence | None,
+    until_str: str | None,
+) -> list[str]:
+    """Validate the new event dates of the copy command and list them (YYYY-MM-DD)."""
+    if dates_str is not None:
+        if new_event_date_str is not None or every is not None:
+            raise typer.BadParameter("--dates cannot be combined with NEW_EVENT_DATE or --every")
+        dates = [
+            _parse_date(value.strip(), "--dates").strftime(const.DATE_FORMAT)
+            for value in dates_str.split(",")
+            if value.strip()
+        ]
+    elif new_event_date_str is None:
+        raise typer.BadParameter("Pass the new event date as an argument or with --dates")
+    elif every is not None:
+        if until_str is None:
+            raise typer.BadParameter("--every requires --until")
+        dates = _recurring_dates(
+            _parse_date(new_event_date_str, "NEW_EVENT_DATE"),
+            every,
+            _parse_date(until_str, "--until"),
+        )
+    else:
+        dates = [_parse_date(new_event_date_str, "NEW_EVENT_DATE").strftime(const.DATE_FORMAT)]
+
+    if until_str is not None and every is None:
+        raise typer.BadParameter("--until requires --every")
+    if not dates:
+        raise typer.BadParameter("The schedule has no dates")
+    return dates
+
+
+def _recurring_dates(first_date: date, every: Recurrence, until: date) -> list[str]:
+    """List the dates from *first_date* to *until* (inclusive) repeating *every* period."""
+    dates: list[str] = []
+    while (next_date := _nth_recurrence(first_date, every, len(dates))) <= until:
+        dates.append(next_date.strftime(const.DATE_FORMAT))
+    return dates
+
+
+def _nth_recurrence(first_date: date, every: Recurrence, n: int) -> date:
+    """Get the date *n* periods after *first_date*."""
+    if every is Recurrence.DAY:
+        return first_date + timedelta(days=n)
+    if every is Recurrence.WEEK:
+        return first_date + timedelta(weeks=n)
+
+    # Same day of the month, or the last day of shorter months
+    year, month_index = divmod(first_date.month - 1 + n, 12)
+    year += first_date.year
+    day = min(first_date.day, monthrange(year, month_index + 1)[1])
+    return date(year, month_index + 1, day)
+
+
+def _parse_date(value: str, option: str) -> date:
+    """Parse a YYYY-MM-DD date argument or option."""
+    try:
+        return datetime.strptime(value, const.DATE_FORMAT).date()
+    except ValueError as exc:
+        raise typer.BadParameter(f"{option} must be a date in the YYYY-MM-DD format") from exc
+
+
+def _parse_month(value: str, option: str) -> datetime:
+    """Parse a YYYY-MM month option."""
+    try:
+        return datetime.strptime(value, "%Y-%m")
+    except ValueError as exc:
+        raise typer.BadParameter(f"{option} must be a month in the YYYY-MM format") from exc
+
+
 @app.command()
 def chrono(
     database_uri: Annotated[str, typer.Option(help="Database URI", envvar="DATABASE_URI")],
@@ -122,8 +316,30 @@ def chrono(
     asyncio.run(run_chronograph(database_uri, month_number, year_suffix, dry_run))
 
 
+def _load_answers(
+    answers_path: str | None, accept_defaults: bool, dump_answers_path: str | None
+) -> Answers:
+    """Build the answers to the parser prompts from the answers options."""
+    # Dumping never asks: the dumped file is where the answers get edited.
+    collect_only = dump_answers_path is not None
+    if answers_path is None:
+        return Answers(accept_defaults=accept_defaults, collect_only=collect_only)
+    try:
+        return Answers.from_file(answers_path, accept_defaults, collect_only)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--answers") from exc
+
+
+def _exit_on_batch_failure(results: list[BatchFolderResult]) -> None:
+    """Exit with status 1 if any folder of a batch run failed."""
+    failed = [result.folder for result in results if result.error is not None]
+    if failed:
+        typer.echo(f"{len(failed)} of {len(results)} folder(s) failed: {', '.join(failed)}")
+        raise typer.Exit(1)
+
+
 @app.command()
-def exhibit(
+def exhibit(  # noqa: PLR0913, PLR0917
     database_uri: Annotated[str, typer.Option(help="Database URI", envvar="DATABASE_URI")],
     folder: Annotated[str, typer.Argument(help="Path to the folder with exhibition .docx files")],
     ssh_host: Annotated[str, typer.Option(help="SSH host", envvar="SSH_HOST")],
@@ -137,6 +353,56 @@ def exhibit(
             help="Active from datetime (YYYY-MM-DD HH:MM:SS). Default: yesterday 15:00.",
         ),
     ] = None,
+    upload_concurrency: Annotated[
+        int,
+        typer.Option(help="Maximum number of simultaneous image uploads", min=1),
+    ] = const.DEFAULT_UPLOAD_CONCURRENCY,
+    batch: Annotated[
+        bool,
+        typer.Option(
+            "--batch",
+            help="Treat FOLDER as a root and create an exhibition from each of its sub-folders",
+        ),
+    ] = False,
+    folder_concurrency: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of folders parsed and exhibitions created at once (--batch)",
+            min=1,
+        ),
+    ] = const.DEFAULT_FOLDER_CONCURRENCY,
+    dedup: Annotated[
+        bool,
+        typer.Option(
+            "--dedup",
+            help="Reuse the file records of images that were uploaded before",
+        ),
+    ] = False,
+    reparse: Annotated[
+        bool,
+        typer.Option(
+            "--reparse",
+            help="Parse the documents again instead of loading cached parse results",
+        ),
+    ] = False,
+    answers_path: Annotated[
+        str | None,
+        typer.Option("--answers", help="JSON or YAML file with answers to the prompts"),
+    ] = None,
+    accept_defaults: Annotated[
+        bool,
+        typer.Option(
+            "--accept-defaults",
+            help="Take the default answer of every prompt not answered by --answers",
+        ),
+    ] = False,
+    dump_answers_path: Annotated[
+        str | None,
+        typer.Option(
+            "--dump-answers",
+            help="Only parse the folder and write the answers to this JSON or YAML file",
+        ),
+    ] = None,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Dry run")] = False,
 ) -> None:
     """Create an exhibition and its books from a folder of .docx files."""
@@ -154,11 +420,46 @@ def exhibit(
         key_path=ssh_key_path,
         base_path=ssh_base_path,
     )
-    asyncio.run(run_create_exhibition(database_uri, folder, active_from, dry_run, ssh_config))
+    answers = _load_answers(answers_path, accept_defaults, dump_answers_path)
+    if batch:
+        results = asyncio.run(
+            run_create_exhibitions(
+                database_uri,
+                folder,
+                active_from,
+                dry_run,
+                ssh_config,
+                upload_concurrency,
+                dedup,
+                answers=answers,
+                options=BatchOptions(
+                    folder_concurrency=folder_concurrency,
+                    reparse=reparse,
+                    dump_answers_path=dump_answers_path,
+                ),
+            )
+        )
+        _exit_on_batch_failure(results)
+        return
+
+    asyncio.run(
+        run_create_exhibition(
+            database_uri,
+            folder,
+            active_from,
+            dry_run,
+            ssh_config,
+            upload_concurrency,
+            dedup,
+            reparse,
+            answers=answers,
+            dump_answers_path=dump_answers_path,
+        )
+    )
 
 
 @app.command()
-def virtual(
+def virtual(  # noqa: PLR0913, PLR0917
     database_uri: Annotated[str, typer.Option(help="Database URI", envvar="DATABASE_URI")],
     folder: Annotated[
         str,
@@ -168,6 +469,56 @@ def virtual(
     ssh_username: Annotated[str, typer.Option(help="SSH username", envvar="SSH_USERNAME")],
     ssh_key_path: Annotated[str, typer.Option(help="SSH key path", envvar="SSH_KEY_PATH")],
     ssh_base_path: Annotated[str, typer.Option(help="SSH base path", envvar="SSH_BASE_PATH")],
+    upload_concurrency: Annotated[
+        int,
+        typer.Option(help="Maximum number of simultaneous image uploads", min=1),
+    ] = const.DEFAULT_UPLOAD_CONCURRENCY,
+    batch: Annotated[
+        bool,
+        typer.Option(
+            "--batch",
+            help="Treat FOLDER as a root and create an exhibition from each of its sub-folders",
+        ),
+    ] = False,
+    folder_concurrency: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of folders parsed and exhibitions created at once (--batch)",
+            min=1,
+        ),
+    ] = const.DEFAULT_FOLDER_CONCURRENCY,
+    dedup: Annotated[
+        bool,
+        typer.Option(
+            "--dedup",
+            help="Reuse the file records of images that were uploaded before",
+        ),
+    ] = False,
+    reparse: Annotated[
+        bool,
+        typer.Option(
+            "--reparse",
+            help="Parse the documents again instead of loading cached parse results",
+        ),
+    ] = False,
+    answers_path: Annotated[
+        str | None,
+        typer.Option("--answers", help="JSON or YAML file with answers to the prompts"),
+    ] = None,
+    accept_defaults: Annotated[
+        bool,
+        typer.Option(
+            "--accept-defaults",
+            help="Take the default answer of every prompt not answered by --answers",
+        ),
+    ] = False,
+    dump_answers_path: Annotated[
+        str | None,
+        typer.Option(
+            "--dump-answers",
+            help="Only parse the folder and write the answers to this JSON or YAML file",
+        ),
+    ] = None,
     dry_run: Annotated[bool, typer.Option("--dry-run", help="Dry run")] = False,
 ) -> None:
     """Create a virtual exhibition from a folder containing a .doc/.docx file and images."""
@@ -178,7 +529,40 @@ def virtual(
         key_path=ssh_key_path,
         base_path=ssh_base_path,
     )
-    asyncio.run(run_create_virtual_exhibition(database_uri, folder, dry_run, ssh_config))
+    answers = _load_answers(answers_path, accept_defaults, dump_answers_path)
+    if batch:
+        results = asyncio.run(
+            run_create_virtual_exhibitions(
+                database_uri,
+                folder,
+                dry_run,
+                ssh_config,
+                upload_concurrency,
+                dedup,
+                answers=answers,
+                options=BatchOptions(
+                    folder_concurrency=folder_concurrency,
+                    reparse=reparse,
+                    dump_answers_path=dump_answers_path,
+                ),
+            )
+        )
+        _exit_on_batch_failure(results)
+        return
+
+    asyncio.run(
+        run_create_virtual_exhibition(
+            database_uri,
+            folder,
+            dry_run,
+            ssh_config,
+            upload_concurrency,
+            dedup,
+            reparse,
+            answers=answers,
+            dump_answers_path=dump_answers_path,
+        )
+    )
 
 
 @app.command()
@@ -0,0 +1,173 @@
+"""Answers to the interactive parser prompts, from the operator or from an answers file."""
+
+import copy
+import json
+import os
+from collections.abc import Sequence
+from typing import Any
+
+import typer
+import yaml
+
+_YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+class Answers:
+    """Resolves the parser prompts.
+
+    Each prompt is identified by a key path, e.g. ``("books", "2. Gogol.docx",
+    "author")``, which is also its place in the (nested) answers file.  A prompt
+    is answered from the file if it has an answer there, else with its default
+    if defaults are accepted, else by the operator.  Every answer is recorded,
+    so that the answers of a run can be written out and edited offline.
+    """
+
+    def __init__(
+        self,
+        overrides: dict[str, Any] | None = None,
+        accept_defaults: bool = False,
+        collect_only: bool = False,
+    ) -> None:
+        """Initialize the answers.
+
+        Args:
+            overrides: The answers from an answers file.
+            accept_defaults: If true, prompts without an answer in *overrides*
+                take their default instead of asking the operator.
+            collect_only: If true, the answers are only collected to be written
+                out, so invalid ones are kept for the operator to fix instead of
+                being rejected.  Implies *accept_defaults*.
+        """
+        self._overrides = overrides or {}
+        self._accept_defaults = accept_defaults or collect_only
+        self._collect_only = collect_only
+        self._recorded: dict[str, Any] = {}
+        self._prefix: tuple[str, ...] = ()
+
+    @property
+    def interactive(self) -> bool:
+        """Whether prompts without an answer in the file are asked."""
+        return not self._accept_defaults
+
+    @property
+    def collect_only(self) -> bool:
+        """Whether the answers are only collected to be written out."""
+        return self._collect_only
+
+    @classmethod
+    def from_file(
+        cls, path: str, accept_defaults: bool = False, collect_only: bool = False
+    ) -> "Answers":
+        """Load the answers from a JSON or YAML (``.yaml``/``.yml``) file.
+
+        Args:
+            path: The path of the answers file.
+            accept_defaults: See ``Answers``.
+            collect_only: See ``Answers``.
+
+        Returns:
+            The answers.
+
+        Raises:
+            ValueError: If the file is not a mapping.
+        """
+        with open(path, encoding="utf-8") as file:
+            if _is_yaml(path):
+                overrides = yaml.safe_load(file)
+            else:
+                overrides = json.load(file)
+        if not isinstance(overrides, dict):
+            raise ValueError(f"The answers file must contain a mapping: {path}")
+        return cls(overrides, accept_defaults, collect_only)
+
+    def scoped(self, name: str) -> "Answers":
+        """Return a view of the answers nested under *name* (e.g. one folder of a batch).
+
+        The view shares the answers file and the recorded answers with this one.
+        Its answers are recorded in the order the views are created, whichever
+        view is answered first.
+
+        Args:
+            name: The key that the answers of the view are nested under.
+
+        Returns:
+            The scoped answers.
+        """
+        scoped = copy.copy(self)
+        scoped._prefix = (*self._prefix, name)
+        recorded = self._recorded
+        for part in scoped._prefix:
+            recorded = recorded.setdefault(part, {})
+        return scoped
+
+    def ask(self, key: Sequence[str], text: str, default: str) -> str:
+        """Answer a prompt.
+
+        Args:
+            key: The key path of the prompt.
+            text: The prompt text shown to the operator.
+            default: The default answer.
+
+        Returns:
+            The answer.
+        """
+        key = (*self._prefix, *key)
+        value = _lookup(self._overrides, key)[1]
+        if value is not None:
+            answer = str(value)
+            typer.echo(f"{text}: {answer}")
+        elif self._accept_defaults:
+            answer = default
+            typer.echo(f"{text}: {answer}")
+        else:
+            answer = typer.prompt(text, default=default)
+
+        recorded = self._recorded
+        for part in key[:-1]:
+            recorded = recorded.setdefault(part, {})
+        recorded[key[-1]] = answer
+        return answer
+
+    def reject(self, key: Sequence[str]) -> None:
+        """Drop the answer to a prompt from the file (e.g. an invalid one).
+
+        Args:
+            key: The key path of the prompt.
+        """
+        key = (*self._prefix, *key)
+        parent, _ = _lookup(self._overrides, key)
+        if parent is None:
+            return
+        parent.pop(key[-1], None)
+        if key[-1].isdigit():
+            parent.pop(int(key[-1]), None)
+
+    def dump(self, path: str) -> None:
+        """Write the answers of this run to a JSON or YAML (``.yaml``/``.yml``) file.
+
+        Args:
+            path: The path of the answers file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            if _is_yaml(path):
+                yaml.safe_dump(self._recorded, file, allow_unicode=True, sort_keys=False)
+            else:
+                json.dump(self._recorded, file, ensure_ascii=False, indent=2)
+                file.write("\n")
+
+
+def _lookup(answers: dict[str, Any], key: Sequence[str]) -> tuple[dict | None, Any]:
+    """Return the mapping holding the answer at a key path, and the answer (or None)."""
+    parent: Any = None
+    value: Any = answers
+    for part in key:
+        if not isinstance(value, dict):
+            return None, None
+        parent = value
+        # YAML reads unquoted numeric keys (e.g. item numbers) as ints.
+        value = value.get(part, value.get(int(part)) if part.isdigit() else None)
+    return parent, value
+
+
+def _is_yaml(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in _YAML_EXTENSIONS
@@ -1,32 +1,63 @@
 """Clients."""
 
+import asyncio
 import logging
-import re
+from collections import defaultdict, deque
+from collections.abc import Collection
 from datetime import datetime, timedelta
 from itertools import count
+from typing import cast
 from uuid import uuid4
 
-from sqlalchemy import text
+from sqlalchemy import CursorResult, Result, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from gogol_cli import constants as const
 from gogol_cli.exceptions import DBEventNotFoundError
-from gogol_cli.schemas import Event, File
+from gogol_cli.schemas import (
+    ChronographCopyResult,
+    Event,
+    EventCopy,
+    File,
+    Granularity,
+    StatisticsCount,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# Statistics label -> (table, timestamp column), in report order
+_STATISTICS_SOURCES = {
+    "01 added": ("b_iblock_element", "DATE_CREATE"),
+    "02 files": ("b_file", "TIMESTAMP_X"),
+    "03 updated": ("b_iblock_element", "TIMESTAMP_X"),
+    "04 search changes": ("b_search_content", "DATE_CHANGE"),
+}
+
+# MySQL DATE_FORMAT patterns of the statistics buckets (weeks are ISO weeks, e.g. 2025-W01)
+_BUCKET_FORMATS = {
+    Granularity.MONTH: "%Y-%m",
+    Granularity.WEEK: "%x-W%v",
+    Granularity.DAY: "%Y-%m-%d",
+}
+
 
 class DatabaseClient:
     """Database client."""
 
-    def __init__(self, database_uri: str) -> None:
+    def __init__(
+        self,
+        database_uri: str,
+        property_batch_size: int = const.PROPERTY_INSERT_BATCH_SIZE,
+    ) -> None:
         """Initialize the client.
 
         Args:
             database_uri: Database URI.
+            property_batch_size: The maximum number of rows per multi-row property INSERT.
         """
         self._engine = create_async_engine(database_uri, echo=False)
         self._session_maker = async_sessionmaker(self._engine)
+        self._property_batch_size = property_batch_size
 
     def session(self) -> AsyncSession:
         """Return an async session context manager.
@@ -36,6 +67,17 @@ class DatabaseClient:
         """
         return self._session_maker()
 
+    def property_writer(self, session: AsyncSession) -> "PropertyWriter":
+        """Return a property writer bound to *session*.
+
+        Args:
+            session: The active database session.
+
+        Returns:
+            A writer that buffers ``b_iblock_element_property`` rows for *session*.
+        """
+        return PropertyWriter(session, self._property_batch_size)
+
     async def _query(self, query: str, params: dict | None = None) -> list[dict]:
         """Execute a read-only parameterised query and return rows as dicts."""
         async with self._session_maker() as session:
@@ -66,7 +108,22 @@ class DatabaseClient:
         Returns:
             The matching Event instance.
         """
-        LOGGER.info("Getting event ID %s from the database ...", event_id)
+        (event,) = await self.get_events_by_ids([event_id])
+        return event
+
+    async def get_events_by_ids(self, event_ids: list[str]) -> list[Event]:
+        """Fetch event records from the database by their numeric IDs in one query.
+
+        Args:
+            event_ids: The numeric event IDs as strings.
+
+        Returns:
+            The matching Event instances, in the order of *event_ids*.
+
+        Raises:
+            DBEventNotFoundError: If any of the events does not exist.
+        """
+        LOGGER.info("Getting event ID(s) %s from the database ...", ", ".join(event_ids))
 
         async with self._session_maker() as session:
             result = await session.execute(
@@ -85,235 +142,303 @@ class DatabaseClient:
                         b_iblock_element.detail_text_type,
                         b_iblock_element.tags
                     FROM b_iblock_element
-                    WHERE b_iblock_element.id = :event_id
+                    WHERE b_iblock_element.id IN :event_ids
                 """
-                ),
-                {"event_id": event_id},
+                ).bindparams(bindparam("event_ids", expanding=True)),
+                {"event_ids": [int(event_id) for event_id in event_ids]},
             )
-            row = result.mappings().fetchone()
+            events = {row["id"]: Event.model_validate(row) for row in result.mappings()}
 
-        if row is None:
-            raise DBEventNotFoundError(f"Event ID {event_id} not found")
+        missing = [event_id for event_id in event_ids if int(event_id) not in events]
+        if missing:
+            raise DBEventNotFoundError(f"Event ID(s) {', '.join(missing)} not found")
 
-        LOGGER.info("Finished getting event ID %s from the database", event_id)
+        LOGGER.info("Finished getting event ID(s) %s from the database", ", ".join(event_ids))
 
-        return Event.model_validate(row)
+        return [events[int(event_id)] for event_id in event_ids]
 
     @staticmethod
-    async def get_file_by_id(session: AsyncSession, file_id: int) -> File:
-        """Fetch a single file record from the database by its ID.
+    async def get_files_by_ids(session: AsyncSession, file_ids: list[int]) -> list[File]:
+        """Fetch file records from the database by their IDs in one query.
 
         Args:
             session: The active database session.
-            file_id: The numeric file ID.
+            file_ids: The numeric file IDs.
 
         Returns:
-            The matching File instance.
+            The matching File instances, in the order of *file_ids*.
         """
-        result = await session.execute(
-            text("SELECT * FROM b_file WHERE ID = :file_id"),
-            {"file_id": file_id},
-        )
-        row = result.mappings().fetchone()
+        files = await DatabaseClient.find_files(session, file_ids)
 
-        if not row:
-            raise FileNotFoundError(f"File ID {file_id} not found")
+        missing = [str(file_id) for file_id in file_ids if file_id not in files]
+        if missing:
+            raise FileNotFoundError(f"File ID(s) {', '.join(missing)} not found")
 
-        return File.model_validate(row)
+        return [files[file_id] for file_id in file_ids]
 
     @staticmethod
-    async def insert_file_copy(session: AsyncSession, original_id: int, new_subdir: str) -> int:
-        """Insert a copy of a b_file record pointing to a new subdirectory.
+    async def find_files(session: AsyncSession, file_ids: Collection[int]) -> dict[int, File]:
+        """Fetch the file records that exist among *file_ids* in one query.
 
         Args:
             session: The active database session.
-            original_id: The ID of the source file record to copy.
-            new_subdir: The subdirectory path for the new file record.
+            file_ids: The numeric file IDs.
 
         Returns:
-            The ID of the newly inserted file record.
+            The found File instances by ID; missing IDs are left out.
         """
-        await session.execute(
+        if not file_ids:
+            return {}
+
+        result = await session.execute(
+            text("SELECT * FROM b_file WHERE ID IN :file_ids").bindparams(
+                bindparam("file_ids", expanding=True)
+            ),
+            {"file_ids": list(set(file_ids))},
+        )
+        return {file.id: file for file in map(File.model_validate, result.mappings())}
+
+    @staticmethod
+    async def insert_file_copies(
+        session: AsyncSession, copies: list[tuple[int, str]]
+    ) -> list[int]:
+        """Insert copies of b_file records pointing to new subdirectories.
+
+        All records are copied by one ``INSERT ... SELECT``; their new IDs are
+        then looked up by their (unique) subdirectories.
+
+        Args:
+            session: The active database session.
+            copies: Pairs of (ID of the source file record, subdirectory path for
+                the new file record).  Every subdirectory must be unique.
+
+        Returns:
+            The IDs of the newly inserted file records, in the order of *copies*.
+        """
+        if not copies:
+            return []
+
+        sources = " UNION ALL ".join(
+            f"SELECT :original_id{i} AS id, :subdir{i} AS subdir" for i in range(len(copies))
+        )
+        params: dict[str, int | str] = {}
+        for i, (original_id, new_subdir) in enumerate(copies):
+            params[f"original_id{i}"] = original_id
+            params[f"subdir{i}"] = new_subdir
+
+        result = await session.execute(
             text(
-                """
+                f"""
                 INSERT INTO b_file (
                     timestamp_x, module_id, height, width, file_size, content_type,
                     subdir, file_name, original_name, description, handler_id, external_id
                 )
                 SELECT
-                    timestamp_x, module_id, height, width, file_size, content_type,
-                    :subdir, file_name, original_name, description, handler_id, external_id
-                FROM b_file
-                WHERE id = :original_id
+                    f.timestamp_x, f.module_id, f.height, f.width, f.file_size, f.content_type,
+                    c.subdir, f.file_name, f.original_name, f.description, f.handler_id,
+                    f.external_id
+                FROM ({sources}) AS c
+                JOIN b_file AS f ON f.id = c.id
             """
             ),
-            {"subdir": new_subdir, "original_id": original_id},
+            params,
         )
-        return await DatabaseClient._get_last_insert_id(session)
+        first_id = DatabaseClient._lastrowid(result)
+
+        subdirs = [new_subdir for _, new_subdir in copies]
+        result = await session.execute(
+            text(
+                "SELECT id, subdir FROM b_file WHERE id >= :first_id AND subdir IN :subdirs"
+            ).bindparams(bindparam("subdirs", expanding=True)),
+            {"first_id": first_id, "subdirs": subdirs},
+        )
+        new_ids = {subdir: file_id for file_id, subdir in result.all()}
+
+        return [new_ids[subdir] for subdir in subdirs]
 
     @staticmethod
-    async def insert_pin(session: AsyncSession, event: Event, preview_picture_id: int) -> int:
-        """Insert a new pin element linked to an event.
+    async def insert_pins(
+        session: AsyncSession, events: list[Event], preview_picture_ids: list[int]
+    ) -> list[int]:
+        """Insert new pin elements linked to events with one multi-row INSERT.
+
+        Every pin is temporarily tagged with a unique ``xml_id`` to find its ID;
+        call ``set_xml_ids`` on the returned IDs afterwards.
 
         Args:
             session: The active database session.
-            event: The source event to create a pin for.
-            preview_picture_id: The file ID to use as the pin's preview picture.
+            events: The source events to create pins for.
+            preview_picture_ids: The file IDs to use as the pins' preview pictures,
+                in the order of *events*.
 
         Returns:
-            The ID of the newly inserted pin element.
+            The IDs of the newly inserted pin elements, in the order of *events*.
         """
+        if not events:
+            return []
+
         now = datetime.now(tz=None).strftime(const.DATETIME_FORMAT)
-        active_to = (event.active_to - timedelta(hours=1)).strftime(const.DATETIME_FORMAT)
+        tags = [uuid4().hex for _ in events]
 
-        await session.execute(
+        values = ",\n".join(
+            f"""(
+                    :now, :user, :now, :user,
+                    :iblock_id, 'Y', :active_from{i}, :active_to{i},
+                    :sort, :name{i}, :preview_picture{i}, :searchable_content{i}, 0, :tag{i}
+                )"""
+            for i in range(len(events))
+        )
+        params: dict[str, object] = {
+            "now": now,
+            "user": const.DEFAULT_USER_ID,
+            "iblock_id": const.PIN_IBLOCK_ID,
+            "sort": const.PIN_DEFAULT_SORT,
+        }
+        for i, (event, preview_picture_id, tag) in enumerate(
+            zip(events, preview_picture_ids, tags)
+        ):
+            active_to = event.active_to - timedelta(hours=1)
+            params[f"active_from{i}"] = str(event.active_from)
+            params[f"active_to{i}"] = active_to.strftime(const.DATETIME_FORMAT)
+            params[f"name{i}"] = event.name
+            params[f"preview_picture{i}"] = preview_picture_id
+            params[f"searchable_content{i}"] = event.name.upper()
+            params[f"tag{i}"] = tag
+
+        result = await session.execute(
             text(
-                """
+                f"""
                 INSERT INTO b_iblock_element (
                     timestamp_x, modified_by, date_create, created_by,
                     iblock_id, active, active_from, active_to,
-                    sort, name, preview_picture, searchable_content, tmp_id
-                )
-                VALUES (
-                    :now, :user, :now, :user,
-                    :iblock_id, 'Y', :active_from, :active_to,
-                    :sort, :name, :preview_picture, :searchable_content, 0
+                    sort, name, preview_picture, searchable_content, tmp_id, xml_id
                 )
+                VALUES
+                    {values}
             """
             ),
-            {
-                "now": now,
-                "user": const.DEFAULT_USER_ID,
-                "iblock_id": const.PIN_IBLOCK_ID,
-                "active_from": str(event.active_from),
-                "active_to": active_to,
-                "sort": const.PIN_DEFAULT_SORT,
-                "name": event.name,
-                "preview_picture": preview_picture_id,
-                "searchable_content": event.name.upper(),
-            },
+            params,
+        )
+        first_id = DatabaseClient._lastrowid(result)
+
+        # The IDs of a multi-row INSERT are not necessarily consecutive
+        # (e.g. with innodb_autoinc_lock_mode=2 or auto_increment_increment > 1).
+        result = await session.execute(
+            text(
+                "SELECT id, xml_id FROM b_iblock_element WHERE id >= :first_id AND xml_id IN :tags"
+            ).bindparams(bindparam("tags", expanding=True)),
+            {"first_id": first_id, "tags": tags},
         )
-        return await DatabaseClient._get_last_insert_id(session)
+        new_ids = {tag: element_id for element_id, tag in result.all()}
+        return [new_ids[tag] for tag in tags]
 
     @staticmethod
-    async def set_pin_properties(session: AsyncSession, event: Event, pin_id: int) -> None:
+    def set_pin_properties(writer: "PropertyWriter", event: Event, pin_id: int) -> None:
         """Set the link, button text, and name properties on a pin element.
 
+        The rows are buffered in *writer*; they are written on its next flush.
+
         Args:
-            session: The active database session.
+            writer: The property writer of the active session.
             event: The source event whose data is used to populate the properties.
             pin_id: The ID of the pin element to update.
         """
-        await session.execute(
-            text("UPDATE b_iblock_element SET xml_id = :pin_id WHERE id = :pin_id"),
-            {"pin_id": pin_id},
-        )
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value, value_type, value_num)
-                VALUES
-                    (:link_prop_id,  :pin_id, :url,        'text', 0.0000),
-                    (:btn_prop_id,   :pin_id, 'Подробнее', 'text', 0.0000),
-                    (:name_prop_id,  :pin_id, :name,       'text', 0.0000)
-            """
-            ),
-            {
-                "link_prop_id": const.PIN_LINK_PROPERTY_ID,
-                "btn_prop_id": const.PIN_BUTTON_TEXT_PROPERTY_ID,
-                "name_prop_id": const.PIN_NAME_PROPERTY_ID,
-                "pin_id": pin_id,
-                "url": event.url,
-                "name": event.name,
-            },
-        )
+        writer.add(const.PIN_LINK_PROPERTY_ID, pin_id, event.url)
+        writer.add(const.PIN_BUTTON_TEXT_PROPERTY_ID, pin_id, "Подробнее")
+        writer.add(const.PIN_NAME_PROPERTY_ID, pin_id, event.name)
 
     @staticmethod
-    async def insert_event_copy(
+    async def insert_event_copies(
         session: AsyncSession,
         event: Event,
-        preview_picture_id: int,
-        detail_picture_id: int,
-        new_event_date: datetime,
-        new_event_time: str,
-    ) -> int:
-        """Insert a copy of an event element with a new date and time.
+        copies: list[EventCopy],
+    ) -> list[int]:
+        """Insert copies of an event element, each with its own date and time.
+
+        The element rows are cloned from the source row inside the database by
+        one ``INSERT ... SELECT`` that only overrides the dates, pictures, and
+        timestamps, and so are their ``b_search_content`` rows: the texts of
+        the event are never sent back to the server.  Stripping the HTML for the
+        search index uses ``REGEXP_REPLACE`` (MySQL 8.0+ or MariaDB 10.0.5+).
+
+        Every clone is temporarily tagged with a unique ``xml_id`` to find its
+        ID; call ``set_xml_ids`` on the returned IDs afterwards.
 
         Args:
             session: The active database session.
             event: The source event to copy.
-            preview_picture_id: The file ID to use as the new event's preview picture.
-            detail_picture_id: The file ID to use as the new event's detail picture.
-            new_event_date: The date of the new event.
-            new_event_time: The time of the new event in HH-MM format.
+            copies: The dates, times, and picture file IDs of the new events.
 
         Returns:
-            The ID of the newly inserted event element.
+            The IDs of the newly inserted event elements, in the order of *copies*.
         """
+        if not copies:
+            return []
+
         now = datetime.now(tz=None).strftime(const.DATETIME_FORMAT)
-        hours, minutes = new_event_time.split("-")
-        active_from = now
-        active_to = (
-            new_event_date + timedelta(hours=int(hours) + 1, minutes=int(minutes))
-        ).strftime(const.DATETIME_FORMAT)
-
-        def _strip_html(s: str | None) -> str:
-            return re.sub(r"<[^>]+>", " ", s or "")
-
-        searchable_content = " ".join(
-            filter(
-                None,
-                [
-                    event.name,
-                    _strip_html(event.preview_text),
-                    _strip_html(event.detail_text),
-                ],
-            )
-        ).upper()
+        tags = [uuid4().hex for _ in copies]
 
-        await session.execute(
+        sources = " UNION ALL ".join(
+            f"SELECT :n{i} AS n, :tag{i} AS tag, :active_to{i} AS active_to, "
+            f":preview_picture{i} AS preview_picture, :detail_picture{i} AS detail_picture"
+            for i in range(len(copies))
+        )
+        params: dict[str, object] = {
+            "now": now,
+            "user": const.DEFAULT_USER_ID,
+            "iblock_id": const.EVENT_IBLOCK_ID,
+            "sort": const.EVENT_DEFAULT_SORT,
+            "event_id": event.id,
+        }
+        for i, (copy, tag) in enumerate(zip(copies, tags)):
+            params[f"n{i}"] = i
+            params[f"tag{i}"] = tag
+            params[f"active_to{i}"] = copy.active_to.strftime(const.DATETIME_FORMAT)
+            params[f"preview_picture{i}"] = copy.preview_picture_id
+            params[f"detail_picture{i}"] = copy.detail_picture_id
+
+        result = await session.execute(
             text(
-                """
+                f"""
                 INSERT INTO b_iblock_element (
                     timestamp_x, modified_by, date_create, created_by,
                     iblock_id, iblock_section_id, active, active_from, active_to,
                     sort, name, preview_picture, preview_text, preview_text_type,
                     detail_picture, detail_text, detail_text_type,
-                    searchable_content, tags, tmp_id, code
+                    searchable_content, tags, tmp_id, code, xml_id
                 )
-                VALUES (
+                SELECT
                     :now, :user, :now, :user,
-                    :iblock_id, NULL, 'Y', :active_from, :active_to,
-                    :sort, :name, :preview_picture, :preview_text, :preview_text_type,
-                    :detail_picture, :detail_text, :detail_text_type,
-                    :searchable_content, :tags, 0, ''
-                )
+                    :iblock_id, NULL, 'Y', :now, c.active_to,
+                    :sort, e.name, c.preview_picture, e.preview_text, e.preview_text_type,
+                    c.detail_picture, e.detail_text, e.detail_text_type,
+                    UPPER(CONCAT_WS(
+                        ' ',
+                        e.name,
+                        NULLIF(REGEXP_REPLACE(e.preview_text, '<[^>]+>', ' '), ''),
+                        NULLIF(REGEXP_REPLACE(e.detail_text, '<[^>]+>', ' '), '')
+                    )),
+                    e.tags, 0, '', c.tag
+                FROM ({sources}) AS c
+                JOIN b_iblock_element AS e ON e.id = :event_id
+                ORDER BY c.n
             """
             ),
-            {
-                "now": now,
-                "user": const.DEFAULT_USER_ID,
-                "iblock_id": const.EVENT_IBLOCK_ID,
-                "active_from": active_from,
-                "active_to": active_to,
-                "sort": const.EVENT_DEFAULT_SORT,
-                "name": event.name,
-                "preview_picture": preview_picture_id,
-                "preview_text": event.preview_text,
-                "preview_text_type": event.preview_text_type,
-                "detail_picture": detail_picture_id,
-                "detail_text": event.detail_text,
-                "detail_text_type": event.detail_text_type,
-                "searchable_content": searchable_content,
-                "tags": event.tags,
-            },
+            params,
+        )
+        first_id = DatabaseClient._lastrowid(result)
+
+        result = await session.execute(
+            text(
+                "SELECT id, xml_id FROM b_iblock_element WHERE id >= :first_id AND xml_id IN :tags"
+            ).bindparams(bindparam("tags", expanding=True)),
+            {"first_id": first_id, "tags": tags},
         )
-        new_event_id = await DatabaseClient._get_last_insert_id(session)
+        new_ids = {tag: element_id for element_id, tag in result.all()}
+        new_event_ids = [new_ids[tag] for tag in tags]
 
-        # Insert b_search_content so the calendar filter picks up the new event
-        url = (
-            f"=ID={new_event_id}&EXTERNAL_ID={new_event_id}"
+        # Insert b_search_content so the calendar filter picks up the new events
+        url_suffix = (
             f"&IBLOCK_SECTION_ID={const.EVENT_IBLOCK_SECTION_ID}"
             f"&IBLOCK_TYPE_ID={const.EVENT_IBLOCK_TYPE_ID}"
             f"&IBLOCK_ID={const.EVENT_IBLOCK_ID}"
@@ -321,15 +446,6 @@ class DatabaseClient:
             f"&IBLOCK_EXTERNAL_ID={const.EVENT_IBLOCK_EXTERNAL_ID}"
             f"&CODE="
         )
-        body = " ".join(
-            filter(
-                None,
-                [
-                    _strip_html(event.preview_text),
-                    _strip_html(event.detail_text),
-                ],
-            )
-        )
         await session.execute(
             text(
                 """
@@ -338,175 +454,309 @@ class DatabaseClient:
                     url, title, body, tags, param1, param2,
                     date_from, date_to
                 )
-                VALUES (
-                    :now, 'iblock', :item_id, 0,
-                    :url, :title, :body, :tags, :param1, :param2,
-                    :date_from, :date_to
-                )
+                SELECT
+                    :now, 'iblock', e.id, 0,
+                    CONCAT('=ID=', e.id, '&EXTERNAL_ID=', e.id, :url_suffix), e.name,
+                    CONCAT_WS(
+                        ' ',
+                        NULLIF(REGEXP_REPLACE(e.preview_text, '<[^>]+>', ' '), ''),
+                        NULLIF(REGEXP_REPLACE(e.detail_text, '<[^>]+>', ' '), '')
+                    ),
+                    e.tags, :param1, :param2,
+                    e.active_from, e.active_to
+                FROM b_iblock_element AS e
+                WHERE e.id IN :new_event_ids
             """
-            ),
+            ).bindparams(bindparam("new_event_ids", expanding=True)),
             {
                 "now": now,
-                "item_id": str(new_event_id),
-                "url": url,
-                "title": event.name,
-                "body": body,
-                "tags": event.tags,
+                "url_suffix": url_suffix,
                 "param1": const.EVENT_IBLOCK_TYPE_ID,
                 "param2": str(const.EVENT_IBLOCK_ID),
-                "date_from": active_from,
-                "date_to": active_to,
+                "new_event_ids": new_event_ids,
             },
         )
 
-        return new_event_id
+        return new_event_ids
 
     @staticmethod
-    async def set_event_properties(
-        session: AsyncSession,
-        old_event: Event,
-        new_event_id: int,
-        new_event_date: datetime,
-        new_event_time: str,
-        new_event_price: str | None,
-    ) -> None:
-        """Copy properties from a source event to a new event and update date, time, and price.
+    async def get_element_properties(session: AsyncSession, element_id: int) -> list[dict]:
+        """Fetch all property rows of an iblock element.
 
         Args:
             session: The active database session.
-            old_event: The source event whose properties are copied.
-            new_event_id: The ID of the newly created event to write properties to.
-            new_event_date: The date to set on the new event's date property.
-            new_event_time: The time in HH-MM format to set on the new event's time property.
-            new_event_price: The price to set, or None to leave the copied value unchanged.
+            element_id: The ID of the element.
+
+        Returns:
+            A list of dicts with the ``iblock_property_id``, ``value``, ``value_type``,
+            ``value_enum``, ``value_num`` and ``description`` of each row.
         """
-        await session.execute(
-            text("UPDATE b_iblock_element SET xml_id = :new_id WHERE id = :new_id"),
-            {"new_id": new_event_id},
-        )
-        await session.execute(
+        result = await session.execute(
             text(
                 """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value, value_type, value_enum, value_num, description)
-                SELECT iblock_property_id, :new_id, value, value_type, value_enum, value_num, description
+                SELECT iblock_property_id, value, value_type, value_enum, value_num, description
                 FROM b_iblock_element_property
-                WHERE iblock_element_id = :old_id
-            """
-            ),
-            {"new_id": new_event_id, "old_id": old_event.id},
-        )
-        await session.execute(
-            text(
-                """
-                UPDATE b_iblock_element_property
-                SET value = :time_value
-                WHERE iblock_element_id = :event_id
-                  AND iblock_property_id = :prop_id
-            """
-            ),
-            {
-                "time_value": new_event_time.replace("-", ":"),
-                "event_id": new_event_id,
-                "prop_id": const.EVENT_TIME_PROPERTY_ID,
-            },
-        )
-        await session.execute(
-            text(
-                """
-                UPDATE b_iblock_element_property
-                SET value = :date_value
-                WHERE iblock_element_id = :event_id
-                  AND iblock_property_id = :prop_id
+                WHERE iblock_element_id = :element_id
+                ORDER BY id
             """
             ),
-            {
-                "date_value": new_event_date.strftime(const.DATETIME_FORMAT),
-                "event_id": new_event_id,
-                "prop_id": const.EVENT_DATE_PROPERTY_ID,
-            },
+            {"element_id": element_id},
         )
-        if new_event_price is not None:
-            await session.execute(
-                text(
-                    """
-                    UPDATE b_iblock_element_property
-                    SET value = :price
-                    WHERE iblock_element_id = :event_id
-                      AND iblock_property_id = :prop_id
-                """
-                ),
-                {
-                    "price": new_event_price,
-                    "event_id": new_event_id,
-                    "prop_id": const.EVENT_PRICE_PROPERTY_ID,
-                },
+        return [dict(row) for row in result.mappings()]
+
+    @staticmethod
+    def set_event_properties(
+        writer: "PropertyWriter",
+        old_properties: list[dict],
+        new_event_id: int,
+        copy: EventCopy,
+    ) -> None:
+        """Copy the properties of a source event to a new event, with a new date, time, and price.
+
+        The rows are buffered in *writer*; they are written on its next flush.
+
+        Args:
+            writer: The property writer of the active session.
+            old_properties: The property rows of the source event, as returned by
+                ``get_element_properties``.
+            new_event_id: The ID of the newly created event to write properties to.
+            copy: The date, time, and price of the new event.
+        """
+        new_values = {
+            const.EVENT_TIME_PROPERTY_ID: copy.time.replace("-", ":"),
+            const.EVENT_DATE_PROPERTY_ID: copy.date.strftime(const.DATETIME_FORMAT),
+        }
+        if copy.price is not None:
+            new_values[const.EVENT_PRICE_PROPERTY_ID] = copy.price
+
+        for prop in old_properties:
+            property_id = prop["iblock_property_id"]
+            writer.add(
+                property_id,
+                new_event_id,
+                new_values.get(property_id, prop["value"]),
+                value_type=prop["value_type"],
+                value_enum=prop["value_enum"],
+                value_num=prop["value_num"],
+                description=prop["description"],
             )
 
     @staticmethod
-    async def add_element_to_section(
-        session: AsyncSession, element_id: int, section_id: int
+    async def add_elements_to_section(
+        session: AsyncSession, element_ids: list[int], section_id: int
     ) -> None:
-        """Add an iblock element to a section.
+        """Add iblock elements to a section with one multi-row INSERT.
 
         Args:
             session: The active database session.
-            element_id: The ID of the element to add.
-            section_id: The ID of the section to add the element to.
+            element_ids: The IDs of the elements to add.
+            section_id: The ID of the section to add the elements to.
         """
+        if not element_ids:
+            return
+
+        values = ", ".join(f"(:section_id, :element_id{i}, NULL)" for i in range(len(element_ids)))
         await session.execute(
             text(
-                """
+                f"""
                 INSERT INTO b_iblock_section_element
                     (iblock_section_id, iblock_element_id, additional_property_id)
-                VALUES (:section_id, :element_id, NULL)
+                VALUES {values}
             """
             ),
-            {"section_id": section_id, "element_id": element_id},
+            {
+                "section_id": section_id,
+                **{f"element_id{i}": element_id for i, element_id in enumerate(element_ids)},
+            },
         )
 
     async def export_statistics(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: datetime, end_date: datetime, skip: Collection[str] = ()
     ) -> list[dict[str, int]]:
         """Query activity statistics for a given date range.
 
+        Every source table is counted by its own range query, and the queries run
+        concurrently.  Sources with no activity in the range are omitted.
+
         Args:
             start_date: The start of the reporting period (inclusive).
             end_date: The end of the reporting period (exclusive).
+            skip: The ``what`` labels of the sources not to count.
 
         Returns:
             A list of dicts, each with a ``what`` label and a ``cnt`` count.
         """
         LOGGER.info("Exporting monthly statistics from %s to %s ...", start_date, end_date)
 
-        query = """
-            SELECT whats.what, COUNT(*) AS cnt
-            FROM (
-                SELECT '02 files'          AS what, b_file.TIMESTAMP_X           AS timestamp FROM b_file
-                UNION ALL
-                SELECT '04 search changes' AS what, b_search_content.DATE_CHANGE  AS timestamp FROM b_search_content
-                UNION ALL
-                SELECT '01 added'          AS what, b_iblock_element.DATE_CREATE  AS timestamp FROM b_iblock_element
-                UNION ALL
-                SELECT '03 updated'        AS what, b_iblock_element.TIMESTAMP_X  AS timestamp FROM b_iblock_element
-            ) AS whats
-            WHERE whats.timestamp BETWEEN :start_date AND :end_date
-            GROUP BY whats.what
-            ORDER BY whats.what
+        # One range count per source table, each on its own pooled connection
+        counts = await asyncio.gather(
+            *(
+                self._query(query, params)
+                for query, params in self._statistics_queries(start_date, end_date, skip)
+            )
+        )
+        statistics = [row for rows in counts for row in rows if row["cnt"]]
+
+        LOGGER.info("Finished exporting monthly statistics from %s to %s", start_date, end_date)
+        LOGGER.info(statistics)
+
+        return statistics
+
+    async def export_statistics_breakdown(
+        self, start_date: datetime, end_date: datetime, granularity: Granularity
+    ) -> list[dict[str, int | str]]:
+        """Query activity statistics for a date range, broken down into periods.
+
+        Every source table is read by one grouped range query, whatever the
+        number of periods, and the queries run concurrently.
+
+        Args:
+            start_date: The start of the reporting period (inclusive).
+            end_date: The end of the reporting period (exclusive).
+            granularity: The size of the periods.
+
+        Returns:
+            A list of dicts with ``what``, ``bucket`` (the period label, e.g.
+            ``2025-01``, ``2025-W01`` or ``2025-01-31``) and ``cnt`` keys; periods
+            without activity are omitted.
         """
+        LOGGER.info(
+            "Exporting %s statistics from %s to %s ...", granularity.value, start_date, end_date
+        )
+
+        counts = await asyncio.gather(
+            *(
+                self._query(query, params)
+                for query, params in self._breakdown_queries(start_date, end_date, granularity)
+            )
+        )
+        statistics = [row for rows in counts for row in rows]
 
-        statistics = await self._query(
-            query,
+        LOGGER.info(
+            "Finished exporting %s statistics from %s to %s",
+            granularity.value,
+            start_date,
+            end_date,
+        )
+
+        return statistics
+
+    async def explain_statistics(
+        self, start_date: datetime, end_date: datetime, granularity: Granularity | None = None
+    ) -> dict[str, list[dict]]:
+        """Return the MySQL query plans of the statistics queries.
+
+        Args:
+            start_date: The start of the reporting period (inclusive).
+            end_date: The end of the reporting period (exclusive).
+            granularity: Explain the ``export_statistics_breakdown`` queries for
+                this granularity instead of the ``export_statistics`` ones.
+
+        Returns:
+            A mapping of each ``what`` label to the ``EXPLAIN`` rows of its query.
+        """
+        if granularity is None:
+            queries = self._statistics_queries(start_date, end_date)
+        else:
+            queries = self._breakdown_queries(start_date, end_date, granularity)
+        plans = await asyncio.gather(
+            *(self._query(f"EXPLAIN {query}", params) for query, params in queries)
+        )
+        return dict(zip(_STATISTICS_SOURCES, plans))
+
+    async def count_statistics_since(
+        self,
+        what: str,
+        start_date: datetime,
+        end_date: datetime,
+        after_id: int | None = None,
+    ) -> StatisticsCount:
+        """Count the activity of one statistics source from a high-water mark on.
+
+        Rows are told apart by their (auto-increment) ID rather than their
+        timestamp, so a row inserted with an older timestamp in the period (e.g.
+        a file record copy) is still counted.
+
+        Args:
+            what: The ``what`` label of the source.
+            start_date: The start of the reporting period (inclusive).
+            end_date: The end of the reporting period (exclusive).
+            after_id: Only count rows with a greater ID than this mark.
+
+        Returns:
+            The count of matching rows and their highest ID.
+        """
+        table, column = _STATISTICS_SOURCES[what]
+
+        (row,) = await self._query(
+            f"""
+                SELECT COUNT(*) AS cnt, MAX(id) AS last_id
+                FROM {table}
+                WHERE id > :after_id AND {column} >= :start_date AND {column} < :end_date
+            """,
             {
+                "after_id": after_id or 0,
                 "start_date": start_date.strftime("%Y-%m-%d"),
                 "end_date": end_date.strftime("%Y-%m-%d"),
             },
         )
+        return StatisticsCount(what=what, cnt=row["cnt"], last_id=row["last_id"])
 
-        LOGGER.info("Finished exporting monthly statistics from %s to %s", start_date, end_date)
-        LOGGER.info(statistics)
+    @staticmethod
+    def _statistics_queries(
+        start_date: datetime, end_date: datetime, skip: Collection[str] = ()
+    ) -> list[tuple[str, dict[str, str]]]:
+        """Build one range-count query per statistics source.
+
+        Each query filters the source column directly, so MySQL can use an index
+        on it instead of scanning the whole table.  The range is half-open, like
+        that of the breakdown queries, so that a row at midnight on the first
+        day of the next month is not counted in both months.
+        """
+        queries = []
+        for what, (table, column) in _STATISTICS_SOURCES.items():
+            if what in skip:
+                continue
+            query = f"""
+                SELECT :what AS what, COUNT(*) AS cnt
+                FROM {table}
+                WHERE {column} >= :start_date AND {column} < :end_date
+            """
+            params = {
+                "what": what,
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+            }
+            queries.append((query, params))
+        return queries
 
-        return statistics
+    @staticmethod
+    def _breakdown_queries(
+        start_date: datetime, end_date: datetime, granularity: Granularity
+    ) -> list[tuple[str, dict[str, str]]]:
+        """Build one grouped range-count query per statistics source.
+
+        The range is half-open, so that a row on the boundary between two
+        periods is only counted once.
+        """
+        queries = []
+        for what, (table, column) in _STATISTICS_SOURCES.items():
+            query = f"""
+                SELECT :what AS what, DATE_FORMAT({column}, :bucket_format) AS bucket,
+                       COUNT(*) AS cnt
+                FROM {table}
+                WHERE {column} >= :start_date AND {column} < :end_date
+                GROUP BY bucket
+                ORDER BY bucket
+            """
+            params = {
+                "what": what,
+                "bucket_format": _BUCKET_FORMATS[granularity],
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+            }
+            queries.append((query, params))
+        return queries
 
     @staticmethod
     async def insert_chronograph_section(session: AsyncSession, section_name: str) -> None:
@@ -571,13 +821,19 @@ class DatabaseClient:
         session: AsyncSession,
         source_section_id: int,
         destination_section_id: int,
-    ) -> None:
+    ) -> ChronographCopyResult:
         """Copy all elements from a source chronograph section into a destination section.
 
+        Runs a fixed number of set-based statements, however many elements the
+        section holds.
+
         Args:
             session: The active database session.
             source_section_id: The ID of the section to copy elements from.
             destination_section_id: The ID of the section to copy elements into.
+
+        Returns:
+            The number of rows changed by each step.
         """
         LOGGER.info(
             "Copying chronograph section %s into %s ...",
@@ -585,7 +841,7 @@ class DatabaseClient:
             destination_section_id,
         )
 
-        await session.execute(
+        moved = await session.execute(
             text(
                 """
                 UPDATE b_iblock_element
@@ -605,7 +861,7 @@ class DatabaseClient:
                 "user": const.DEFAULT_USER_ID,
             },
         )
-        await session.execute(
+        linked = await session.execute(
             text(
                 """
                 INSERT INTO b_iblock_section_element
@@ -617,45 +873,41 @@ class DatabaseClient:
             ),
             {"dest_id": destination_section_id},
         )
-
-        for element_id in await DatabaseClient._get_affected_elements(
-            session, destination_section_id
-        ):
-            await session.execute(
-                text(
-                    """
-                    UPDATE b_iblock_element_property
-                    SET value = value + :year_offset
-                    WHERE iblock_element_id = :element_id
-                      AND iblock_property_id = :prop_id
+        shifted = await session.execute(
+            text(
                 """
-                ),
-                {
-                    "year_offset": const.CHRONOGRAPH_YEAR_OFFSET,
-                    "element_id": element_id,
-                    "prop_id": const.CHRONOGRAPH_YEAR_PROPERTY_ID,
-                },
-            )
+                UPDATE b_iblock_element_property AS p
+                JOIN b_iblock_element AS e ON e.id = p.iblock_element_id
+                SET p.value = p.value + :year_offset
+                WHERE e.iblock_section_id = :dest_id
+                  AND p.iblock_property_id = :prop_id
+            """
+            ),
+            {
+                "year_offset": const.CHRONOGRAPH_YEAR_OFFSET,
+                "dest_id": destination_section_id,
+                "prop_id": const.CHRONOGRAPH_YEAR_PROPERTY_ID,
+            },
+        )
 
         await session.execute(
             text("UPDATE b_iblock_section SET active = 'N' WHERE id = :src_id"),
             {"src_id": source_section_id},
         )
 
+        copy_result = ChronographCopyResult(
+            elements_moved=DatabaseClient._rowcount(moved),
+            section_links_added=DatabaseClient._rowcount(linked),
+            years_shifted=DatabaseClient._rowcount(shifted),
+        )
+
         LOGGER.info(
-            "Finished copying chronograph section %s into %s",
+            "Finished copying chronograph section %s into %s (%s)",
             source_section_id,
             destination_section_id,
+            copy_result,
         )
-
-    @staticmethod
-    async def _get_affected_elements(session: AsyncSession, section_id: int) -> list[int]:
-        """Get element IDs within a section (uses the provided session to see uncommitted rows)."""
-        result = await session.execute(
-            text("SELECT id FROM b_iblock_element WHERE iblock_section_id = :section_id"),
-            {"section_id": section_id},
-        )
-        return [row[0] for row in result.all()]
+        return copy_result
 
     @staticmethod
     async def insert_new_file(
@@ -681,7 +933,7 @@ class DatabaseClient:
         Returns:
             The ID of the newly inserted file record.
         """
-        await session.execute(
+        result = await session.execute(
             text(
                 """
                 INSERT INTO b_file (
@@ -704,7 +956,7 @@ class DatabaseClient:
                 "file_name": filename,
             },
         )
-        return await DatabaseClient._get_last_insert_id(session)
+        return DatabaseClient._lastrowid(result)
 
     @staticmethod
     async def insert_book_section(session: AsyncSession, section_name: str) -> int:
@@ -717,7 +969,7 @@ class DatabaseClient:
         Returns:
             The ID of the newly inserted section.
         """
-        await session.execute(
+        result = await session.execute(
             text(
                 """
                 INSERT INTO b_iblock_section (
@@ -741,7 +993,7 @@ class DatabaseClient:
                 "searchable_content": section_name.upper(),
             },
         )
-        return await DatabaseClient._get_last_insert_id(session)
+        return DatabaseClient._lastrowid(result)
 
     @staticmethod
     async def insert_exhibition_element(
@@ -768,7 +1020,7 @@ class DatabaseClient:
             The ID of the newly inserted element.
         """
         active_from_str = active_from.strftime(const.DATETIME_FORMAT)
-        await session.execute(
+        result = await session.execute(
             text(
                 """
                 INSERT INTO b_iblock_element (
@@ -799,12 +1051,7 @@ class DatabaseClient:
                 "searchable_content": title.upper(),
             },
         )
-        element_id = await DatabaseClient._get_last_insert_id(session)
-        await session.execute(
-            text("UPDATE b_iblock_element SET xml_id = :id WHERE id = :id"),
-            {"id": element_id},
-        )
-        return element_id
+        return DatabaseClient._lastrowid(result)
 
     @staticmethod
     async def insert_book_element(
@@ -835,7 +1082,7 @@ class DatabaseClient:
             The ID of the newly inserted element.
         """
         active_from_str = active_from.strftime(const.DATETIME_FORMAT)
-        await session.execute(
+        result = await session.execute(
             text(
                 """
                 INSERT INTO b_iblock_element (
@@ -867,11 +1114,7 @@ class DatabaseClient:
                 "searchable_content": title.upper(),
             },
         )
-        element_id = await DatabaseClient._get_last_insert_id(session)
-        await session.execute(
-            text("UPDATE b_iblock_element SET xml_id = :id WHERE id = :id"),
-            {"id": element_id},
-        )
+        element_id = DatabaseClient._lastrowid(result)
         await session.execute(
             text(
                 """
@@ -885,49 +1128,38 @@ class DatabaseClient:
         return element_id
 
     @staticmethod
-    async def set_exhibition_properties(
-        session: AsyncSession,
+    def set_exhibition_properties(
+        writer: "PropertyWriter",
         element_id: int,
         section_id: int,
         active_from: datetime,
     ) -> None:
         """Set the section-link and date properties on an exhibition element.
 
+        The rows are buffered in *writer*; they are written on its next flush.
+
         Args:
-            session: The active database session.
+            writer: The property writer of the active session.
             element_id: The ID of the exhibition element.
             section_id: The ID of the linked book section.
             active_from: The activation datetime for the exhibition.
         """
-        date_value = active_from.strftime("%Y-%m-%d 00:00:00")
-        year_num = float(active_from.year)
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES
-                    (:prop_section, :id, :section_id,
-                     'text', NULL, :section_num, NULL),
-                    (:prop_date,    :id, :date_value,
-                     'text', NULL, :year_num,    NULL)
-            """
-            ),
-            {
-                "prop_section": const.EXHIBITION_SECTION_PROPERTY_ID,
-                "prop_date": const.EXHIBITION_DATE_PROPERTY_ID,
-                "id": element_id,
-                "section_id": str(section_id),
-                "section_num": float(section_id),
-                "date_value": date_value,
-                "year_num": year_num,
-            },
+        writer.add(
+            const.EXHIBITION_SECTION_PROPERTY_ID,
+            element_id,
+            str(section_id),
+            value_num=float(section_id),
+        )
+        writer.add(
+            const.EXHIBITION_DATE_PROPERTY_ID,
+            element_id,
+            active_from.strftime("%Y-%m-%d 00:00:00"),
+            value_num=float(active_from.year),
         )
 
     @staticmethod
-    async def set_book_properties(
-        session: AsyncSession,
+    def set_book_properties(
+        writer: "PropertyWriter",
         book_id: int,
         full_bib_text: str,
         author: str,
@@ -937,8 +1169,10 @@ class DatabaseClient:
     ) -> None:
         """Set bibliographic iblock properties on a book element.
 
+        The rows are buffered in *writer*; they are written on its next flush.
+
         Args:
-            session: The active database session.
+            writer: The property writer of the active session.
             book_id: The ID of the book element.
             full_bib_text: PHP-serialized full bib string (property 30).
             author: Author string (property 31).
@@ -947,40 +1181,62 @@ class DatabaseClient:
             year: Publication year string (property 59).
         """
         year_num = float(year) if year.isdigit() else 0.0
+        writer.add(const.BOOK_FULL_BIB_PROPERTY_ID, book_id, full_bib_text)
+        writer.add(const.BOOK_AUTHOR_PROPERTY_ID, book_id, author)
+        writer.add(const.BOOK_CITY_PROPERTY_ID, book_id, city)
+        writer.add(const.BOOK_PUBLISHER_PROPERTY_ID, book_id, publisher)
+        writer.add(const.BOOK_YEAR_PROPERTY_ID, book_id, year, value_num=year_num)
+
+    @staticmethod
+    def _rowcount(result: Result) -> int:
+        """Return the number of rows matched by the DML statement that produced *result*."""
+        return cast(CursorResult, result).rowcount
+
+    @staticmethod
+    def _lastrowid(result: Result) -> int:
+        """Return the auto-increment ID of the row inserted by *result*, without a round trip."""
+        return int(cast(CursorResult, result).lastrowid)
+
+    @staticmethod
+    async def set_xml_ids(session: AsyncSession, element_ids: list[int]) -> None:
+        """Set ``xml_id = id`` on the given iblock elements in a single UPDATE.
+
+        Insert helpers leave ``xml_id`` empty; callers collect the new element
+        IDs of a run and call this once before committing.
+
+        Args:
+            session: The active database session.
+            element_ids: The IDs of the newly inserted elements.
+        """
+        if not element_ids:
+            return
         await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value, value_type,
-                     value_enum, value_num, description)
-                VALUES
-                    (:prop30, :id, :full_bib,  'text', NULL, 0.0,       NULL),
-                    (:prop31, :id, :author,    'text', NULL, 0.0,       NULL),
-                    (:prop57, :id, :city,      'text', NULL, 0.0,       NULL),
-                    (:prop58, :id, :publisher, 'text', NULL, 0.0,       NULL),
-                    (:prop59, :id, :year,      'text', NULL, :year_num, NULL)
-            """
+            text("UPDATE b_iblock_element SET xml_id = id WHERE id IN :ids").bindparams(
+                bindparam("ids", expanding=True)
             ),
-            {
-                "prop30": const.BOOK_FULL_BIB_PROPERTY_ID,
-                "prop31": const.BOOK_AUTHOR_PROPERTY_ID,
-                "prop57": const.BOOK_CITY_PROPERTY_ID,
-                "prop58": const.BOOK_PUBLISHER_PROPERTY_ID,
-                "prop59": const.BOOK_YEAR_PROPERTY_ID,
-                "id": book_id,
-                "full_bib": full_bib_text,
-                "author": author,
-                "city": city,
-                "publisher": publisher,
-                "year": year,
-                "year_num": year_num,
-            },
+            {"ids": element_ids},
         )
 
     @staticmethod
-    async def _get_last_insert_id(session: AsyncSession) -> int:
-        result = await session.execute(text("SELECT LAST_INSERT_ID()"))
-        return int(result.scalar_one())
+    async def set_scp_keys(session: AsyncSession, property_ids: list[int]) -> None:
+        """Set ``description = 'scp_<id>'`` on virtual exhibition item name rows (prop 197).
+
+        The key of each item is derived from the ID of its own prop 197 row, so it
+        can only be written after the insert; this is done for all items at once.
+
+        Args:
+            session: The active database session.
+            property_ids: The prop 197 row IDs returned by ``insert_virtual_exhibition_items``.
+        """
+        if not property_ids:
+            return
+        await session.execute(
+            text(
+                "UPDATE b_iblock_element_property SET description = CONCAT('scp_', id) "
+                "WHERE id IN :ids"
+            ).bindparams(bindparam("ids", expanding=True)),
+            {"ids": property_ids},
+        )
 
     @staticmethod
     def generate_new_subdir() -> str:
@@ -1020,7 +1276,7 @@ class DatabaseClient:
         """
         active_from_str = active_from.strftime(const.DATETIME_FORMAT)
         active_to_str = active_to.strftime(const.DATETIME_FORMAT)
-        await session.execute(
+        result = await session.execute(
             text(
                 """
                 INSERT INTO b_iblock_element (
@@ -1053,16 +1309,11 @@ class DatabaseClient:
                 "searchable_content": title.upper(),
             },
         )
-        element_id = await DatabaseClient._get_last_insert_id(session)
-        await session.execute(
-            text("UPDATE b_iblock_element SET xml_id = :id WHERE id = :id"),
-            {"id": element_id},
-        )
-        return element_id
+        return DatabaseClient._lastrowid(result)
 
     @staticmethod
-    async def set_virtual_exhibition_properties(
-        session: AsyncSession,
+    def set_virtual_exhibition_properties(
+        writer: "PropertyWriter",
         element_id: int,
         subtitle: str,
         active_from: datetime,
@@ -1070,191 +1321,258 @@ class DatabaseClient:
     ) -> None:
         """Set fixed and date properties on a virtual exhibition element.
 
-        Inserts props 9 (type), 54 (active_from), 55 (active_to), 66 (sort=0),
-        196 (subtitle), and 213 (category link).
+        Adds props 9 (type), 54 (active_from), 55 (active_to), 66 (sort=0),
+        196 (subtitle), and 213 (category link).  The rows are buffered in
+        *writer*; they are written on its next flush.
 
         Args:
-            session: The active database session.
+            writer: The property writer of the active session.
             element_id: The ID of the virtual exhibition element.
             subtitle: The subtitle text (prop 196).
             active_from: The start date for props 54.
             active_to: The display end date for prop 55 (one day before element active_to).
         """
-        from_str = active_from.strftime("%Y-%m-%d 00:00:00")
-        to_str = active_to.strftime("%Y-%m-%d 00:00:00")
-        from_year = float(active_from.year)
-        to_year = float(active_to.year)
-
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES
-                    (:prop9,   :id, :val9,     'text', :enum9,   NULL,      NULL),
-                    (:prop54,  :id, :from_str, 'text', NULL,     :from_year, NULL),
-                    (:prop55,  :id, :to_str,   'text', NULL,     :to_year,   NULL),
-                    (:prop66,  :id, '0',       'text', NULL,     0.0,        NULL),
-                    (:prop196, :id, :subtitle, 'text', NULL,     0.0,        NULL),
-                    (:prop213, :id, :val213,   'text', :enum213, NULL,       NULL)
-            """
-            ),
-            {
-                "prop9": const.VIRTUAL_EXHIBITION_PROP_TYPE_ID,
-                "val9": str(const.VIRTUAL_EXHIBITION_PROP_TYPE_VALUE),
-                "enum9": const.VIRTUAL_EXHIBITION_PROP_TYPE_VALUE,
-                "prop54": const.VIRTUAL_EXHIBITION_PROP_ACTIVE_FROM_ID,
-                "from_str": from_str,
-                "from_year": from_year,
-                "prop55": const.VIRTUAL_EXHIBITION_PROP_ACTIVE_TO_ID,
-                "to_str": to_str,
-                "to_year": to_year,
-                "prop66": const.VIRTUAL_EXHIBITION_PROP_SORT_ID,
-                "prop196": const.VIRTUAL_EXHIBITION_PROP_SUBTITLE_ID,
-                "subtitle": subtitle,
-                "prop213": const.VIRTUAL_EXHIBITION_PROP_CATEGORY_ID,
-                "val213": str(const.VIRTUAL_EXHIBITION_PROP_CATEGORY_VALUE),
-                "enum213": const.VIRTUAL_EXHIBITION_PROP_CATEGORY_VALUE,
-                "id": element_id,
-            },
+        writer.add(
+            const.VIRTUAL_EXHIBITION_PROP_TYPE_ID,
+            element_id,
+            str(const.VIRTUAL_EXHIBITION_PROP_TYPE_VALUE),
+            value_enum=const.VIRTUAL_EXHIBITION_PROP_TYPE_VALUE,
+            value_num=None,
+        )
+        writer.add(
+            const.VIRTUAL_EXHIBITION_PROP_ACTIVE_FROM_ID,
+            element_id,
+            active_from.strftime("%Y-%m-%d 00:00:00"),
+            value_num=float(active_from.year),
+        )
+        writer.add(
+            const.VIRTUAL_EXHIBITION_PROP_ACTIVE_TO_ID,
+            element_id,
+            active_to.strftime("%Y-%m-%d 00:00:00"),
+            value_num=float(active_to.year),
+        )
+        writer.add(const.VIRTUAL_EXHIBITION_PROP_SORT_ID, element_id, "0")
+        writer.add(const.VIRTUAL_EXHIBITION_PROP_SUBTITLE_ID, element_id, subtitle)
+        writer.add(
+            const.VIRTUAL_EXHIBITION_PROP_CATEGORY_ID,
+            element_id,
+            str(const.VIRTUAL_EXHIBITION_PROP_CATEGORY_VALUE),
+            value_enum=const.VIRTUAL_EXHIBITION_PROP_CATEGORY_VALUE,
+            value_num=None,
         )
 
     @staticmethod
-    async def insert_virtual_exhibition_item(
-        session: AsyncSession,
+    async def insert_virtual_exhibition_items(
+        writer: "PropertyWriter",
         exhibition_id: int,
-        name: str,
-        bib_html: str,
-        description_html: str,
-        image_file_ids: list[int],
-    ) -> None:
-        """Insert all properties for one virtual exhibition item.
+        items: list[tuple[str, str, str, list[int]]],
+    ) -> list[int]:
+        """Insert all properties for the items of a virtual exhibition.
 
-        Inserts props 197 (name), 198 (bib), 199 (description), 200 (image file IDs),
-        and 205 (linking array), all sharing the same ``scp_<id>`` description key.
+        For every item, inserts props 197 (name), 198 (bib), 199 (description),
+        200 (image file IDs), and 205 (linking array), all sharing the same
+        ``scp_<id>`` description key.
 
-        The scp key is derived from the LAST_INSERT_ID after inserting prop 197.
+        The scp key is derived from the ID of the item's prop 197 row, so the rows
+        are written in phases: all 197 rows, then all 198/199/200 rows, whose IDs
+        feed the 205 linking arrays.  The 205 rows are left buffered in *writer*
+        for its next flush.  The 197 rows are inserted without a description;
+        pass the returned IDs to ``set_scp_keys``.
 
         Args:
-            session: The active database session.
+            writer: The property writer of the active session.
             exhibition_id: The ID of the parent virtual exhibition element.
-            name: The item title (prop 197).
-            bib_html: PHP-serialised bib HTML (prop 198).
-            description_html: PHP-serialised description HTML (prop 199).
-            image_file_ids: File IDs for the item images (prop 200, one row per image).
+            items: One ``(name, bib_html, description_html, image_file_ids)`` tuple
+                per item: the item title (prop 197), the PHP-serialised bib HTML
+                (prop 198), the PHP-serialised description HTML (prop 199), and the
+                file IDs of the item images (prop 200, one row per image).
+
+        Returns:
+            The IDs of the prop 197 rows, in item order.
         """
-        # Insert prop 197 (name) and derive the scp key from its ID
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES (:prop197, :eid, :name, 'text', NULL, 0.0, NULL)
-            """
-            ),
-            {
-                "prop197": const.VIRTUAL_EXHIBITION_PROP_ITEM_NAME_ID,
-                "eid": exhibition_id,
-                "name": name,
-            },
-        )
-        prop197_id = await DatabaseClient._get_last_insert_id(session)
-        scp_key = f"scp_{prop197_id}"
+        # Props 197 (name): their IDs become the scp keys
+        name_rows = [
+            writer.add(const.VIRTUAL_EXHIBITION_PROP_ITEM_NAME_ID, exhibition_id, name)
+            for name, _, _, _ in items
+        ]
+        row_ids = await writer.flush()
+        prop197_ids = [row_ids[row] for row in name_rows]
+
+        # Props 198 (bib), 199 (description), and 200 (image file IDs)
+        item_rows: list[tuple[int, int, list[int]]] = []
+        for prop197_id, (_, bib_html, description_html, image_file_ids) in zip(prop197_ids, items):
+            scp_key = f"scp_{prop197_id}"
+            bib_row = writer.add(
+                const.VIRTUAL_EXHIBITION_PROP_ITEM_BIB_ID,
+                exhibition_id,
+                bib_html,
+                description=scp_key,
+            )
+            desc_row = writer.add(
+                const.VIRTUAL_EXHIBITION_PROP_ITEM_DESC_ID,
+                exhibition_id,
+                description_html,
+                description=scp_key,
+            )
+            image_rows = [
+                writer.add(
+                    const.VIRTUAL_EXHIBITION_PROP_ITEM_IMAGE_ID,
+                    exhibition_id,
+                    str(file_id),
+                    value_num=float(file_id),
+                    description=scp_key,
+                )
+                for file_id in image_file_ids
+            ]
+            item_rows.append((bib_row, desc_row, image_rows))
+        row_ids = await writer.flush()
+
+        # Props 205 (linking array)
+        for prop197_id, (bib_row, desc_row, image_rows), (_, _, _, image_file_ids) in zip(
+            prop197_ids, item_rows, items
+        ):
+            scp_key = f"scp_{prop197_id}"
+            link_value = _php_serialize_item_link(
+                exhibition_id=exhibition_id,
+                scp_key=scp_key,
+                prop197_id=prop197_id,
+                prop198_id=row_ids[bib_row],
+                prop199_id=row_ids[desc_row],
+                prop200_ids=[row_ids[row] for row in image_rows],
+                image_file_ids=image_file_ids,
+            )
+            writer.add(
+                const.VIRTUAL_EXHIBITION_PROP_ITEM_LINK_ID,
+                exhibition_id,
+                link_value,
+                value_enum=0,
+                description=scp_key,
+            )
 
-        # Update the scp key on prop 197
-        await session.execute(
-            text("UPDATE b_iblock_element_property SET description = :scp WHERE id = :pid"),
-            {"scp": scp_key, "pid": prop197_id},
-        )
+        return prop197_ids
 
-        # Insert prop 198 (bib info)
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES (:prop198, :eid, :bib, 'text', NULL, 0.0, :scp)
-            """
-            ),
-            {
-                "prop198": const.VIRTUAL_EXHIBITION_PROP_ITEM_BIB_ID,
-                "eid": exhibition_id,
-                "bib": bib_html,
-                "scp": scp_key,
-            },
-        )
-        prop198_id = await DatabaseClient._get_last_insert_id(session)
 
-        # Insert prop 199 (description)
-        await session.execute(
-            text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES (:prop199, :eid, :desc, 'text', NULL, 0.0, :scp)
-            """
-            ),
+class PropertyWriter:
+    """Buffer ``b_iblock_element_property`` rows and write them as multi-row INSERTs.
+
+    Rows are added with :meth:`add` and written by :meth:`flush` in batches of
+    at most ``batch_size`` rows per statement.  The IDs of a batch are looked up
+    after it is written: they increase in row order from the cursor's
+    ``lastrowid`` (the ID of its first row), but are not necessarily
+    consecutive (e.g. with ``innodb_autoinc_lock_mode=2`` or an
+    ``auto_increment_increment`` above 1).
+    """
+
+    def __init__(
+        self, session: AsyncSession, batch_size: int = const.PROPERTY_INSERT_BATCH_SIZE
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            session: The active database session.
+            batch_size: The maximum number of rows per INSERT statement.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self._session = session
+        self._batch_size = batch_size
+        self._rows: list[dict[str, object]] = []
+
+    def add(
+        self,
+        property_id: int,
+        element_id: int,
+        value: str,
+        *,
+        value_type: str = "text",
+        value_enum: int | None = None,
+        value_num: float | None = 0.0,
+        description: str | None = None,
+    ) -> int:
+        """Buffer one property row.
+
+        Args:
+            property_id: The iblock property ID.
+            element_id: The ID of the element the property belongs to.
+            value: The property value.
+            value_type: The value type (``text`` or ``html``).
+            value_enum: The enum value ID, for list properties.
+            value_num: The numeric representation of the value.
+            description: The property description (e.g. the ``scp_<id>`` key).
+
+        Returns:
+            The index of the row in the list returned by the next :meth:`flush`.
+        """
+        self._rows.append(
             {
-                "prop199": const.VIRTUAL_EXHIBITION_PROP_ITEM_DESC_ID,
-                "eid": exhibition_id,
-                "desc": description_html,
-                "scp": scp_key,
-            },
+                "property_id": property_id,
+                "element_id": element_id,
+                "value": value,
+                "value_type": value_type,
+                "value_enum": value_enum,
+                "value_num": value_num,
+                "description": description,
+            }
         )
-        prop199_id = await DatabaseClient._get_last_insert_id(session)
+        return len(self._rows) - 1
+
+    async def flush(self) -> list[int]:
+        """Write all buffered rows.
 
-        # Insert prop 200 (image file IDs — one row per image)
-        prop200_ids: list[int] = []
-        for file_id in image_file_ids:
-            await session.execute(
+        Returns:
+            The IDs of the written rows, in the order they were added.
+        """
+        rows, self._rows = self._rows, []
+        row_ids: list[int] = []
+
+        for start in range(0, len(rows), self._batch_size):
+            batch = rows[start : start + self._batch_size]
+            values = ",\n".join(
+                f"(:property_id{i}, :element_id{i}, :value{i}, "
+                f":value_type{i}, :value_enum{i}, :value_num{i}, :description{i})"
+                for i in range(len(batch))
+            )
+            params = {
+                f"{key}{i}": value for i, row in enumerate(batch) for key, value in row.items()
+            }
+            result = await self._session.execute(
                 text(
-                    """
+                    f"""
                     INSERT INTO b_iblock_element_property
                         (iblock_property_id, iblock_element_id, value,
                          value_type, value_enum, value_num, description)
-                    VALUES (:prop200, :eid, :fid, 'text', NULL, :fnum, :scp)
+                    VALUES
+                        {values}
                 """
                 ),
-                {
-                    "prop200": const.VIRTUAL_EXHIBITION_PROP_ITEM_IMAGE_ID,
-                    "eid": exhibition_id,
-                    "fid": str(file_id),
-                    "fnum": float(file_id),
-                    "scp": scp_key,
-                },
+                params,
             )
-            prop200_ids.append(await DatabaseClient._get_last_insert_id(session))
-
-        # Build and insert prop 205 (linking array)
-        link_value = _php_serialize_item_link(
-            exhibition_id=exhibition_id,
-            scp_key=scp_key,
-            prop197_id=prop197_id,
-            prop198_id=prop198_id,
-            prop199_id=prop199_id,
-            prop200_ids=prop200_ids,
-            image_file_ids=image_file_ids,
-        )
-        await session.execute(
+            first_id = DatabaseClient._lastrowid(result)
+            row_ids.extend(await self._find_row_ids(batch, first_id))
+
+        return row_ids
+
+    async def _find_row_ids(self, batch: list[dict[str, object]], first_id: int) -> list[int]:
+        """Look up the IDs of the rows of a written *batch*, in batch order.
+
+        Property rows have no unique column to tag them with, so the rows of the
+        batch's elements from *first_id* on are matched to the batch in ID order,
+        per element and property.
+        """
+        result = await self._session.execute(
             text(
-                """
-                INSERT INTO b_iblock_element_property
-                    (iblock_property_id, iblock_element_id, value,
-                     value_type, value_enum, value_num, description)
-                VALUES (:prop205, :eid, :val, 'text', 0, 0.0, :scp)
-            """
-            ),
-            {
-                "prop205": const.VIRTUAL_EXHIBITION_PROP_ITEM_LINK_ID,
-                "eid": exhibition_id,
-                "val": link_value,
-                "scp": scp_key,
-            },
+                "SELECT id, iblock_element_id, iblock_property_id"
+                " FROM b_iblock_element_property"
+                " WHERE id >= :first_id AND iblock_element_id IN :element_ids"
+                " ORDER BY id"
+            ).bindparams(bindparam("element_ids", expanding=True)),
+            {"first_id": first_id, "element_ids": list({row["element_id"] for row in batch})},
         )
+        new_ids: defaultdict[tuple[object, object], deque[int]] = defaultdict(deque)
+        for row_id, element_id, property_id in result.all():
+            new_ids[element_id, property_id].append(row_id)
+        return [new_ids[row["element_id"], row["property_id"]].popleft() for row in batch]
 
 
 def _php_serialize_item_link(
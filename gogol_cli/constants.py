@@ -10,6 +10,37 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 DEFAULT_USER_ID = 1
 
+PROPERTY_INSERT_BATCH_SIZE = 500  # rows per multi-row b_iblock_element_property INSERT
+
+# --- SSH -------------------------------------------------------------------------
+
+DEFAULT_UPLOAD_CONCURRENCY = 8  # parallel SFTP uploads over the shared connection
+UPLOAD_CHUNK_SIZE = 256 * 1024  # bytes read from a local file per SFTP write when streaming
+
+# --- Batch ingest ----------------------------------------------------------------
+
+DEFAULT_FOLDER_CONCURRENCY = 3  # exhibitions of a --batch run created at the same time
+
+# --- Statistics ----------------------------------------------------------------
+
+STATISTICS_LABELS = ("01 added", "02 files", "03 updated", "04 search changes")
+
+# --- Local cache -----------------------------------------------------------------
+
+CACHE_DIR_NAME = "gogol-cli"  # under $XDG_CACHE_HOME (default: ~/.cache)
+STATISTICS_CACHE_FILE_NAME = "statistics.sqlite3"
+FILE_INDEX_FILE_NAME = "files.sqlite3"
+PARSE_CACHE_FILE_NAME = "parses.sqlite3"
+LIBREOFFICE_PROFILE_DIR_NAME = "libreoffice-profile"  # kept between .doc/.rtf conversions
+
+# Statistics whose source rows are only ever counted when they are inserted, so
+# the counts of an open month can be advanced from the highest row ID counted
+# (whatever the timestamp of a new row, e.g. of a file record copy).  Deleted
+# rows are never subtracted until the month is recounted (``--refresh``).  The
+# others are always recounted: added elements too, since copying a chronograph
+# section stamps date_create of existing elements again.
+INCREMENTAL_STATISTICS = ("02 files",)
+
 # --- Pin iblock ------------------------------------------------------------------
 
 PIN_IBLOCK_ID = 38
@@ -0,0 +1,58 @@
+"""Streaming extraction of paragraph text from .docx files."""
+
+import re
+import zipfile
+from collections.abc import Iterator
+from xml.etree import ElementTree as ET
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_P_TAG = f"{{{_W_NS}}}p"
+_T_TAG = f"{{{_W_NS}}}t"
+
+
+def _collapse_spaces(text: str) -> str:
+    """Replace non-breaking spaces, then collapse runs of spaces to one."""
+    text = text.replace("\xa0", " ")
+    return re.sub(r" {2,}", " ", text).strip()
+
+
+def iter_paragraphs(path: str) -> Iterator[str]:
+    """Yield the text of each non-empty paragraph of a .docx file, in document order.
+
+    ``word/document.xml`` is parsed incrementally with ``iterparse``: the text
+    of a paragraph is the concatenation of its ``w:t`` elements, and every
+    paragraph is dropped from the tree as soon as it has been read, so memory
+    use does not grow with the length of the document.  Paragraphs nested in
+    another one (e.g. in a text box) are part of the outer paragraph's text.
+
+    Args:
+        path: The path of the .docx file.
+
+    Yields:
+        The paragraph texts, with spaces collapsed.
+    """
+    with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as f:
+        # Open elements from the root down; a paragraph is removed from its
+        # parent once it ends, unless it is nested in another paragraph.
+        stack: list[ET.Element] = []
+        depth = 0
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == _P_TAG:
+                    depth += 1
+                continue
+
+            stack.pop()
+            if elem.tag != _P_TAG:
+                continue
+
+            depth -= 1
+            if depth:
+                continue
+
+            text = _collapse_spaces("".join(t.text or "" for t in elem.iter(_T_TAG)))
+            if stack:
+                stack[-1].remove(elem)
+            if text:
+                yield text
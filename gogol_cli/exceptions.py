@@ -21,6 +21,10 @@ class SSHNotConfiguredError(GogolCLIException):
     """Raised when an SSH file manager is required but was not provided."""
 
 
+class SSHCopyError(GogolCLIException):
+    """Raised when one or more remote file copies fail."""
+
+
 class InvalidEventURLError(GogolCLIException):
     """Invalid event URL error."""
 
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import multiprocessing
 import os
 import re
+import time
 import zipfile
-from xml.etree import ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import typer
 
+from gogol_cli.answers import Answers
+from gogol_cli.docx_text import iter_paragraphs
 from gogol_cli.exhibition.schemas import BibInfo, ParsedBook, ParsedExhibition
+from gogol_cli.local_cache import ParseCache
+from gogol_cli.schemas import ImageRef
 
-_WNS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+LOGGER = logging.getLogger(__name__)
 
 # Quote pairs (open, close) that may wrap exhibition titles.
 # «» must be first so it is detected before being re-wrapped.
@@ -30,13 +38,6 @@ _QUOTE_PAIRS = [
 # ---------------------------------------------------------------------------
 
 
-def _collapse_spaces(text: str) -> str:
-    """Replace non-breaking spaces, then collapse runs of spaces to one."""
-    text = text.replace("\xa0", " ")
-    text = re.sub(r" {2,}", " ", text)
-    return text.strip()
-
-
 def _sentence_case(text: str) -> str:
     """Lowercase everything then capitalise the first alphabetic character."""
     lowered = text.lower()
@@ -80,24 +81,11 @@ def _first_sentence(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _get_paragraphs(tree: ET.ElementTree[ET.Element]) -> list[str]:
-    """Extract collapsed, stripped, non-empty paragraph texts."""
-    ns = {"w": _WNS}
-    result = []
-    for p in tree.findall(".//w:p", ns):
-        runs = p.findall(".//w:t", ns)
-        text = "".join(r.text or "" for r in runs)
-        text = _collapse_spaces(text)
-        if text:
-            result.append(text)
-    return result
-
-
-def _extract_image(zf: zipfile.ZipFile) -> tuple[bytes, str] | None:
-    """Return (bytes, filename) for the first image found in a docx zip."""
+def _extract_image(zf: zipfile.ZipFile, path: str) -> ImageRef | None:
+    """Return a reference to the first image found in the docx zip at *path*."""
     for name in zf.namelist():
         if name.startswith("word/media/"):
-            return zf.read(name), os.path.basename(name)
+            return ImageRef(path=path, member=name)
     return None
 
 
@@ -155,19 +143,20 @@ def _parse_bib(author_line: str | None, bib_line: str) -> BibInfo:
 # ---------------------------------------------------------------------------
 
 
-def _prompt_title(title: str) -> str:
+def _prompt_title(title: str, answers: Answers, answered: str | None = None) -> str:
     typer.echo(f"\nParsed exhibition title: {title}")
-    return typer.prompt("Exhibition title", default=title)
+    return answers.ask(["title"], "Exhibition title", answered or title)
 
 
-def _prompt_bib(bib: BibInfo, book_index: int) -> BibInfo:
-    typer.echo(f"\n--- Book {book_index} ---")
+def _prompt_bib(bib: BibInfo, book_index: int, book_file: str, answers: Answers) -> BibInfo:
+    typer.echo(f"\n--- Book {book_index} ({book_file}) ---")
     typer.echo(f"  Bib line: {bib.full_text}")
-    title = typer.prompt("  Title (element name)", default=bib.title)
-    author = typer.prompt("  Author (prop 31)", default=bib.author)
-    city = typer.prompt("  City abbreviation (prop 57)", default=bib.city)
-    publisher = typer.prompt("  Publisher (prop 58)", default=bib.publisher)
-    year = typer.prompt("  Year (prop 59)", default=bib.year)
+    key = ["books", book_file]
+    title = answers.ask([*key, "title"], "  Title (element name)", bib.title)
+    author = answers.ask([*key, "author"], "  Author (prop 31)", bib.author)
+    city = answers.ask([*key, "city"], "  City abbreviation (prop 57)", bib.city)
+    publisher = answers.ask([*key, "publisher"], "  Publisher (prop 58)", bib.publisher)
+    year = answers.ask([*key, "year"], "  Year (prop 59)", bib.year)
     return bib.model_copy(
         update={
             "title": title,
@@ -245,10 +234,7 @@ def _parse_title_file(path: str) -> tuple[str, str, str]:
     - Next paras: optional quote block wrapped in <blockquote>
     - Remaining paras: body <p> elements.
     """
-    with zipfile.ZipFile(path) as zf:
-        with zf.open("word/document.xml") as f:
-            tree = ET.parse(f)
-    paragraphs = _get_paragraphs(tree)
+    paragraphs = list(iter_paragraphs(path))
     if not paragraphs:
         raise ValueError(f"Empty title file: {path}")
 
@@ -273,10 +259,10 @@ def _parse_title_file(path: str) -> tuple[str, str, str]:
     return title, detail_text, preview_text
 
 
-def _parse_illustration_file(path: str) -> tuple[bytes, str]:
-    """Return (image_bytes, filename) from the illustration docx."""
+def _parse_illustration_file(path: str) -> ImageRef:
+    """Return a reference to the image in the illustration docx."""
     with zipfile.ZipFile(path) as zf:
-        result = _extract_image(zf)
+        result = _extract_image(zf, path)
     if result is None:
         raise ValueError(f"No image found in illustration file: {path}")
     return result
@@ -284,15 +270,12 @@ def _parse_illustration_file(path: str) -> tuple[bytes, str]:
 
 def _parse_book_file(path: str, sort: int) -> ParsedBook:
     with zipfile.ZipFile(path) as zf:
-        img_result = _extract_image(zf)
-        with zf.open("word/document.xml") as f:
-            tree = ET.parse(f)
+        cover = _extract_image(zf, path)
 
-    if img_result is None:
+    if cover is None:
         raise ValueError(f"No image found in book file: {path}")
-    cover_data, cover_filename = img_result
 
-    paragraphs = _get_paragraphs(tree)
+    paragraphs = list(iter_paragraphs(path))
 
     if len(paragraphs) > 1 and _is_author_line(paragraphs[0]):
         author_line: str | None = paragraphs[0]
@@ -308,8 +291,7 @@ def _parse_book_file(path: str, sort: int) -> ParsedBook:
     preview_text = f"<p>{_first_sentence(desc_paragraphs[0])}</p>" if desc_paragraphs else ""
 
     return ParsedBook(
-        cover_data=cover_data,
-        cover_filename=cover_filename,
+        cover=cover,
         bib=bib,
         description=description,
         preview_text=preview_text,
@@ -317,17 +299,46 @@ def _parse_book_file(path: str, sort: int) -> ParsedBook:
     )
 
 
+def _parse_book_file_timed(path: str, sort: int) -> tuple[ParsedBook, float]:
+    """Parse a book file (in a worker process); return the book and the parse time in seconds."""
+    start = time.perf_counter()
+    book = _parse_book_file(path, sort)
+    return book, time.perf_counter() - start
+
+
+def _load_book(parse_cache: ParseCache, digest: str, path: str, sort: int) -> ParsedBook | None:
+    """Return the cached parse result of a book file, or None if there is none."""
+    result = parse_cache.get_result(digest, "book")
+    if result is None:
+        return None
+
+    book = ParsedBook.model_validate(result)
+    # The file may have been moved or renumbered since it was cached.
+    return book.model_copy(
+        update={"cover": book.cover.model_copy(update={"path": path}), "sort": sort}
+    )
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 
 
-def parse_exhibition_folder(folder_path: str) -> ParsedExhibition:
+def parse_exhibition_folder(
+    folder_path: str, parse_cache: ParseCache | None = None, answers: Answers | None = None
+) -> ParsedExhibition:
     """Parse a folder of .docx files into a ParsedExhibition.
 
     Displays interactive prompts so the user can confirm or correct the
-    parsed exhibition title and per-book bibliographic fields.
+    parsed exhibition title and per-book bibliographic fields.  The book files
+    are parsed in a process pool, starting before the first prompt, so the
+    prompts only walk the parsed results.
+
+    Files found in *parse_cache* (by content) are not parsed again, and the
+    answers given before for a file are offered as the prompt defaults.
+    Prompts answered by *answers* (e.g. from an answers file) are not asked.
     """
+    answers = answers or Answers()
     all_docx = [
         f for f in os.listdir(folder_path) if f.endswith(".docx") and not f.startswith("~$")
     ]
@@ -347,27 +358,78 @@ def parse_exhibition_folder(folder_path: str) -> ParsedExhibition:
     book_files = numbered[1:]
     illustration_file = unnumbered[0]
 
-    # --- Title & description ---
-    title, detail_text, preview_text = _parse_title_file(os.path.join(folder_path, title_file))
-    title = _prompt_title(title)
+    if parse_cache is None:
+        # Without a cache, parse results and answers only live for this run.
+        parse_cache = ParseCache(Path(":memory:"))
+
+    title_path = os.path.join(folder_path, title_file)
+    title_digest = ParseCache.digest(title_path)
+    book_paths = [os.path.join(folder_path, book_file) for book_file in book_files]
+    book_digests = [ParseCache.digest(path) for path in book_paths]
+
+    # Spawned, not forked: the caller may have other threads running (e.g. an
+    # event loop holding a database engine and an SSH connection).
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+        # --- Books (parsed in the background while the title is confirmed) ---
+        start = time.perf_counter()
+        cached_books = [
+            _load_book(parse_cache, digest, path, i * 10)
+            for i, (path, digest) in enumerate(zip(book_paths, book_digests), start=1)
+        ]
+        book_futures = {
+            index: pool.submit(_parse_book_file_timed, path, (index + 1) * 10)
+            for index, (path, cached) in enumerate(zip(book_paths, cached_books))
+            if cached is None
+        }
 
-    # --- Illustration ---
-    illus_data, illus_filename = _parse_illustration_file(
-        os.path.join(folder_path, illustration_file)
-    )
+        # --- Title & description ---
+        cached_title = parse_cache.get_result(title_digest, "title")
+        if cached_title is None:
+            title, detail_text, preview_text = _parse_title_file(title_path)
+            parse_cache.save_result(title_digest, "title", [title, detail_text, preview_text])
+        else:
+            title, detail_text, preview_text = cached_title
+        title = _prompt_title(title, answers, parse_cache.get_answers(title_digest).get("title"))
+        # Answers that are only collected have not been confirmed by anyone.
+        if not answers.collect_only:
+            parse_cache.save_answer(title_digest, "title", title)
+
+        # --- Illustration ---
+        illustration = _parse_illustration_file(os.path.join(folder_path, illustration_file))
+
+        parsed_books: list[ParsedBook] = []
+        for index, (book_file, digest) in enumerate(zip(book_files, book_digests)):
+            book = cached_books[index]
+            if book is None:
+                book, elapsed = book_futures[index].result()
+                LOGGER.info("Parsed %s in %.3f s", book_file, elapsed)
+                parse_cache.save_result(digest, "book", book.model_dump(mode="json"))
+            else:
+                LOGGER.info("Loaded %s from the parse cache", book_file)
+            parsed_books.append(book)
+        LOGGER.info(
+            "Parsed %d and loaded %d book file(s) in %.3f s",
+            len(book_futures),
+            len(parsed_books) - len(book_futures),
+            time.perf_counter() - start,
+        )
 
     # --- Books ---
     books: list[ParsedBook] = []
-    for i, book_file in enumerate(book_files, start=1):
-        book = _parse_book_file(os.path.join(folder_path, book_file), sort=i * 10)
-        confirmed_bib = _prompt_bib(book.bib, i)
+    for i, (book_file, book, digest) in enumerate(
+        zip(book_files, parsed_books, book_digests), start=1
+    ):
+        answered = parse_cache.get_answers(digest).get("bib")
+        defaults = book.bib if answered is None else BibInfo.model_validate_json(answered)
+        confirmed_bib = _prompt_bib(defaults, i, book_file, answers)
+        if not answers.collect_only:
+            parse_cache.save_answer(digest, "bib", confirmed_bib.model_dump_json())
         books.append(book.model_copy(update={"bib": confirmed_bib}))
 
     return ParsedExhibition(
         title=title,
         detail_text=detail_text,
         preview_text=preview_text,
-        illustration_data=illus_data,
-        illustration_filename=illus_filename,
+        illustration=illustration,
         books=books,
     )
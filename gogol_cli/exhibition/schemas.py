@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, ConfigDict
 
+from gogol_cli.schemas import ImageRef
+
 
 class BibInfo(BaseModel):
     """Parsed bibliographic information for a book."""
@@ -19,8 +21,7 @@ class ParsedBook(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    cover_data: bytes
-    cover_filename: str
+    cover: ImageRef
     bib: BibInfo
     description: str
     preview_text: str
@@ -35,6 +36,5 @@ class ParsedExhibition(BaseModel):
     title: str
     detail_text: str
     preview_text: str
-    illustration_data: bytes
-    illustration_filename: str
+    illustration: ImageRef
     books: list[ParsedBook]
@@ -31,15 +31,43 @@ class AbstractExporter(ABC):
         """
     )
 
+    BREAKDOWN_TEMPLATE = textwrap.dedent(
+        """
+        Добрый день!
+
+        Уникальные действия:
+
+        {table}
+
+        С уважением,
+        Евгений
+        """
+    )
+
+    # Column headers of the breakdown table, by statistics label
+    BREAKDOWN_COLUMNS = {
+        "01 added": "Страниц добавлено",
+        "02 files": "Файлов добавлено",
+        "03 updated": "Страниц обновлено",
+        "04 search changes": "Поисковых индексов обновлено",
+    }
+
     def prepare_message(self, statistics: list[dict[str, int]]) -> str:
         """Format the statistics into a human-readable report body.
 
+        Statistics broken down into periods (dicts with a ``bucket`` key) are
+        rendered as a table with one row per period.
+
         Args:
-            statistics: A list of dicts with ``what`` and ``cnt`` keys.
+            statistics: A list of dicts with ``what`` and ``cnt`` keys (and
+                optionally ``bucket``).
 
         Returns:
             The formatted message string ready to send or print.
         """
+        if statistics and "bucket" in statistics[0]:
+            return self.BREAKDOWN_TEMPLATE.format(table=self.prepare_table(statistics))
+
         pages_added = 0
         files_added = 0
         pages_updated = 0
@@ -64,6 +92,45 @@ class AbstractExporter(ABC):
 
         return message
 
+    def prepare_table(self, statistics: list[dict[str, int]]) -> str:
+        """Render statistics broken down into periods as a plain-text table.
+
+        Args:
+            statistics: A list of dicts with ``what``, ``bucket`` and ``cnt`` keys.
+
+        Returns:
+            The table with one row per period and a total row.
+        """
+        counts: dict[str, dict[str, int]] = {}
+        for stat in statistics:
+            counts.setdefault(str(stat["bucket"]), {})[str(stat["what"])] = stat["cnt"]
+
+        header = ["Период", *self.BREAKDOWN_COLUMNS.values()]
+        rows = [
+            [bucket, *(str(row.get(what, 0)) for what in self.BREAKDOWN_COLUMNS)]
+            for bucket, row in counts.items()
+        ]
+        total = [
+            "Итого",
+            *(
+                str(sum(row.get(what, 0) for row in counts.values()))
+                for what in self.BREAKDOWN_COLUMNS
+            ),
+        ]
+
+        widths = [max(len(line[i]) for line in [header, *rows, total]) for i in range(len(header))]
+        separator = "  ".join("-" * width for width in widths)
+
+        def _line(cells: list[str]) -> str:
+            return "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(cells, widths))
+            )
+
+        return "\n".join(
+            [_line(header), separator, *(_line(row) for row in rows), separator, _line(total)]
+        )
+
     @abstractmethod
     def export(self, statistics: list[dict[str, int]]) -> None:
         """Send or output the statistics report.
@@ -0,0 +1,89 @@
+"""Image processing run in worker processes.
+
+The functions here are CPU-bound and are meant to be submitted to a process
+pool, so the module only imports what they need.
+"""
+
+import hashlib
+import io
+from typing import IO
+
+from gogol_cli.schemas import ImageRef
+
+# A JPEG is decoded at the smallest 1/2, 1/4 or 1/8 scale that still leaves
+# this many times the target size, like ``Image.thumbnail`` does; the final
+# LANCZOS pass then has enough pixels to keep the quality of a full decode.
+_DRAFT_REDUCING_GAP = 2.0
+
+
+def content_key(image: ImageRef, max_dim: int | None = None) -> str:
+    """Key an image by the SHA-256 digest of its source bytes and the size it is shrunk to.
+
+    Args:
+        image: The source image; it is read in chunks, never as a whole.
+        max_dim: The maximum width and height it is shrunk to, if any.
+
+    Returns:
+        The hex digest, with an ``@<max_dim>`` suffix if *max_dim* is given.
+    """
+    with image.open() as file:
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+    return digest if max_dim is None else f"{digest}@{max_dim}"
+
+
+def process_image_file(
+    image: ImageRef, max_dim: int | None = None
+) -> tuple[bytes | None, int, int]:
+    """Measure an image and, if it is larger than *max_dim*, shrink it.
+
+    Only the image header is read unless the image has to be shrunk, so an
+    image that is uploaded as is can be streamed from its source.
+
+    Args:
+        image: The source image.
+        max_dim: The maximum width and height, or None to keep the image as is.
+
+    Returns:
+        (resized_bytes, width, height) – ``resized_bytes`` is None if the source
+        is to be uploaded unchanged.
+    """
+    with image.open() as file:
+        width, height = _image_size(file)
+    if max_dim is None or max(width, height) <= max_dim:
+        return None, width, height
+    return _resize_image(image.read(), max_dim)
+
+
+def _image_size(file: IO[bytes]) -> tuple[int, int]:
+    """Return the (width, height) of an encoded image, reading only its header."""
+    from PIL import Image
+
+    with Image.open(file) as img:
+        return img.width, img.height
+
+
+def _resize_image(data: bytes, max_dim: int) -> tuple[bytes, int, int]:
+    """Resize *data* so the largest dimension does not exceed *max_dim*.
+
+    JPEGs are decoded directly at a reduced scale (draft mode), which needs a
+    fraction of the memory and time of a full decode; other formats are
+    decoded in full.
+
+    Returns:
+        (resized_bytes, width, height)  – original bytes if no resize needed.
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        orig_format = img.format or "JPEG"
+        w, h = img.width, img.height
+        if max(w, h) <= max_dim:
+            return data, w, h
+        ratio = max_dim / max(w, h)
+        new_w = max(1, int(w * ratio))
+        new_h = max(1, int(h * ratio))
+        img.draft(None, (int(new_w * _DRAFT_REDUCING_GAP), int(new_h * _DRAFT_REDUCING_GAP)))
+        resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        resized.save(buf, format=orig_format, quality=90)
+        return buf.getvalue(), new_w, new_h
@@ -0,0 +1,13 @@
+"""Package with on-disk caches kept on the local machine."""
+
+from .files import FileIndex
+from .parses import ParseCache
+from .paths import user_cache_dir
+from .statistics import StatisticsCache
+
+__all__ = [
+    "FileIndex",
+    "ParseCache",
+    "StatisticsCache",
+    "user_cache_dir",
+]
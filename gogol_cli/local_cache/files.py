@@ -0,0 +1,92 @@
+"""Local index of the images uploaded to the remote server."""
+
+import logging
+import sqlite3
+from collections.abc import Collection
+from pathlib import Path
+
+from gogol_cli import constants as const
+from gogol_cli.local_cache.paths import user_cache_dir
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        digest    TEXT    PRIMARY KEY,
+        file_id   INTEGER NOT NULL,
+        subdir    TEXT    NOT NULL,
+        file_name TEXT    NOT NULL
+    );
+"""
+
+
+class FileIndex:
+    """SQLite index of uploaded files, keyed by the SHA-256 digest of their source contents.
+
+    The digest of an image that is shrunk before the upload carries the
+    maximum dimension as a ``@<size>`` suffix, since each size is another file.
+
+    Each entry points to the ``b_file`` record (ID, subdir and file name) that
+    was created for the uploaded bytes.  The index only remembers what was
+    uploaded; callers must check that the record still exists before reusing it.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create, if needed) the index database.
+
+        Args:
+            path: The path of the SQLite file.  Default: ``files.sqlite3``
+                in the user cache directory.
+        """
+        self._path = path or user_cache_dir() / const.FILE_INDEX_FILE_NAME
+        self._conn = sqlite3.connect(self._path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the index database."""
+        self._conn.close()
+
+    def get(self, digests: Collection[str]) -> dict[str, tuple[int, str, str]]:
+        """Look up uploaded files by the digests of their contents.
+
+        Args:
+            digests: The digests (hex SHA-256, with the optional size suffix).
+
+        Returns:
+            (file ID, subdir, file name) by digest, for the digests that are indexed.
+        """
+        if not digests:
+            return {}
+
+        placeholders = ", ".join("?" * len(digests))
+        rows = self._conn.execute(
+            "SELECT digest, file_id, subdir, file_name FROM files "
+            f"WHERE digest IN ({placeholders})",
+            list(digests),
+        ).fetchall()
+        return {row["digest"]: (row["file_id"], row["subdir"], row["file_name"]) for row in rows}
+
+    def save(self, entries: list[tuple[str, int, str, str]]) -> None:
+        """Add or replace index entries.
+
+        Args:
+            entries: Tuples of (digest, file ID, subdir, file name).
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (digest, file_id, subdir, file_name) "
+                "VALUES (?, ?, ?, ?)",
+                entries,
+            )
+
+        LOGGER.info("Indexed %d uploaded file(s)", len(entries))
+
+    def forget(self, digests: Collection[str]) -> None:
+        """Drop the entries of *digests* (e.g. because their records are gone).
+
+        Args:
+            digests: The hex SHA-256 digests.
+        """
+        with self._conn:
+            self._conn.executemany("DELETE FROM files WHERE digest = ?", [(d,) for d in digests])
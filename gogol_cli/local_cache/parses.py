@@ -0,0 +1,146 @@
+"""Local cache of parsed documents and of the answers given to the parser prompts."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from gogol_cli import constants as const
+from gogol_cli.local_cache.paths import user_cache_dir
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the parsers produce different results for the same file, so that
+# older cached results are ignored.
+_RESULT_VERSION = 1
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        digest    TEXT    NOT NULL,
+        kind      TEXT    NOT NULL,
+        version   INTEGER NOT NULL,
+        result    TEXT    NOT NULL,
+        parsed_at TEXT    NOT NULL,
+        PRIMARY KEY (digest, kind)
+    );
+    CREATE TABLE IF NOT EXISTS answers (
+        digest      TEXT NOT NULL,
+        prompt      TEXT NOT NULL,
+        answer      TEXT NOT NULL,
+        answered_at TEXT NOT NULL,
+        PRIMARY KEY (digest, prompt)
+    );
+"""
+
+
+class ParseCache:
+    """SQLite cache of parse results and prompt answers, keyed by the SHA-256 digest of a file.
+
+    A parse result is any JSON-serialisable value stored under a *kind* (e.g.
+    ``"book"``), so each parser decides what it keeps.  The answers confirmed
+    by the operator are stored per prompt and offered as defaults when the
+    same file is parsed again.
+    """
+
+    def __init__(self, path: Path | None = None, refresh: bool = False) -> None:
+        """Open (and create, if needed) the cache database.
+
+        Args:
+            path: The path of the SQLite file.  Default: ``parses.sqlite3``
+                in the user cache directory.
+            refresh: If true, cached parse results are ignored (and replaced);
+                cached answers are still offered.
+        """
+        self._path = path or user_cache_dir() / const.PARSE_CACHE_FILE_NAME
+        self._refresh = refresh
+        self._conn = sqlite3.connect(self._path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
+
+    @staticmethod
+    def digest(path: str) -> str:
+        """Return the hex SHA-256 digest of a file, read in chunks.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The digest that keys the file in the cache.
+        """
+        with open(path, "rb") as file:
+            return hashlib.file_digest(file, "sha256").hexdigest()
+
+    def get_result(self, digest: str, kind: str) -> Any:
+        """Get a cached parse result.
+
+        Args:
+            digest: The digest of the parsed file.
+            kind: The kind of result.
+
+        Returns:
+            The cached result, or None if there is none (or it is outdated).
+        """
+        if self._refresh:
+            return None
+
+        row = self._conn.execute(
+            "SELECT result FROM results WHERE digest = ? AND kind = ? AND version = ?",
+            (digest, kind, _RESULT_VERSION),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save_result(self, digest: str, kind: str, result: Any) -> None:
+        """Store a parse result, replacing any previous one.
+
+        Args:
+            digest: The digest of the parsed file.
+            kind: The kind of result.
+            result: The JSON-serialisable result.
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (digest, kind, version, result, parsed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    digest,
+                    kind,
+                    _RESULT_VERSION,
+                    json.dumps(result, ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+    def get_answers(self, digest: str) -> dict[str, str]:
+        """Get the answers given before to the prompts about a file.
+
+        Args:
+            digest: The digest of the file.
+
+        Returns:
+            The answers by prompt.
+        """
+        rows = self._conn.execute(
+            "SELECT prompt, answer FROM answers WHERE digest = ?", (digest,)
+        ).fetchall()
+        return dict(rows)
+
+    def save_answer(self, digest: str, prompt: str, answer: str) -> None:
+        """Store the answer to a prompt about a file, replacing any previous one.
+
+        Args:
+            digest: The digest of the file.
+            prompt: The prompt key.
+            answer: The confirmed answer.
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (digest, prompt, answer, answered_at) "
+                "VALUES (?, ?, ?, ?)",
+                (digest, prompt, answer, datetime.now().isoformat()),
+            )
@@ -0,0 +1,20 @@
+"""Locations of the local caches."""
+
+import os
+from pathlib import Path
+
+from gogol_cli import constants as const
+
+
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory of the CLI, creating it if needed.
+
+    Honours ``$XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+
+    Returns:
+        The path of the cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    path = Path(base) / const.CACHE_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
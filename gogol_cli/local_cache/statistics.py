@@ -0,0 +1,127 @@
+"""Local cache of the monthly activity statistics."""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from gogol_cli import constants as const
+from gogol_cli.local_cache.paths import user_cache_dir
+from gogol_cli.schemas import StatisticsCount
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the stored counts change meaning; the cache is then dropped and
+# the months are counted again.
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS statistics (
+        month   TEXT    NOT NULL,
+        what    TEXT    NOT NULL,
+        cnt     INTEGER NOT NULL,
+        last_id INTEGER,
+        PRIMARY KEY (month, what)
+    );
+    CREATE TABLE IF NOT EXISTS closed_months (
+        month     TEXT PRIMARY KEY,
+        closed_at TEXT NOT NULL
+    );
+"""
+
+
+class StatisticsCache:
+    """SQLite cache of the monthly activity statistics, keyed by month (``YYYY-MM``).
+
+    A month is stored as *closed* once it has been counted after it ended; its
+    counts never change again.  The counts of an open month are stored together
+    with the highest row ID counted per source so that they can be updated
+    incrementally.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create, if needed) the cache database.
+
+        Args:
+            path: The path of the SQLite file.  Default: ``statistics.sqlite3``
+                in the user cache directory.
+        """
+        self._path = path or user_cache_dir() / const.STATISTICS_CACHE_FILE_NAME
+        self._conn = sqlite3.connect(self._path)
+        self._conn.row_factory = sqlite3.Row
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            LOGGER.info("Dropping the statistics cache of an older version")
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS statistics; DROP TABLE IF EXISTS closed_months;"
+            )
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
+
+    def is_closed(self, month: str) -> bool:
+        """Check whether the final counts of *month* are cached.
+
+        Args:
+            month: The month key (``YYYY-MM``).
+
+        Returns:
+            True if the month is closed and its counts can be served as is.
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM closed_months WHERE month = ?", (month,)
+        ).fetchone()
+        return row is not None
+
+    def get_counts(self, month: str) -> dict[str, StatisticsCount]:
+        """Get the cached counts of *month*.
+
+        Args:
+            month: The month key (``YYYY-MM``).
+
+        Returns:
+            The cached counts by ``what`` label; empty if nothing is cached.
+        """
+        rows = self._conn.execute(
+            "SELECT what, cnt, last_id FROM statistics WHERE month = ? ORDER BY what",
+            (month,),
+        ).fetchall()
+        return {
+            row["what"]: StatisticsCount(what=row["what"], cnt=row["cnt"], last_id=row["last_id"])
+            for row in rows
+        }
+
+    def save(self, month: str, counts: list[StatisticsCount], closed: bool) -> None:
+        """Replace the cached counts of *month*.
+
+        Args:
+            month: The month key (``YYYY-MM``).
+            counts: The counts to store.
+            closed: Whether the month has ended, i.e. the counts are final.
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM statistics WHERE month = ?", (month,))
+            self._conn.executemany(
+                "INSERT INTO statistics (month, what, cnt, last_id) VALUES (?, ?, ?, ?)",
+                [(month, count.what, count.cnt, count.last_id) for count in counts],
+            )
+            if closed:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO closed_months (month, closed_at) VALUES (?, ?)",
+                    (month, datetime.now().isoformat()),
+                )
+
+        LOGGER.info("Cached %s statistics for %s", "final" if closed else "partial", month)
+
+    def clear(self, month: str) -> None:
+        """Drop everything cached for *month*.
+
+        Args:
+            month: The month key (``YYYY-MM``).
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM statistics WHERE month = ?", (month,))
+            self._conn.execute("DELETE FROM closed_months WHERE month = ?", (month,))
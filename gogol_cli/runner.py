@@ -1,47 +1,82 @@
 """Script run."""
 
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import TypeVar
 
+import typer
+
+from gogol_cli import constants as const
+from gogol_cli.answers import Answers
 from gogol_cli.clients import DatabaseClient
 from gogol_cli.exceptions import EmailConfigError, SMTPConfigError
 from gogol_cli.exporters import AbstractExporter, PlainExporter, SMTPExporter
 from gogol_cli.exporters.smtp import EmailConfig, SMTPConfig
+from gogol_cli.local_cache import FileIndex, ParseCache, StatisticsCache
+from gogol_cli.schemas import BatchFolderResult, BatchOptions, Granularity
 from gogol_cli.service import GogolCLIService
 from gogol_cli.ssh_file_manager import SSHConfig, SSHFileManager
 
+LOGGER = logging.getLogger(__name__)
+
+ParsedT = TypeVar("ParsedT")
+
 
 async def pin_event(
     database_uri: str,
     event_urls: list[str],
     dry_run: bool,
     ssh_config: SSHConfig,
+    per_event_commit: bool = False,
+    link_pictures: bool = False,
 ) -> None:
     """Run the script."""
     database_client = DatabaseClient(database_uri)
     ssh_file_manager = SSHFileManager(ssh_config)
-    cli_service = GogolCLIService(database_client, ssh_file_manager, dry_run)
+    cli_service = GogolCLIService(
+        database_client, ssh_file_manager, dry_run, link_pictures=link_pictures
+    )
 
-    for event_url in event_urls:
-        event = await cli_service.get_event(event_url)
-        await cli_service.pin_event(event)
+    try:
+        events = await cli_service.get_events(event_urls)
+        if per_event_commit:
+            for event in events:
+                await cli_service.pin_event(event)
+        else:
+            await cli_service.pin_events(events)
+    finally:
+        await cli_service.close()
 
 
 async def copy_event(
     database_uri: str,
     event_url: str,
-    new_event_date_str: str,
+    new_event_date_strs: list[str],
     new_event_time_str: str,
     new_price: str | None,
     dry_run: bool,
     ssh_config: SSHConfig,
+    link_pictures: bool = False,
 ) -> None:
     """Run the script."""
     database_client = DatabaseClient(database_uri)
     ssh_file_manager = SSHFileManager(ssh_config)
-    cli_service = GogolCLIService(database_client, ssh_file_manager, dry_run)
+    cli_service = GogolCLIService(
+        database_client, ssh_file_manager, dry_run, link_pictures=link_pictures
+    )
 
-    old_event = await cli_service.get_event(event_url)
-    await cli_service.copy_event(old_event, new_event_date_str, new_event_time_str, new_price)
+    try:
+        old_event = await cli_service.get_event(event_url)
+        await cli_service.copy_event_to_dates(
+            old_event, new_event_date_strs, new_event_time_str, new_price
+        )
+    finally:
+        await cli_service.close()
 
 
 async def export_statistics(
@@ -51,12 +86,66 @@ async def export_statistics(
     dry_run: bool,
     smtp_config: SMTPConfig | None = None,
     email_config: EmailConfig | None = None,
+    explain: bool = False,
+    refresh: bool = False,
+) -> None:
+    """Run the script."""
+    database_client = DatabaseClient(database_uri)
+    cli_service = GogolCLIService(
+        database_client, dry_run=dry_run, statistics_cache=StatisticsCache()
+    )
+
+    try:
+        if explain:
+            plans = await cli_service.explain_export(month_number, year_suffix)
+            for what, plan in plans.items():
+                print(f"{what}:")
+                for row in plan:
+                    print("  " + ", ".join(f"{key}={value}" for key, value in row.items()))
+
+        statistics = await cli_service.export(month_number, year_suffix, refresh)
+    finally:
+        await cli_service.close()
+
+    if dry_run:
+        exporter: AbstractExporter = PlainExporter()
+    else:
+        if smtp_config is None:
+            raise SMTPConfigError("SMTP config is not provided")
+        if email_config is None:
+            raise EmailConfigError("Email config is not provided")
+        exporter = SMTPExporter(smtp_config, email_config)
+
+    exporter.export(statistics)
+
+
+async def export_statistics_breakdown(
+    database_uri: str,
+    first_month: datetime,
+    last_month: datetime,
+    granularity: Granularity,
+    dry_run: bool,
+    smtp_config: SMTPConfig | None = None,
+    email_config: EmailConfig | None = None,
+    explain: bool = False,
 ) -> None:
     """Run the script."""
     database_client = DatabaseClient(database_uri)
     cli_service = GogolCLIService(database_client, dry_run=dry_run)
 
-    statistics = await cli_service.export(month_number, year_suffix)
+    try:
+        if explain:
+            plans = await cli_service.explain_export_breakdown(
+                first_month, last_month, granularity
+            )
+            for what, plan in plans.items():
+                print(f"{what}:")
+                for row in plan:
+                    print("  " + ", ".join(f"{key}={value}" for key, value in row.items()))
+
+        statistics = await cli_service.export_breakdown(first_month, last_month, granularity)
+    finally:
+        await cli_service.close()
 
     if dry_run:
         exporter: AbstractExporter = PlainExporter()
@@ -80,7 +169,11 @@ async def copy_chronograph(
     database_client = DatabaseClient(database_uri)
     cli_service = GogolCLIService(database_client, dry_run=dry_run)
 
-    await cli_service.copy_chronograph(month_number, year_suffix)
+    result = await cli_service.copy_chronograph(month_number, year_suffix)
+
+    print(f"Elements moved: {result.elements_moved}")
+    print(f"Section links added: {result.section_links_added}")
+    print(f"Years shifted: {result.years_shifted}")
 
 
 async def create_exhibition(
@@ -89,17 +182,40 @@ async def create_exhibition(
     active_from: datetime,
     dry_run: bool,
     ssh_config: SSHConfig,
+    upload_concurrency: int = const.DEFAULT_UPLOAD_CONCURRENCY,
+    dedup: bool = False,
+    reparse: bool = False,
+    answers: Answers | None = None,
+    dump_answers_path: str | None = None,
 ) -> None:
-    """Run the exhibition creation script."""
+    """Run the exhibition creation script.
+
+    With *dump_answers_path*, only the folder is parsed and the answers are
+    written to that file.
+    """
     from gogol_cli.exhibition.docx_parser import parse_exhibition_folder
 
-    parsed = parse_exhibition_folder(folder_path)
+    answers = answers or Answers()
+    parse_cache = ParseCache(refresh=reparse)
+    try:
+        parsed = parse_exhibition_folder(folder_path, parse_cache=parse_cache, answers=answers)
+    finally:
+        parse_cache.close()
+    if dump_answers_path is not None:
+        answers.dump(dump_answers_path)
+        print(f"Answers written to {dump_answers_path}")
+        return
 
     database_client = DatabaseClient(database_uri)
-    ssh_file_manager = SSHFileManager(ssh_config)
-    cli_service = GogolCLIService(database_client, ssh_file_manager, dry_run)
+    ssh_file_manager = SSHFileManager(ssh_config, upload_concurrency)
+    cli_service = GogolCLIService(
+        database_client, ssh_file_manager, dry_run, file_index=FileIndex() if dedup else None
+    )
 
-    await cli_service.create_exhibition(parsed, active_from)
+    try:
+        await cli_service.create_exhibition(parsed, active_from)
+    finally:
+        await cli_service.close()
 
 
 async def create_virtual_exhibition(
@@ -107,14 +223,258 @@ async def create_virtual_exhibition(
     folder_path: str,
     dry_run: bool,
     ssh_config: SSHConfig,
+    upload_concurrency: int = const.DEFAULT_UPLOAD_CONCURRENCY,
+    dedup: bool = False,
+    reparse: bool = False,
+    answers: Answers | None = None,
+    dump_answers_path: str | None = None,
 ) -> None:
-    """Run the virtual exhibition creation script."""
+    """Run the virtual exhibition creation script.
+
+    With *dump_answers_path*, only the folder is parsed and the answers are
+    written to that file.
+    """
     from gogol_cli.virtual_exhibition.parser import parse_virtual_exhibition_folder
 
-    parsed = parse_virtual_exhibition_folder(folder_path)
+    answers = answers or Answers()
+    parse_cache = ParseCache(refresh=reparse)
+    try:
+        parsed = parse_virtual_exhibition_folder(
+            folder_path, parse_cache=parse_cache, answers=answers
+        )
+    finally:
+        parse_cache.close()
+    if dump_answers_path is not None:
+        answers.dump(dump_answers_path)
+        print(f"Answers written to {dump_answers_path}")
+        return
+    # Only answers that are collected for the answers file can leave the dates missing.
+    assert parsed is not None
 
     database_client = DatabaseClient(database_uri)
-    ssh_file_manager = SSHFileManager(ssh_config)
-    cli_service = GogolCLIService(database_client, ssh_file_manager, dry_run)
+    ssh_file_manager = SSHFileManager(ssh_config, upload_concurrency)
+    cli_service = GogolCLIService(
+        database_client, ssh_file_manager, dry_run, file_index=FileIndex() if dedup else None
+    )
+
+    try:
+        await cli_service.create_virtual_exhibition(parsed)
+    finally:
+        await cli_service.close()
+
+
+async def create_exhibitions(
+    database_uri: str,
+    root_path: str,
+    active_from: datetime,
+    dry_run: bool,
+    ssh_config: SSHConfig,
+    upload_concurrency: int = const.DEFAULT_UPLOAD_CONCURRENCY,
+    dedup: bool = False,
+    answers: Answers | None = None,
+    options: BatchOptions | None = None,
+) -> list[BatchFolderResult]:
+    """Run the exhibition creation script for every sub-folder of *root_path*.
+
+    The answers of each folder are nested under the folder name.  With a
+    ``dump_answers_path`` in *options*, the folders are only parsed and the
+    answers are written to that file.
+    """
+    from gogol_cli.exhibition.docx_parser import parse_exhibition_folder
+
+    answers = answers or Answers()
+    options = options or BatchOptions()
+    cli_service = None
+    if options.dump_answers_path is None:
+        database_client = DatabaseClient(database_uri)
+        ssh_file_manager = SSHFileManager(ssh_config, upload_concurrency)
+        cli_service = GogolCLIService(
+            database_client, ssh_file_manager, dry_run, file_index=FileIndex() if dedup else None
+        )
+
+    try:
+        results = await _create_batch(
+            root_path,
+            parse_exhibition_folder,
+            lambda service, parsed: service.create_exhibition(parsed, active_from),
+            cli_service,
+            answers,
+            options,
+        )
+    finally:
+        if cli_service is not None:
+            await cli_service.close()
+
+    _finish_batch(results, answers, options.dump_answers_path)
+    return results
+
+
+async def create_virtual_exhibitions(
+    database_uri: str,
+    root_path: str,
+    dry_run: bool,
+    ssh_config: SSHConfig,
+    upload_concurrency: int = const.DEFAULT_UPLOAD_CONCURRENCY,
+    dedup: bool = False,
+    answers: Answers | None = None,
+    options: BatchOptions | None = None,
+) -> list[BatchFolderResult]:
+    """Run the virtual exhibition creation script for every sub-folder of *root_path*.
+
+    The answers of each folder are nested under the folder name.  With a
+    ``dump_answers_path`` in *options*, the folders are only parsed and the
+    answers are written to that file.
+    """
+    from gogol_cli.virtual_exhibition.parser import parse_virtual_exhibition_folder
+
+    answers = answers or Answers()
+    options = options or BatchOptions()
+    cli_service = None
+    if options.dump_answers_path is None:
+        database_client = DatabaseClient(database_uri)
+        ssh_file_manager = SSHFileManager(ssh_config, upload_concurrency)
+        cli_service = GogolCLIService(
+            database_client, ssh_file_manager, dry_run, file_index=FileIndex() if dedup else None
+        )
+
+    try:
+        results = await _create_batch(
+            root_path,
+            parse_virtual_exhibition_folder,
+            lambda service, parsed: service.create_virtual_exhibition(parsed),
+            cli_service,
+            answers,
+            options,
+        )
+    finally:
+        if cli_service is not None:
+            await cli_service.close()
+
+    _finish_batch(results, answers, options.dump_answers_path)
+    return results
+
+
+async def _create_batch(
+    root_path: str,
+    parse: Callable[..., ParsedT],
+    create: Callable[[GogolCLIService, ParsedT], Awaitable[int]],
+    cli_service: GogolCLIService | None,
+    answers: Answers,
+    options: BatchOptions,
+) -> list[BatchFolderResult]:
+    """Parse every sub-folder of *root_path* and create its exhibition.
+
+    If no prompt needs the operator, up to ``folder_concurrency`` folders are
+    parsed at once in a thread pool, and each exhibition is created as soon as
+    its folder is parsed.  Otherwise the folders are parsed one after another
+    in the main thread, since their prompts are, and every prompt is answered
+    before anything is written.  The exhibitions are created through the one
+    *cli_service* (so one database engine and one SSH connection), up to
+    ``folder_concurrency`` at a time.  Without *cli_service*, the folders are
+    only parsed.  A failing folder is reported in its result and does not stop
+    the others.
+
+    Args:
+        root_path: The folder whose sub-folders are the exhibition folders.
+        parse: The folder parser, called with a folder path and the keyword
+            arguments ``parse_cache`` and ``answers``.
+        create: Creates the exhibition of a parsed folder and returns its ID.
+        cli_service: The service to create the exhibitions with.
+        answers: The answers to the prompts; each folder gets its own scope.
+        options: The batch options (``folder_concurrency``, ``reparse``).
+
+    Returns:
+        The result of each folder, in folder name order.
+
+    Raises:
+        ValueError: If *root_path* has no sub-folders.
+    """
+    folder_paths = _find_folders(root_path)
+    results = [BatchFolderResult(folder=os.path.basename(path)) for path in folder_paths]
+    folder_answers = {result.folder: answers.scoped(result.folder) for result in results}
+    semaphore = asyncio.Semaphore(options.folder_concurrency)
+
+    def parse_one(folder_path: str, result: BatchFolderResult) -> ParsedT | None:
+        start = time.perf_counter()
+        # An SQLite connection belongs to the thread that opened it, so each
+        # folder opens its own connection to the parse cache.
+        parse_cache = ParseCache(refresh=options.reparse)
+        try:
+            return parse(
+                folder_path, parse_cache=parse_cache, answers=folder_answers[result.folder]
+            )
+        except typer.Abort:
+            raise
+        except Exception as exc:
+            LOGGER.exception("Failed to parse %s", folder_path)
+            result.error = str(exc)
+            return None
+        finally:
+            parse_cache.close()
+            result.parse_seconds = time.perf_counter() - start
+
+    async def create_one(result: BatchFolderResult, parsed: ParsedT | None) -> None:
+        if cli_service is None or parsed is None:
+            return
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result.exhibition_id = await create(cli_service, parsed)
+            except Exception as exc:
+                LOGGER.exception("Failed to create the exhibition of %s", result.folder)
+                result.error = str(exc)
+            result.create_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if answers.interactive:
+        # Prompts stay in the main thread (so that Ctrl-C interrupts them).
+        parsed = [parse_one(path, result) for path, result in zip(folder_paths, results)]
+        await asyncio.gather(*map(create_one, results, parsed))
+    else:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=options.folder_concurrency) as parser:
+
+            async def parse_and_create(folder_path: str, result: BatchFolderResult) -> None:
+                parsed = await loop.run_in_executor(parser, parse_one, folder_path, result)
+                await create_one(result, parsed)
+
+            await asyncio.gather(*map(parse_and_create, folder_paths, results))
+    LOGGER.info("Processed %d folder(s) in %.1f s", len(results), time.perf_counter() - start)
+    return results
+
+
+def _find_folders(root_path: str) -> list[str]:
+    """Return the paths of the (non-hidden) sub-folders of *root_path*, sorted by name.
+
+    Raises:
+        ValueError: If there are none.
+    """
+    folder_paths = sorted(
+        entry.path
+        for entry in os.scandir(root_path)
+        if entry.is_dir() and not entry.name.startswith(".")
+    )
+    if not folder_paths:
+        raise ValueError(f"No exhibition folders found in: {root_path}")
+    return folder_paths
+
+
+def _finish_batch(
+    results: list[BatchFolderResult], answers: Answers, dump_answers_path: str | None
+) -> None:
+    """Write the answers of a batch run (if asked to) and print its summary table."""
+    if dump_answers_path is not None:
+        answers.dump(dump_answers_path)
+        print(f"Answers written to {dump_answers_path}")
 
-    await cli_service.create_virtual_exhibition(parsed)
+    print(f"{'folder':<40} {'exhibition ID':>13} {'parse, s':>9} {'create, s':>10}  status")
+    for result in results:
+        exhibition_id = "-" if result.exhibition_id is None else str(result.exhibition_id)
+        if result.error is not None:
+            status = f"failed: {result.error}"
+        else:
+            status = "parsed" if result.exhibition_id is None else "ok"
+        print(
+            f"{result.folder[:40]:<40} {exhibition_id:>13} {result.parse_seconds:9.2f} "
+            f"{result.create_seconds:10.2f}  {status}"
+        )
@@ -1,8 +1,17 @@
 """Schemas."""
 
-from datetime import datetime
+import os
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import IO
+
 from pydantic import BaseModel, ConfigDict, Field
 
+from gogol_cli import constants as const
+
 
 class Event(BaseModel):
     """Event schema."""
@@ -35,6 +44,22 @@ class Event(BaseModel):
         return self.active_to.strftime("%M")
 
 
+class EventCopy(BaseModel):
+    """A new date (and time and price) to copy an event onto."""
+
+    date: datetime
+    time: str  # HH-MM
+    price: str | None = None  # None keeps the price of the source event
+    preview_picture_id: int | None = None
+    detail_picture_id: int | None = None
+
+    @property
+    def active_to(self) -> datetime:
+        """Get the end of the activity period: one hour after the start of the event."""
+        hours, minutes = self.time.split("-")
+        return self.date + timedelta(hours=int(hours) + 1, minutes=int(minutes))
+
+
 class File(BaseModel):
     """File schema."""
 
@@ -51,3 +76,112 @@ class File(BaseModel):
     file_name: str = Field(alias="FILE_NAME")
     original_name: str | None = Field(alias="ORIGINAL_NAME")
     external_id: str | None = Field(alias="EXTERNAL_ID")
+
+
+class ImageRef(BaseModel):
+    """A reference to an image file, or to an image stored in a zip archive (e.g. a .docx).
+
+    The image is only read when :meth:`open` or :meth:`read` is called.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str
+    member: str | None = None  # name of the image inside the zip archive at ``path``
+
+    @property
+    def filename(self) -> str:
+        """Get the file name of the image."""
+        return os.path.basename(self.member or self.path)
+
+    @property
+    def file_size(self) -> int:
+        """Get the (uncompressed) size of the image in bytes, without reading it."""
+        if self.member is None:
+            return os.path.getsize(self.path)
+        with zipfile.ZipFile(self.path) as archive:
+            return archive.getinfo(self.member).file_size
+
+    @contextmanager
+    def open(self) -> Iterator[IO[bytes]]:
+        """Open the image for reading in binary mode."""
+        if self.member is None:
+            with open(self.path, "rb") as file:
+                yield file
+        else:
+            with zipfile.ZipFile(self.path) as archive, archive.open(self.member) as file:
+                yield file
+
+    def read(self) -> bytes:
+        """Read the whole image."""
+        with self.open() as file:
+            return file.read()
+
+
+class PreparedImage(BaseModel):
+    """An image that is uploaded (or being uploaded) and is to be registered in ``b_file``.
+
+    The image bytes are not kept: they are dropped as soon as the upload is done.
+    ``digest`` keys the source image in the file index, if one is used;
+    ``file_id`` is set once the image has a ``b_file`` record, either a new one
+    or an existing record of the same source image that is reused.
+    """
+
+    digest: str | None = None
+    subdir: str
+    filename: str
+    content_type: str
+    width: int
+    height: int
+    file_size: int
+    file_id: int | None = None
+
+
+class BatchOptions(BaseModel):
+    """Options of a batch exhibition run."""
+
+    folder_concurrency: int = const.DEFAULT_FOLDER_CONCURRENCY
+    reparse: bool = False
+    dump_answers_path: str | None = None
+
+
+class BatchFolderResult(BaseModel):
+    """Outcome of one folder of a batch exhibition run."""
+
+    folder: str
+    exhibition_id: int | None = None
+    parse_seconds: float = 0.0
+    create_seconds: float = 0.0
+    error: str | None = None
+
+
+class ChronographCopyResult(BaseModel):
+    """Row counts changed by copying a chronograph section."""
+
+    elements_moved: int
+    section_links_added: int
+    years_shifted: int
+
+
+class StatisticsCount(BaseModel):
+    """Activity count of one statistics source over a period."""
+
+    what: str
+    cnt: int
+    last_id: int | None = None  # the highest row ID counted (high-water mark)
+
+
+class Granularity(str, Enum):
+    """Size of the periods that statistics are broken down into."""
+
+    MONTH = "month"
+    WEEK = "week"
+    DAY = "day"
+
+
+class Recurrence(str, Enum):
+    """Interval between the dates of a recurring schedule."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
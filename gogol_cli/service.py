@@ -1,8 +1,11 @@
 """Gogol CLI service."""
 
-import io
+import asyncio
 import logging
+import multiprocessing
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,7 +14,17 @@ from gogol_cli import constants as const
 from gogol_cli.clients import DatabaseClient
 from gogol_cli.exceptions import GogolCLIException, SSHNotConfiguredError
 from gogol_cli.exhibition.schemas import ParsedExhibition
-from gogol_cli.schemas import Event
+from gogol_cli.images import content_key, process_image_file
+from gogol_cli.local_cache import FileIndex, StatisticsCache
+from gogol_cli.schemas import (
+    ChronographCopyResult,
+    Event,
+    EventCopy,
+    Granularity,
+    ImageRef,
+    PreparedImage,
+    StatisticsCount,
+)
 from gogol_cli.ssh_file_manager import SSHFileManager
 from gogol_cli.virtual_exhibition.schemas import ParsedVirtualExhibition
 
@@ -26,6 +39,9 @@ class GogolCLIService:
         database_client: DatabaseClient,
         ssh_file_manager: SSHFileManager | None = None,
         dry_run: bool = False,
+        statistics_cache: StatisticsCache | None = None,
+        link_pictures: bool = False,
+        file_index: FileIndex | None = None,
     ) -> None:
         """Initialize the service.
 
@@ -33,10 +49,31 @@ class GogolCLIService:
             database_client: The instance of the database client.
             ssh_file_manager: The instance of the service to manage files via SSH.
             dry_run: If true, do not commit any changes.
+            statistics_cache: The local cache of the monthly statistics, if any.
+            link_pictures: If true, copied pictures are hard links to the original
+                files rather than byte copies (each still gets its own ``b_file`` row).
+            file_index: The local index of uploaded images.  If given, an image
+                that was uploaded before (or repeats within a run) reuses the
+                existing ``b_file`` record instead of being uploaded again.
         """
         self._db = database_client
         self._ssh = ssh_file_manager
         self._dry_run = dry_run
+        self._statistics_cache = statistics_cache
+        self._link_pictures = link_pictures
+        self._file_index = file_index
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def close(self) -> None:
+        """Release the resources held by the service (e.g. the shared SSH connection)."""
+        if self._ssh is not None:
+            await self._ssh.close()
+        if self._statistics_cache is not None:
+            self._statistics_cache.close()
+        if self._file_index is not None:
+            self._file_index.close()
+        if self._executor is not None:
+            self._executor.shutdown()
 
     async def get_event(self, event_url: str) -> Event:
         """Resolve an event URL to an Event instance.
@@ -49,38 +86,67 @@ class GogolCLIService:
         """
         LOGGER.info("Getting event from %s ...", event_url)
 
-        url_without_query = event_url.split("?")[0]
-
-        event_id_match = re.search(r"/(\d+)/?$", url_without_query)
-        if event_id_match is None:
-            raise GogolCLIException(f"Invalid event URL: {event_url}")
-        event_id = event_id_match.group(1)
-
-        event = await self._db.get_event_by_id(event_id)
+        event = await self._db.get_event_by_id(_parse_event_id(event_url))
 
         LOGGER.info("Finished getting event from %s", event_url)
 
         return event
 
-    async def _copy_picture(self, session: AsyncSession, picture_id: int | None) -> int:
-        """Fetch file metadata, copy the physical file via SSH, insert new DB record.
+    async def get_events(self, event_urls: list[str]) -> list[Event]:
+        """Resolve several event URLs to Event instances with a single query.
+
+        Args:
+            event_urls: The full URLs of the event pages.
+
+        Returns:
+            The Events fetched from the database, in the order of *event_urls*.
+        """
+        LOGGER.info("Getting %d event(s) ...", len(event_urls))
+
+        event_ids = [_parse_event_id(event_url) for event_url in event_urls]
+        events = await self._db.get_events_by_ids(event_ids)
+
+        LOGGER.info("Finished getting %d event(s)", len(event_urls))
+
+        return events
+
+    async def _copy_pictures(
+        self, session: AsyncSession, picture_ids: list[int | None]
+    ) -> list[int]:
+        """Fetch file metadata, copy the physical files via SSH, insert new DB records.
 
-        Returns the new file ID.
+        All files are copied with a single remote command.
+
+        Returns the new file IDs, in the order of *picture_ids*.
         """
-        if picture_id is None:
+        if any(picture_id is None for picture_id in picture_ids):
             raise ValueError("Cannot copy picture: picture_id is None")
 
-        old_file = await self._db.get_file_by_id(session, picture_id)
-        new_subdir = self._db.generate_new_subdir()
+        old_files = await self._db.get_files_by_ids(
+            session, [picture_id for picture_id in picture_ids if picture_id is not None]
+        )
+        new_subdirs = [self._db.generate_new_subdir() for _ in old_files]
 
         if not self._dry_run:
             if self._ssh is None:
                 raise SSHNotConfiguredError(
                     "An SSH file manager is required to copy pictures but was not provided."
                 )
-            await self._ssh.copy_file(old_file, new_subdir)
+            linked = await self._ssh.copy_files(
+                list(zip(old_files, new_subdirs)), hardlink=self._link_pictures
+            )
+            if self._link_pictures:
+                LOGGER.info(
+                    "Linked %d of %d picture(s), saved %d bytes",
+                    sum(linked),
+                    len(linked),
+                    sum(file.file_size for file, is_linked in zip(old_files, linked) if is_linked),
+                )
 
-        return await self._db.insert_file_copy(session, picture_id, new_subdir)
+        return await self._db.insert_file_copies(
+            session,
+            [(old_file.id, new_subdir) for old_file, new_subdir in zip(old_files, new_subdirs)],
+        )
 
     async def pin_event(self, event: Event) -> None:
         """Create a pin element for the given event, copying its preview picture.
@@ -88,17 +154,37 @@ class GogolCLIService:
         Args:
             event: The event to pin.
         """
-        LOGGER.info("Pinning event %s ...", event.id)
+        await self.pin_events([event])
+
+    async def pin_events(self, events: list[Event]) -> None:
+        """Create pin elements for the given events in one transaction.
+
+        The preview pictures of all events are copied with a single remote
+        command, and the pins and their properties are inserted with batched
+        statements.
+
+        Args:
+            events: The events to pin.
+        """
+        event_ids = ", ".join(str(event.id) for event in events)
+        LOGGER.info("Pinning event(s) %s ...", event_ids)
 
         async with self._db.session() as session:
-            preview_picture_id = await self._copy_picture(session, event.preview_picture)
-            pin_id = await self._db.insert_pin(session, event, preview_picture_id)
-            await self._db.set_pin_properties(session, event, pin_id)
+            preview_picture_ids = await self._copy_pictures(
+                session, [event.preview_picture for event in events]
+            )
+            pin_ids = await self._db.insert_pins(session, events, preview_picture_ids)
+
+            writer = self._db.property_writer(session)
+            for event, pin_id in zip(events, pin_ids):
+                self._db.set_pin_properties(writer, event, pin_id)
+            await writer.flush()
+            await self._db.set_xml_ids(session, pin_ids)
 
             if not self._dry_run:
                 await session.commit()
 
-        LOGGER.info("Finished pinning event %s", event.id)
+        LOGGER.info("Finished pinning event(s) %s", event_ids)
 
     async def copy_event(
         self,
@@ -115,45 +201,80 @@ class GogolCLIService:
             new_event_time_str: The time for the new event in HH-MM format.
             new_price: The ticket price for the new event, or None to keep the original.
         """
-        LOGGER.info("Copying event %s to %s ...", event.id, new_event_date_str)
+        await self.copy_event_to_dates(event, [new_event_date_str], new_event_time_str, new_price)
 
-        new_event_date = datetime.strptime(new_event_date_str, const.DATE_FORMAT)
+    async def copy_event_to_dates(
+        self,
+        event: Event,
+        new_event_date_strs: list[str],
+        new_event_time_str: str,
+        new_price: str | None,
+    ) -> None:
+        """Copy an event to several new dates in one transaction.
 
-        async with self._db.session() as session:
-            preview_picture_id = await self._copy_picture(session, event.preview_picture)
-            detail_picture_id = await self._copy_picture(session, event.detail_picture)
+        The source properties are read once, all pictures are copied with a
+        single remote command, and the new events are inserted with batched
+        statements.
 
-            new_event_id = await self._db.insert_event_copy(
-                session,
-                event,
-                preview_picture_id,
-                detail_picture_id,
-                new_event_date,
-                new_event_time_str,
+        Args:
+            event: The source event to copy.
+            new_event_date_strs: The dates for the new events in YYYY-MM-DD format.
+            new_event_time_str: The time for the new events in HH-MM format.
+            new_price: The ticket price for the new events, or None to keep the original.
+        """
+        dates = ", ".join(new_event_date_strs)
+        LOGGER.info("Copying event %s to %s ...", event.id, dates)
+
+        copies = [
+            EventCopy(
+                date=datetime.strptime(new_event_date_str, const.DATE_FORMAT),
+                time=new_event_time_str,
+                price=new_price,
             )
-            await self._db.set_event_properties(
-                session,
-                event,
-                new_event_id,
-                new_event_date,
-                new_event_time_str,
-                new_price,
+            for new_event_date_str in new_event_date_strs
+        ]
+
+        async with self._db.session() as session:
+            old_properties = await self._db.get_element_properties(session, event.id)
+
+            picture_ids = await self._copy_pictures(
+                session, [event.preview_picture, event.detail_picture] * len(copies)
             )
-            await self._db.add_element_to_section(
-                session, new_event_id, const.EVENT_IBLOCK_SECTION_ID
+            for i, copy in enumerate(copies):
+                copy.preview_picture_id = picture_ids[2 * i]
+                copy.detail_picture_id = picture_ids[2 * i + 1]
+
+            new_event_ids = await self._db.insert_event_copies(session, event, copies)
+
+            writer = self._db.property_writer(session)
+            for new_event_id, copy in zip(new_event_ids, copies):
+                self._db.set_event_properties(writer, old_properties, new_event_id, copy)
+            await writer.flush()
+
+            await self._db.add_elements_to_section(
+                session, new_event_ids, const.EVENT_IBLOCK_SECTION_ID
             )
+            await self._db.set_xml_ids(session, new_event_ids)
 
             if not self._dry_run:
                 await session.commit()
 
-        LOGGER.info("Finished copying event %s to %s", event.id, new_event_date_str)
+        LOGGER.info("Finished copying event %s to %s", event.id, dates)
 
-    async def export(self, month_number: int, year_suffix: str) -> list[dict[str, int]]:
+    async def export(
+        self, month_number: int, year_suffix: str, refresh: bool = False
+    ) -> list[dict[str, int]]:
         """Collect activity statistics for the given month.
 
+        With a statistics cache, a closed month is counted only once and then
+        served from the cache, and the file counts of the current month are
+        advanced incrementally (so files deleted meanwhile are still counted
+        until the month is recounted).
+
         Args:
             month_number: The calendar month number (1–12).
             year_suffix: The last two digits of the year (e.g. ``"25"``).
+            refresh: If true, drop the cached counts of the month and recount it.
 
         Returns:
             A list of dicts with ``what`` and ``cnt`` keys.
@@ -161,12 +282,141 @@ class GogolCLIService:
         LOGGER.info("Exporting monthly statistics for %s/%s ...", month_number, year_suffix)
 
         start_date, end_date = self._get_start_and_end_dates(month_number, year_suffix)
-        statistics = await self._db.export_statistics(start_date, end_date)
+        if self._statistics_cache is None:
+            statistics = await self._db.export_statistics(start_date, end_date)
+        else:
+            statistics = await self._export_cached(
+                self._statistics_cache, start_date, end_date, refresh
+            )
 
         LOGGER.info("Finished exporting monthly statistics for %s/%s", month_number, year_suffix)
 
         return statistics
 
+    async def _export_cached(
+        self,
+        cache: StatisticsCache,
+        start_date: datetime,
+        end_date: datetime,
+        refresh: bool,
+    ) -> list[dict[str, int]]:
+        """Collect the statistics of a month through the local cache."""
+        month = start_date.strftime("%Y-%m")
+
+        if refresh:
+            cache.clear(month)
+        elif cache.is_closed(month):
+            LOGGER.info("Using cached statistics for %s", month)
+            return _statistics_rows(cache.get_counts(month).values())
+
+        if datetime.now() > end_date:
+            # The month is over: count it in full once and keep the result for good
+            statistics = await self._db.export_statistics(start_date, end_date)
+            cache.save(month, [StatisticsCount.model_validate(row) for row in statistics], True)
+            return statistics
+
+        # The month is still open: recount the mutable sources and only count
+        # the rows inserted since the last export for the incremental ones
+        cached = cache.get_counts(month)
+        recounted, *incremental = await asyncio.gather(
+            self._db.export_statistics(start_date, end_date, skip=const.INCREMENTAL_STATISTICS),
+            *(
+                self._db.count_statistics_since(
+                    what, start_date, end_date, cached[what].last_id if what in cached else None
+                )
+                for what in const.INCREMENTAL_STATISTICS
+            ),
+        )
+
+        counts = [StatisticsCount.model_validate(row) for row in recounted]
+        for new in incremental:
+            old = cached.get(new.what)
+            if old is None or old.last_id is None:
+                counts.append(new)
+            elif new.last_id is None:
+                # Nothing new since the old mark: the old count still stands
+                counts.append(old)
+            else:
+                new.cnt += old.cnt
+                counts.append(new)
+
+        cache.save(month, counts, False)
+        return _statistics_rows(counts)
+
+    async def explain_export(self, month_number: int, year_suffix: str) -> dict[str, list[dict]]:
+        """Get the query plans used to collect activity statistics for the given month.
+
+        Args:
+            month_number: The calendar month number (1–12).
+            year_suffix: The last two digits of the year (e.g. ``"25"``).
+
+        Returns:
+            A mapping of each statistics label to the ``EXPLAIN`` rows of its query.
+        """
+        start_date, end_date = self._get_start_and_end_dates(month_number, year_suffix)
+        return await self._db.explain_statistics(start_date, end_date)
+
+    async def export_breakdown(
+        self, first_month: datetime, last_month: datetime, granularity: Granularity
+    ) -> list[dict[str, int | str]]:
+        """Collect activity statistics for a range of months, broken down into periods.
+
+        The breakdown is always read from the database; the statistics cache
+        only holds whole months.
+
+        Args:
+            first_month: Any date in the first month of the range.
+            last_month: Any date in the last month of the range.
+            granularity: The size of the periods.
+
+        Returns:
+            A list of dicts with ``what``, ``bucket`` and ``cnt`` keys: one per
+            statistics source and period of the range, in period order, with
+            zero counts for periods without activity.
+        """
+        LOGGER.info(
+            "Exporting %s statistics for %s–%s ...",
+            granularity.value,
+            first_month.strftime("%m.%Y"),
+            last_month.strftime("%m.%Y"),
+        )
+
+        start_date, end_date = _month_range(first_month, last_month)
+        rows = await self._db.export_statistics_breakdown(start_date, end_date, granularity)
+
+        counts = {(row["what"], row["bucket"]): row["cnt"] for row in rows}
+        whats = sorted({row["what"] for row in rows} | set(const.STATISTICS_LABELS))
+        statistics: list[dict[str, int | str]] = [
+            {"what": what, "bucket": bucket, "cnt": counts.get((what, bucket), 0)}
+            for bucket in _buckets(start_date, end_date, granularity)
+            for what in whats
+        ]
+
+        LOGGER.info(
+            "Finished exporting %s statistics for %s–%s",
+            granularity.value,
+            first_month.strftime("%m.%Y"),
+            last_month.strftime("%m.%Y"),
+        )
+
+        return statistics
+
+    async def explain_export_breakdown(
+        self, first_month: datetime, last_month: datetime, granularity: Granularity
+    ) -> dict[str, list[dict]]:
+        """Get the query plans used to collect the statistics breakdown of a range of months.
+
+        Args:
+            first_month: Any date in the first month of the range.
+            last_month: Any date in the last month of the range.
+            granularity: The size of the periods.
+
+        Returns:
+            A mapping of each statistics label to the ``EXPLAIN`` rows of its query.
+        """
+        start_date, end_date = _month_range(first_month, last_month)
+        return await self._db.explain_statistics(start_date, end_date, granularity)
+
     @staticmethod
     def _get_start_and_end_dates(month_number: int, year_suffix: str) -> tuple[datetime, datetime]:
         """Get start and end dates for monthly statistics."""
@@ -185,12 +435,15 @@ class GogolCLIService:
 
         return start_date, next_month_start_date
 
-    async def copy_chronograph(self, month_number: int, year_suffix: str) -> None:
+    async def copy_chronograph(self, month_number: int, year_suffix: str) -> ChronographCopyResult:
         """Create a new chronograph section for the given month and copy entries from 5 years ago.
 
         Args:
             month_number: The calendar month number (1–12).
             year_suffix: The last two digits of the target year (e.g. ``"25"``).
+
+        Returns:
+            The number of rows changed by each step of the copy.
         """
         LOGGER.info("Copying chronograph for %s/%s ...", month_number, year_suffix)
 
@@ -207,59 +460,44 @@ class GogolCLIService:
             old_id = await self._db.get_chronograph_section_by_name(session, old_section_name)
             new_id = await self._db.get_chronograph_section_by_name(session, new_section_name)
 
-            await self._db.copy_chronograph_section(session, old_id, new_id)
+            result = await self._db.copy_chronograph_section(session, old_id, new_id)
 
             if not self._dry_run:
                 await session.commit()
 
         LOGGER.info("Finished copying chronograph for %s/%s", month_number, year_suffix)
+        return result
 
     async def create_exhibition(
         self,
         parsed: ParsedExhibition,
         active_from: datetime,
-    ) -> None:
+    ) -> int:
         """Create an exhibition and its books from parsed docx data.
 
-        Uploads cover images via SSH, inserts file records, creates a section
-        for books, inserts the exhibition element and one book element per book,
-        and sets the bibliographic properties on each book.
+        Uploads cover images via SSH first, then, in one short transaction,
+        inserts file records, creates a section for books, inserts the exhibition
+        element and one book element per book, and sets the bibliographic
+        properties on each book.
 
         Args:
             parsed: The exhibition data produced by ``parse_exhibition_folder``.
             active_from: The ``active_from`` datetime to set on all created elements.
-        """
-        from PIL import Image
 
+        Returns:
+            The ID of the exhibition element.
+        """
         LOGGER.info("Creating exhibition '%s' ...", parsed.title)
 
-        async with self._db.session() as session:
-            if not self._dry_run and self._ssh is None:
-                raise SSHNotConfiguredError(
-                    "An SSH file manager is required to upload images " "but was not provided."
-                )
-
-            ssh = self._ssh
+        # --- Images (uploaded concurrently before the transaction starts) ---
+        illustration, *covers = await self._prepare_images(
+            [parsed.illustration, *(book.cover for book in parsed.books)]
+        )
 
+        # All network I/O is done; keep the transaction (and its row locks) short.
+        async with self._db.session() as session:
             # --- Illustration ---
-            illus_subdir = self._db.generate_new_subdir()
-            if not self._dry_run:
-                assert ssh is not None
-                await ssh.upload_file(
-                    parsed.illustration_data, illus_subdir, parsed.illustration_filename
-                )
-            with Image.open(io.BytesIO(parsed.illustration_data)) as img:
-                illus_w, illus_h = img.width, img.height
-            illus_ct = _content_type(parsed.illustration_filename)
-            illus_file_id = await self._db.insert_new_file(
-                session,
-                illus_subdir,
-                parsed.illustration_filename,
-                illus_ct,
-                illus_w,
-                illus_h,
-                len(parsed.illustration_data),
-            )
+            illus_file_id = await self._insert_image(session, illustration)
 
             # --- Book section (created first so we have section_id for properties) ---
             section_id = await self._db.insert_book_section(session, parsed.title)
@@ -274,28 +512,14 @@ class GogolCLIService:
                 detail_picture_id=illus_file_id,
                 active_from=active_from,
             )
-            await self._db.set_exhibition_properties(
-                session, exhibition_id, section_id, active_from
-            )
+            # Property rows are buffered and written together after the books.
+            writer = self._db.property_writer(session)
+            self._db.set_exhibition_properties(writer, exhibition_id, section_id, active_from)
 
             # --- Books ---
-            for book in parsed.books:
-                cover_subdir = self._db.generate_new_subdir()
-                if not self._dry_run:
-                    assert ssh is not None
-                    await ssh.upload_file(book.cover_data, cover_subdir, book.cover_filename)
-                with Image.open(io.BytesIO(book.cover_data)) as img:
-                    cover_w, cover_h = img.width, img.height
-                cover_ct = _content_type(book.cover_filename)
-                cover_file_id = await self._db.insert_new_file(
-                    session,
-                    cover_subdir,
-                    book.cover_filename,
-                    cover_ct,
-                    cover_w,
-                    cover_h,
-                    len(book.cover_data),
-                )
+            element_ids = [exhibition_id]
+            for book, cover in zip(parsed.books, covers):
+                cover_file_id = await self._insert_image(session, cover)
                 book_id = await self._db.insert_book_element(
                     session,
                     title=book.bib.title,
@@ -307,8 +531,9 @@ class GogolCLIService:
                     active_from=active_from,
                     sort=book.sort,
                 )
-                await self._db.set_book_properties(
-                    session,
+                element_ids.append(book_id)
+                self._db.set_book_properties(
+                    writer,
                     book_id=book_id,
                     full_bib_text=_php_serialize_bib(book.bib.full_text),
                     author=book.bib.author,
@@ -317,8 +542,12 @@ class GogolCLIService:
                     year=book.bib.year,
                 )
 
+            await writer.flush()
+            await self._db.set_xml_ids(session, element_ids)
+
             if not self._dry_run:
                 await session.commit()
+                self._index_uploaded_images([illustration, *covers])
 
         LOGGER.info(
             "Finished creating exhibition '%s' (id=%d, books=%d)",
@@ -326,50 +555,42 @@ class GogolCLIService:
             exhibition_id,
             len(parsed.books),
         )
+        return exhibition_id
 
     async def create_virtual_exhibition(
         self,
         parsed: ParsedVirtualExhibition,
-    ) -> None:
+    ) -> int:
         """Create a virtual exhibition and upload its images via SSH.
 
-        Resizes images whose largest dimension exceeds the configured maximum,
-        uploads each image to the remote server, inserts file records in the
-        database, and stores the exhibition element together with all item
+        Resizes images whose largest dimension exceeds the configured maximum
+        and uploads each image to the remote server.  Only once every upload has
+        finished does it open one short transaction that inserts the file
+        records and stores the exhibition element together with all item
         properties.
 
         Args:
             parsed: The virtual exhibition data produced by
                 ``parse_virtual_exhibition_folder``.
+
+        Returns:
+            The ID of the virtual exhibition element.
         """
         LOGGER.info("Creating virtual exhibition '%s' …", parsed.title)
 
-        async with self._db.session() as session:
-            if not self._dry_run and self._ssh is None:
-                raise SSHNotConfiguredError(
-                    "An SSH file manager is required to upload images but was not provided."
-                )
+        max_dim = const.VIRTUAL_EXHIBITION_MAX_IMAGE_DIM
 
-            ssh = self._ssh
+        # ── Images (uploaded concurrently before the transaction starts) ─────
+        preview, *images = await self._prepare_images(
+            [parsed.preview_image, *(image for item in parsed.items for image in item.images)],
+            max_dim,
+        )
+        item_images = _regroup(images, [len(item.images) for item in parsed.items])
 
+        # All network I/O is done; keep the transaction (and its row locks) short.
+        async with self._db.session() as session:
             # ── Preview / detail image ───────────────────────────────────────
-            preview_data, preview_w, preview_h = _resize_image(
-                parsed.preview_image_data, const.VIRTUAL_EXHIBITION_MAX_IMAGE_DIM
-            )
-            preview_subdir = self._db.generate_new_subdir()
-            if not self._dry_run:
-                assert ssh is not None
-                await ssh.upload_file(preview_data, preview_subdir, parsed.preview_image_filename)
-            preview_ct = _content_type(parsed.preview_image_filename)
-            preview_file_id = await self._db.insert_new_file(
-                session,
-                preview_subdir,
-                parsed.preview_image_filename,
-                preview_ct,
-                preview_w,
-                preview_h,
-                len(preview_data),
-            )
+            preview_file_id = await self._insert_image(session, preview)
 
             # ── Exhibition element ───────────────────────────────────────────
             # The element is active from today until one day after the display end date.
@@ -385,8 +606,10 @@ class GogolCLIService:
                 active_from=element_active_from,
                 active_to=element_active_to,
             )
-            await self._db.set_virtual_exhibition_properties(
-                session,
+            # Property rows are buffered and written together with the item properties.
+            writer = self._db.property_writer(session)
+            self._db.set_virtual_exhibition_properties(
+                writer,
                 element_id=exhibition_id,
                 subtitle=parsed.subtitle,
                 active_from=parsed.active_from,
@@ -394,39 +617,26 @@ class GogolCLIService:
             )
 
             # ── Items ────────────────────────────────────────────────────────
-            for item in parsed.items:
-                image_file_ids: list[int] = []
-                for img_data, img_filename in item.images:
-                    resized_data, img_w, img_h = _resize_image(
-                        img_data, const.VIRTUAL_EXHIBITION_MAX_IMAGE_DIM
-                    )
-                    img_subdir = self._db.generate_new_subdir()
-                    if not self._dry_run:
-                        assert ssh is not None
-                        await ssh.upload_file(resized_data, img_subdir, img_filename)
-                    img_ct = _content_type(img_filename)
-                    file_id = await self._db.insert_new_file(
-                        session,
-                        img_subdir,
-                        img_filename,
-                        img_ct,
-                        img_w,
-                        img_h,
-                        len(resized_data),
-                    )
-                    image_file_ids.append(file_id)
-
-                await self._db.insert_virtual_exhibition_item(
-                    session,
-                    exhibition_id=exhibition_id,
-                    name=item.name,
-                    bib_html=_php_serialize_html(item.bib_text),
-                    description_html=_php_serialize_html(item.description),
-                    image_file_ids=image_file_ids,
+            items = [
+                (
+                    item.name,
+                    _php_serialize_html(item.bib_text),
+                    _php_serialize_html(item.description),
+                    [await self._insert_image(session, img) for img in images_of_item],
                 )
+                for item, images_of_item in zip(parsed.items, item_images)
+            ]
+            name_property_ids = await self._db.insert_virtual_exhibition_items(
+                writer, exhibition_id, items
+            )
+            await writer.flush()
+
+            await self._db.set_xml_ids(session, [exhibition_id])
+            await self._db.set_scp_keys(session, name_property_ids)
 
             if not self._dry_run:
                 await session.commit()
+                self._index_uploaded_images([preview, *images])
 
         LOGGER.info(
             "Finished creating virtual exhibition '%s' (id=%d, items=%d)",
@@ -434,6 +644,244 @@ class GogolCLIService:
             exhibition_id,
             len(parsed.items),
         )
+        return exhibition_id
+
+    async def _prepare_images(
+        self, sources: list[ImageRef], max_dim: int | None = None
+    ) -> list[PreparedImage]:
+        """Process images in the process pool and upload each one as soon as it is ready.
+
+        The images are read, resized (if *max_dim* is given) and measured in
+        worker processes, one image per core at a time, so the event loop stays
+        free; every upload starts as soon as its image is done, bounded by the
+        SSH manager's upload limit.  An image that is not resized is streamed
+        from its source; a resized one is held in memory only from the end of
+        its processing to the end of its upload.
+
+        With a file index, an image whose source contents were uploaded before
+        (with the same *max_dim*) reuses the existing ``b_file`` record and is
+        neither processed nor uploaded again, and an image repeated in *sources*
+        is processed and uploaded once.  If an image fails, the jobs of the
+        others are cancelled before the error is raised.
+
+        Args:
+            sources: The source images.
+            max_dim: The maximum width and height of the uploaded images, if any.
+
+        Returns:
+            The prepared images, in the order of *sources*.
+        """
+        ssh = None
+        if not self._dry_run:
+            if self._ssh is None:
+                raise SSHNotConfiguredError(
+                    "An SSH file manager is required to upload images but was not provided."
+                )
+            ssh = self._ssh
+
+        # Without a file index every image is a job of its own; with one,
+        # images are keyed by their contents and identical images share a job.
+        keys: list[str | None] = [None] * len(sources)
+        job_keys: list[str | int] = list(range(len(sources)))
+        reused: dict[str, PreparedImage] = {}
+        if self._file_index is not None:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            keys = job_keys = list(
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, content_key, source, max_dim)
+                        for source in sources
+                    )
+                )
+            )
+            reused = await self._find_uploaded_images(keys)
+
+        jobs: dict[str | int, asyncio.Task[PreparedImage]] = {}
+        for job_key, key, source in zip(job_keys, keys, sources):
+            if key not in reused and job_key not in jobs:
+                jobs[job_key] = asyncio.create_task(self._prepare_image(ssh, source, key, max_dim))
+
+        try:
+            done = dict(zip(jobs, await asyncio.gather(*jobs.values())))
+        except BaseException:
+            # Don't leave the other jobs processing and uploading after a failure.
+            for job in jobs.values():
+                job.cancel()
+            await asyncio.gather(*jobs.values(), return_exceptions=True)
+            raise
+        LOGGER.info("Prepared %d image(s), reused %d", len(done), len(sources) - len(done))
+
+        return [
+            reused[key] if key in reused else done[job_key] for job_key, key in zip(job_keys, keys)
+        ]
+
+    async def _prepare_image(
+        self,
+        ssh: SSHFileManager | None,
+        source: ImageRef,
+        key: str | None,
+        max_dim: int | None,
+    ) -> PreparedImage:
+        """Process one image in the process pool, then upload it unless *ssh* is None."""
+        loop = asyncio.get_running_loop()
+        data, width, height = await loop.run_in_executor(
+            self._get_executor(), process_image_file, source, max_dim
+        )
+
+        image = PreparedImage(
+            digest=key,
+            subdir=self._db.generate_new_subdir(),
+            filename=source.filename,
+            content_type=_content_type(source.filename),
+            width=width,
+            height=height,
+            file_size=source.file_size if data is None else len(data),
+        )
+        if ssh is not None:
+            if data is None:
+                # Unchanged images are streamed from the source file (or .docx member).
+                await ssh.stream_file(source, image.subdir, image.filename)
+            else:
+                await ssh.upload_file(data, image.subdir, image.filename)
+        return image
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the process pool for image processing, starting it on first use."""
+        if self._executor is None:
+            # Spawned, not forked: batch runs parse folders in other threads.
+            self._executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def _find_uploaded_images(self, keys: list[str]) -> dict[str, PreparedImage]:
+        """Look up images that were uploaded before in the file index.
+
+        Index entries are checked against ``b_file`` in one query; entries whose
+        record is gone (or points to another file) are dropped from the index.
+
+        Args:
+            keys: The content keys of the images.
+
+        Returns:
+            The images built from their existing ``b_file`` records, by content
+            key; empty without a file index.
+        """
+        if self._file_index is None:
+            return {}
+
+        indexed = self._file_index.get(set(keys))
+        if not indexed:
+            return {}
+
+        async with self._db.session() as session:
+            files = await self._db.find_files(session, [entry[0] for entry in indexed.values()])
+
+        reused: dict[str, PreparedImage] = {}
+        stale: list[str] = []
+        for key, (file_id, subdir, file_name) in indexed.items():
+            file = files.get(file_id)
+            if file is None or (file.subdir, file.file_name) != (subdir, file_name):
+                stale.append(key)
+                continue
+            reused[key] = PreparedImage(
+                digest=key,
+                subdir=file.subdir,
+                filename=file.file_name,
+                content_type=file.content_type,
+                width=file.width,
+                height=file.height,
+                file_size=file.file_size,
+                file_id=file.id,
+            )
+
+        if stale:
+            LOGGER.info("Dropping %d stale file index entry(ies)", len(stale))
+            self._file_index.forget(stale)
+
+        return reused
+
+    def _index_uploaded_images(self, images: list[PreparedImage]) -> None:
+        """Record the ``b_file`` records of committed images in the file index, if any."""
+        if self._file_index is None:
+            return
+
+        entries = {
+            image.digest: (image.digest, image.file_id, image.subdir, image.filename)
+            for image in images
+            if image.digest is not None and image.file_id is not None
+        }
+        self._file_index.save(list(entries.values()))
+
+    async def _insert_image(self, session: AsyncSession, image: PreparedImage) -> int:
+        """Insert the ``b_file`` record of an image (unless it has one) and return its ID."""
+        if image.file_id is None:
+            image.file_id = await self._db.insert_new_file(
+                session,
+                image.subdir,
+                image.filename,
+                image.content_type,
+                image.width,
+                image.height,
+                image.file_size,
+            )
+        return image.file_id
+
+
+def _month_range(first_month: datetime, last_month: datetime) -> tuple[datetime, datetime]:
+    """Get the start of *first_month* and the start of the month after *last_month*."""
+    start_date = datetime(first_month.year, first_month.month, 1)
+    end_date = datetime(last_month.year + last_month.month // 12, last_month.month % 12 + 1, 1)
+    return start_date, end_date
+
+
+def _buckets(start_date: datetime, end_date: datetime, granularity: Granularity) -> list[str]:
+    """List the labels of the periods between *start_date* and *end_date* (exclusive).
+
+    The labels match the ``DATE_FORMAT`` buckets of the statistics breakdown queries.
+    """
+    buckets: list[str] = []
+    day = start_date
+    while day < end_date:
+        if granularity is Granularity.MONTH:
+            bucket = day.strftime("%Y-%m")
+        elif granularity is Granularity.WEEK:
+            iso_year, iso_week, _ = day.isocalendar()
+            bucket = f"{iso_year}-W{iso_week:02d}"
+        else:
+            bucket = day.strftime(const.DATE_FORMAT)
+        if not buckets or buckets[-1] != bucket:
+            buckets.append(bucket)
+        day += timedelta(days=1)
+    return buckets
+
+
+def _regroup(items: list[PreparedImage], sizes: list[int]) -> list[list[PreparedImage]]:
+    """Split a flat list back into consecutive groups of the given sizes."""
+    groups: list[list[PreparedImage]] = []
+    start = 0
+    for size in sizes:
+        groups.append(items[start : start + size])
+        start += size
+    return groups
+
+
+def _parse_event_id(event_url: str) -> str:
+    """Extract the numeric event ID from an event page URL."""
+    url_without_query = event_url.split("?")[0]
+
+    event_id_match = re.search(r"/(\d+)/?$", url_without_query)
+    if event_id_match is None:
+        raise GogolCLIException(f"Invalid event URL: {event_url}")
+    return event_id_match.group(1)
+
+
+def _statistics_rows(counts: Iterable[StatisticsCount]) -> list[dict[str, int]]:
+    """Convert statistics counts to ``what``/``cnt`` rows, omitting sources without activity."""
+    return [
+        {"what": count.what, "cnt": count.cnt}
+        for count in sorted(counts, key=lambda count: count.what)
+        if count.cnt
+    ]
 
 
 def _content_type(filename: str) -> str:
@@ -457,25 +905,3 @@ def _php_serialize_html(text: str) -> str:
     """Serialise an HTML string to the PHP ``a:2:{...}`` format stored in item props."""
     byte_len = len(text.encode("utf-8"))
     return f'a:2:{{s:4:"TEXT";s:{byte_len}:"{text}";s:4:"TYPE";s:4:"HTML";}}'
-
-
-def _resize_image(data: bytes, max_dim: int) -> tuple[bytes, int, int]:
-    """Resize *data* so the largest dimension does not exceed *max_dim*.
-
-    Returns:
-        (resized_bytes, width, height)  – original bytes if no resize needed.
-    """
-    from PIL import Image
-
-    with Image.open(io.BytesIO(data)) as img:
-        orig_format = img.format or "JPEG"
-        w, h = img.width, img.height
-        if max(w, h) <= max_dim:
-            return data, w, h
-        ratio = max_dim / max(w, h)
-        new_w = max(1, int(w * ratio))
-        new_h = max(1, int(h * ratio))
-        resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-        buf = io.BytesIO()
-        resized.save(buf, format=orig_format, quality=90)
-        return buf.getvalue(), new_w, new_h
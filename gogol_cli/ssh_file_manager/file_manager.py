@@ -1,25 +1,136 @@
 """Service to manage files via SSH."""
 
+import asyncio
 import logging
+import shlex
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
 
 import asyncssh
 
-from gogol_cli.schemas import File
+from gogol_cli import constants as const
+from gogol_cli.exceptions import SSHCopyError
+from gogol_cli.schemas import File, ImageRef
 from gogol_cli.ssh_file_manager.schemas import SSHConfig
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Errors that mean the shared connection is gone and should be re-established.
+_RECONNECT_ERRORS = (
+    asyncssh.DisconnectError,
+    asyncssh.ChannelOpenError,
+    asyncssh.SFTPConnectionLost,
+    ConnectionError,
+)
+
 
 class SSHFileManager:
-    """Service to manage files via SSH."""
+    """Service to manage files via SSH.
+
+    A single SSH connection (and a single SFTP channel on top of it) is opened
+    lazily on first use and shared by every subsequent operation.  If the
+    connection drops, it is re-established transparently and the failed
+    operation is retried once.  Call :meth:`close` when done.
+
+    At most ``upload_concurrency`` uploads are in flight at once; callers may
+    start any number of them concurrently.
+    """
 
-    def __init__(self, config: SSHConfig) -> None:
+    def __init__(
+        self,
+        config: SSHConfig,
+        upload_concurrency: int = const.DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> None:
         """Initialize with SSH config.
 
         Args:
             config: The SSH config to use.
+            upload_concurrency: The maximum number of simultaneous SFTP uploads.
         """
+        if upload_concurrency < 1:
+            raise ValueError("upload_concurrency must be at least 1")
+
         self._config = config
+        self._upload_semaphore = asyncio.Semaphore(upload_concurrency)
+        self._conn: asyncssh.SSHClientConnection | None = None
+        self._sftp: asyncssh.SFTPClient | None = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "SSHFileManager":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def _ensure_connection(self) -> asyncssh.SSHClientConnection:
+        """Return the shared connection, opening a new one if needed (call under the lock)."""
+        if self._conn is None or self._conn.is_closed():
+            self._sftp = None
+            LOGGER.info("Connecting to %s ...", self._config.host)
+            self._conn = await asyncssh.connect(
+                self._config.host,
+                username=self._config.username,
+                client_keys=[self._config.key_path],
+            )
+            LOGGER.info("Connected to %s", self._config.host)
+        return self._conn
+
+    async def _get_connection(self) -> asyncssh.SSHClientConnection:
+        """Return the shared SSH connection."""
+        async with self._lock:
+            return await self._ensure_connection()
+
+    async def _get_sftp(self, conn: asyncssh.SSHClientConnection) -> asyncssh.SFTPClient:
+        """Return the shared SFTP client of *conn*, starting it if needed.
+
+        Raises:
+            ConnectionError: If *conn* is no longer the shared connection.
+        """
+        async with self._lock:
+            if conn is not self._conn:
+                raise ConnectionError("The SSH connection was replaced")
+            if self._sftp is None:
+                self._sftp = await conn.start_sftp_client()
+            return self._sftp
+
+    async def _invalidate(self, conn: asyncssh.SSHClientConnection) -> None:
+        """Drop the shared connection if it is still *conn*, so that the next operation reconnects.
+
+        If another operation has already replaced *conn*, the new connection is
+        kept: closing it would break every transfer in flight on it.
+        """
+        async with self._lock:
+            if conn is not self._conn:
+                return
+            self._conn, self._sftp = None, None
+        conn.close()
+
+    async def _with_reconnect(
+        self, operation: Callable[[asyncssh.SSHClientConnection], Awaitable[T]]
+    ) -> T:
+        """Run *operation* on the shared connection, retrying once if the connection was lost."""
+        conn = await self._get_connection()
+        try:
+            return await operation(conn)
+        except _RECONNECT_ERRORS as exc:
+            LOGGER.warning("SSH connection lost (%s), reconnecting ...", exc)
+            await self._invalidate(conn)
+            return await operation(await self._get_connection())
+
+    async def close(self) -> None:
+        """Close the shared SFTP channel and SSH connection, if open."""
+        async with self._lock:
+            conn, sftp = self._conn, self._sftp
+            self._conn, self._sftp = None, None
+
+        if sftp is not None:
+            sftp.exit()
+        if conn is not None:
+            conn.close()
+            await conn.wait_closed()
+            LOGGER.info("Closed SSH connection to %s", self._config.host)
 
     async def copy_file(
         self,
@@ -32,20 +143,87 @@ class SSHFileManager:
             file: The file to copy.
             dst_path: The destination path to copy to.
         """
-        remote_src = f"{self._config.base_path}/{file.subdir}/{file.file_name}"
-        remote_dst = f"{self._config.base_path}/{dst_path}/{file.file_name}"
+        await self.copy_files([(file, dst_path)])
+
+    async def copy_files(
+        self, copies: list[tuple[File, str]], hardlink: bool = False
+    ) -> list[bool]:
+        """Copy several files on the remote server in a single remote command.
+
+        Every destination directory is created and every file copied by one
+        shell script, so a batch costs one round trip instead of two per file.
+        A failing copy does not stop the others.
+
+        Args:
+            copies: Pairs of (file to copy, destination subdir relative to base_path).
+            hardlink: If true, create hard links instead of copying the bytes,
+                falling back to a copy where linking fails (e.g. across filesystems).
+
+        Returns:
+            For each copy, whether it was hard-linked rather than copied.
+
+        Raises:
+            SSHCopyError: If any of the copies failed; the message lists each one.
+        """
+        if not copies:
+            return []
+
+        base_path = self._config.base_path
+        paths = [
+            (
+                f"{base_path}/{file.subdir}/{file.file_name}",
+                f"{base_path}/{dst_path}",
+                f"{base_path}/{dst_path}/{file.file_name}",
+            )
+            for file, dst_path in copies
+        ]
+        script = "\n".join(
+            _copy_script_line(index, remote_src, remote_dir, remote_dst, hardlink)
+            for index, (remote_src, remote_dir, remote_dst) in enumerate(paths)
+        )
+
+        LOGGER.info("Copying %d file(s) ...", len(copies))
+
+        async def _copy(conn: asyncssh.SSHClientConnection) -> asyncssh.SSHCompletedProcess:
+            return await conn.run(script)
+
+        result = await self._with_reconnect(_copy)
+
+        report = str(result.stdout or "").splitlines()
+        if len(report) != len(paths):
+            raise SSHCopyError(
+                f"Remote copy reported {len(report)} of {len(paths)} results: "
+                f"{str(result.stderr or '').strip()}"
+            )
 
-        LOGGER.info(f"Copying file from {remote_src} to {remote_dst}")
+        failures: dict[int, str] = {}
+        linked: set[int] = set()
+        for line in report:
+            index, _, status = line.partition(" ")
+            if status == "LINKED":
+                linked.add(int(index))
+            elif status != "OK":
+                failures[int(index)] = status.removeprefix("ERR").strip()
 
-        async with asyncssh.connect(
-            self._config.host,
-            username=self._config.username,
-            client_keys=[self._config.key_path],
-        ) as conn:
-            await conn.run(f'mkdir -p "{self._config.base_path}/{dst_path}"')
-            await conn.run(f'cp "{remote_src}" "{remote_dst}"')
+        for index, (remote_src, _, remote_dst) in enumerate(paths):
+            if index in failures:
+                LOGGER.error(
+                    "Failed to copy %s to %s: %s", remote_src, remote_dst, failures[index]
+                )
+            elif index in linked:
+                LOGGER.info("Linked file from %s to %s", remote_src, remote_dst)
+            else:
+                LOGGER.info("Copied file from %s to %s", remote_src, remote_dst)
 
-        LOGGER.info("Finished copying file")
+        if failures:
+            details = "; ".join(
+                f"{paths[index][0]}: {message}" for index, message in sorted(failures.items())
+            )
+            raise SSHCopyError(f"Failed to copy {len(failures)} file(s): {details}")
+
+        LOGGER.info("Finished copying %d file(s)", len(copies))
+
+        return [index in linked for index in range(len(paths))]
 
     async def upload_file(self, data: bytes, subdir: str, filename: str) -> None:
         """Upload raw bytes as a new file to the remote server via SFTP.
@@ -58,16 +236,61 @@ class SSHFileManager:
         remote_dir = f"{self._config.base_path}/{subdir}"
         remote_path = f"{remote_dir}/{filename}"
 
-        LOGGER.info("Uploading file to %s ...", remote_path)
+        async def _upload(conn: asyncssh.SSHClientConnection) -> None:
+            sftp = await self._get_sftp(conn)
+            await sftp.makedirs(remote_dir, exist_ok=True)
+            async with sftp.open(remote_path, "wb") as remote_file:
+                await remote_file.write(data)
+
+        async with self._upload_semaphore:
+            LOGGER.info("Uploading file to %s ...", remote_path)
+            await self._with_reconnect(_upload)
+
+        LOGGER.info("Finished uploading file to %s", remote_path)
+
+    async def stream_file(self, source: ImageRef, subdir: str, filename: str) -> None:
+        """Upload a local file (or zip member) to the remote server via SFTP in chunks.
 
-        async with asyncssh.connect(
-            self._config.host,
-            username=self._config.username,
-            client_keys=[self._config.key_path],
-        ) as conn:
-            await conn.run(f'mkdir -p "{remote_dir}"')
-            async with conn.start_sftp_client() as sftp:
+        The source is read ``UPLOAD_CHUNK_SIZE`` bytes at a time, so it is
+        never held in memory as a whole.
+
+        Args:
+            source: The local file to upload.
+            subdir: The subdirectory path relative to base_path.
+            filename: The destination filename.
+        """
+        remote_dir = f"{self._config.base_path}/{subdir}"
+        remote_path = f"{remote_dir}/{filename}"
+
+        async def _upload(conn: asyncssh.SSHClientConnection) -> None:
+            sftp = await self._get_sftp(conn)
+            await sftp.makedirs(remote_dir, exist_ok=True)
+            with source.open() as local_file:
                 async with sftp.open(remote_path, "wb") as remote_file:
-                    await remote_file.write(data)
+                    while chunk := local_file.read(const.UPLOAD_CHUNK_SIZE):
+                        await remote_file.write(chunk)
+
+        async with self._upload_semaphore:
+            LOGGER.info("Uploading file to %s ...", remote_path)
+            await self._with_reconnect(_upload)
 
         LOGGER.info("Finished uploading file to %s", remote_path)
+
+
+def _copy_script_line(
+    index: int, remote_src: str, remote_dir: str, remote_dst: str, hardlink: bool = False
+) -> str:
+    """Build the shell line that copies one file and prints ``<index> OK|LINKED|ERR <message>``.
+
+    With *hardlink*, the file is linked if possible (``LINKED``) and copied otherwise (``OK``).
+    """
+    src, dir_, dst = shlex.quote(remote_src), shlex.quote(remote_dir), shlex.quote(remote_dst)
+    if hardlink:
+        transfer = f"{{ ln -- {src} {dst} 2>/dev/null && echo LINKED || cp -- {src} {dst}; }}"
+    else:
+        transfer = f"cp -- {src} {dst}"
+    return (
+        f"if out=$({{ mkdir -p -- {dir_} && {transfer}; }} 2>&1); "
+        f'then if [ "$out" = LINKED ]; then echo "{index} LINKED"; else echo "{index} OK"; fi; '
+        f'else echo "{index} ERR $(printf %s "$out" | tr "\\n" " ")"; fi'
+    )
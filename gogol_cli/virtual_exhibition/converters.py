@@ -0,0 +1,198 @@
+"""Converters of legacy word-processor documents (.doc/.rtf) to .docx."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from abc import ABC, abstractmethod
+from functools import cache
+from pathlib import Path
+
+from gogol_cli import constants as const
+from gogol_cli.local_cache import user_cache_dir
+
+LOGGER = logging.getLogger(__name__)
+
+# Where LibreOffice is installed on macOS when it is not on the PATH.
+_MACOS_SOFFICE = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
+
+
+class AbstractDocConverter(ABC):
+    """Abstract converter of .doc/.rtf documents to .docx."""
+
+    @abstractmethod
+    def convert(self, paths: list[str], out_dir: str) -> list[str]:
+        """Convert documents to .docx.
+
+        Args:
+            paths: The documents to convert.
+            out_dir: The directory to write the converted documents to.
+
+        Returns:
+            The paths of the converted documents, in the order of *paths*.
+
+        Raises:
+            RuntimeError: If the conversion tool is missing or fails.
+        """
+
+
+class LibreOfficeConverter(AbstractDocConverter):
+    """Converts documents with LibreOffice running headless.
+
+    All documents of a call are converted by one ``soffice`` run.  The
+    LibreOffice user profile is kept in the CLI cache directory rather than
+    created anew for every run, which is what makes a cold start slow.  Runs
+    sharing the profile must not overlap: the runs of one converter are
+    serialised (e.g. between the folder parser threads of a batch run), but a
+    converter should not be used from several processes at once.
+    """
+
+    def __init__(self, binary: str, profile_dir: Path | None = None) -> None:
+        """Initialize the converter.
+
+        Args:
+            binary: The path of the ``soffice`` executable.
+            profile_dir: The LibreOffice user profile directory.  Default:
+                ``libreoffice-profile`` in the user cache directory.
+        """
+        self._binary = binary
+        self._profile_dir = profile_dir or user_cache_dir() / const.LIBREOFFICE_PROFILE_DIR_NAME
+        self._lock = threading.Lock()
+
+    def convert(self, paths: list[str], out_dir: str) -> list[str]:
+        """Convert documents to .docx with as few soffice runs as possible.
+
+        Args:
+            paths: The documents to convert.
+            out_dir: The directory to write the converted documents to.
+
+        Returns:
+            The paths of the converted documents, in the order of *paths*.
+
+        Raises:
+            RuntimeError: If LibreOffice fails to convert any of the documents.
+        """
+        # soffice names each output after its input, so documents with the
+        # same name (from different folders) go to different runs, each with
+        # a numbered output subdirectory of its own.
+        batches: list[dict[str, str]] = []  # per run: .docx name -> document
+        converted: list[str] = []
+        for path in paths:
+            name = _docx_name(path)
+            index = next((i for i, batch in enumerate(batches) if name not in batch), None)
+            if index is None:
+                index = len(batches)
+                batches.append({})
+            batches[index][name] = path
+            converted.append(os.path.join(out_dir, str(index), name))
+
+        with self._lock:
+            for index, batch in enumerate(batches):
+                self._run(list(batch.values()), os.path.join(out_dir, str(index)))
+
+        missing = [path for path, output in zip(paths, converted) if not os.path.exists(output)]
+        if missing:
+            raise RuntimeError(f"LibreOffice did not convert: {', '.join(map(repr, missing))}")
+        return converted
+
+    def _run(self, paths: list[str], out_dir: str) -> None:
+        """Convert *paths* (all with distinct names) into *out_dir* with one soffice run."""
+        LOGGER.info("Converting %d document(s) with LibreOffice ...", len(paths))
+        try:
+            subprocess.run(
+                [
+                    self._binary,
+                    f"-env:UserInstallation={self._profile_dir.as_uri()}",
+                    "--headless",
+                    "--norestore",
+                    "--convert-to",
+                    "docx",
+                    "--outdir",
+                    out_dir,
+                    *paths,
+                ],
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"LibreOffice conversion failed: {exc.stderr.decode(errors='replace')}"
+            ) from exc
+
+
+class TextutilConverter(AbstractDocConverter):
+    """Converts documents with macOS ``textutil``.
+
+    ``textutil`` writes each output next to its input, so the documents of a
+    call are copied into the output directory and converted there by one run.
+    """
+
+    def convert(self, paths: list[str], out_dir: str) -> list[str]:
+        """Convert documents to .docx with one textutil run.
+
+        Args:
+            paths: The documents to convert.
+            out_dir: The directory to write the converted documents to.
+
+        Returns:
+            The paths of the converted documents, in the order of *paths*.
+
+        Raises:
+            RuntimeError: If ``textutil`` is missing or fails.
+        """
+        converted: list[str] = []
+        copies: list[str] = []
+        for index, path in enumerate(paths):
+            # A numbered subdirectory per document keeps same-named documents apart.
+            copy_dir = os.path.join(out_dir, str(index))
+            os.makedirs(copy_dir, exist_ok=True)
+            copies.append(shutil.copy(path, copy_dir))
+            converted.append(os.path.join(copy_dir, _docx_name(path)))
+
+        LOGGER.info("Converting %d document(s) with textutil ...", len(paths))
+        try:
+            subprocess.run(
+                ["textutil", "-convert", "docx", *copies],
+                check=True,
+                capture_output=True,
+            )
+        except FileNotFoundError:
+            raise RuntimeError("'textutil' not found. This conversion requires macOS.")
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"textutil conversion failed: {exc.stderr.decode(errors='replace')}"
+            ) from exc
+        return converted
+
+
+@cache
+def default_converter() -> AbstractDocConverter:
+    """Pick the converter for this machine.
+
+    LibreOffice is used wherever it is installed; ``textutil`` is the fallback
+    on macOS only.  The converter is picked once and shared by all callers, so
+    that the LibreOffice runs of concurrent parses share one lock.
+
+    Raises:
+        RuntimeError: If no converter is available.
+    """
+    binary = shutil.which("soffice") or shutil.which("libreoffice")
+    if binary is None and sys.platform == "darwin" and os.path.exists(_MACOS_SOFFICE):
+        binary = _MACOS_SOFFICE
+    if binary is not None:
+        return LibreOfficeConverter(binary)
+    if sys.platform == "darwin":
+        return TextutilConverter()
+    raise RuntimeError(
+        "Converting .doc/.rtf files requires LibreOffice ('soffice' on the PATH)"
+        " or, on macOS, textutil."
+    )
+
+
+def _docx_name(path: str) -> str:
+    """Return the file name of the .docx converted from *path*."""
+    return os.path.splitext(os.path.basename(path))[0] + ".docx"
@@ -4,23 +4,24 @@ from __future__ import annotations
 
 import os
 import re
-import shutil
-import subprocess
 import tempfile
-import zipfile
+from collections.abc import Callable
 from datetime import datetime
-from xml.etree import ElementTree as ET
+from pathlib import Path
+from typing import Any
 
 import typer
 
+from gogol_cli.answers import Answers
+from gogol_cli.docx_text import iter_paragraphs
+from gogol_cli.local_cache import ParseCache
+from gogol_cli.schemas import ImageRef
+from gogol_cli.virtual_exhibition.converters import AbstractDocConverter, default_converter
 from gogol_cli.virtual_exhibition.schemas import (
     ParsedVirtualExhibition,
     ParsedVirtualExhibitionItem,
 )
 
-_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-_W_NSMAP = {"w": _W_NS}
-
 # ---------------------------------------------------------------------------
 # Helpers – text cleaning
 # ---------------------------------------------------------------------------
@@ -41,11 +42,6 @@ _MAX_ITEM_NAME_LEN = 100
 _MAX_DATE_CONTINUATION_LEN = 40
 
 
-def _collapse_spaces(text: str) -> str:
-    text = text.replace("\xa0", " ")
-    return re.sub(r" {2,}", " ", text).strip()
-
-
 def _is_garbage(text: str) -> bool:
     """Return True if the paragraph looks like RTF binary/format garbage."""
     stripped = text.strip()
@@ -162,81 +158,26 @@ def _strip_dates(text: str) -> str:
     return cleaned.strip()
 
 
-# ---------------------------------------------------------------------------
-# DOCX parser
-# ---------------------------------------------------------------------------
-
-
-def _parse_docx_paragraphs(path: str) -> list[str]:
-    """Parse a .docx file and return plain text per paragraph."""
-    with zipfile.ZipFile(path) as zf:
-        with zf.open("word/document.xml") as f:
-            tree = ET.parse(f)
-
-    ns = _W_NSMAP
-    results: list[str] = []
-
-    for p in tree.findall(".//w:p", ns):
-        chars: list[str] = []
-        for r in p.findall("w:r", ns):
-            for t in r.findall("w:t", ns):
-                chars.extend(t.text or "")
-
-        text = _collapse_spaces("".join(chars))
-        if text:
-            results.append(text)
-
-    return results
-
-
 # ---------------------------------------------------------------------------
 # Dispatcher
 # ---------------------------------------------------------------------------
 
 
-def _convert_doc_to_docx(path: str) -> str:
-    """Convert a .doc/.rtf file to .docx via macOS textutil and return the new path.
-
-    The converted file is placed in a temporary directory.  The caller is
-    responsible for deleting that directory when done.
-    """
-    tmp_dir = tempfile.mkdtemp()
-    base = os.path.splitext(os.path.basename(path))[0]
-    converted = os.path.join(tmp_dir, base + ".docx")
-    try:
-        subprocess.run(
-            ["textutil", "-convert", "docx", "-output", converted, path],
-            check=True,
-            capture_output=True,
-        )
-    except FileNotFoundError:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-        raise RuntimeError("'textutil' not found. This conversion requires macOS.")
-    except subprocess.CalledProcessError as exc:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-        raise RuntimeError(
-            f"textutil conversion failed for {path!r}: {exc.stderr.decode(errors='replace')}"
-        ) from exc
-    return converted
-
-
-def _get_paragraphs(path: str) -> list[str]:
+def _get_paragraphs(path: str, converter: AbstractDocConverter | None = None) -> list[str]:
     """Parse a .docx or .doc/.rtf file, returning plain text per paragraph.
 
-    .doc and .rtf files are first converted to .docx via macOS textutil so that
-    all text (including special Unicode characters like en-dashes) is preserved
-    correctly.
+    .doc and .rtf files are first converted to .docx (by *converter*, or by the
+    default converter of this machine) so that all text (including special
+    Unicode characters like en-dashes) is preserved correctly.
     """
     ext = os.path.splitext(path)[1].lower()
     if ext == ".docx":
-        return _parse_docx_paragraphs(path)
+        return list(iter_paragraphs(path))
     # .doc / .rtf — convert to .docx first, then parse
-    converted = _convert_doc_to_docx(path)
-    tmp_dir = os.path.dirname(converted)
-    try:
-        return _parse_docx_paragraphs(converted)
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+    converter = converter or default_converter()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        [converted] = converter.convert([path], tmp_dir)
+        return list(iter_paragraphs(converted))
 
 
 # ---------------------------------------------------------------------------
@@ -412,6 +353,67 @@ def _parse_document(  # noqa: PLR0912, PLR0915
     return raw_title_clean, "", active_from, active_to, body, raw_items
 
 
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+def _dump_document(
+    raw_title: str,
+    active_from: datetime | None,
+    active_to: datetime | None,
+    body: list[str],
+    raw_items: list[_RawItem],
+) -> dict[str, Any]:
+    """Convert the result of ``_parse_document`` to a JSON-serialisable dict."""
+    return {
+        "raw_title": raw_title,
+        "active_from": active_from.isoformat() if active_from else None,
+        "active_to": active_to.isoformat() if active_to else None,
+        "body": body,
+        "raw_items": [vars(raw_item) for raw_item in raw_items],
+    }
+
+
+def _load_document(
+    result: dict[str, Any],
+) -> tuple[str, str, datetime | None, datetime | None, list[str], list[_RawItem]]:
+    """Convert a dict made by ``_dump_document`` back to the result of ``_parse_document``."""
+    raw_items: list[_RawItem] = []
+    for fields in result["raw_items"]:
+        raw_item = _RawItem()
+        vars(raw_item).update(fields)
+        raw_items.append(raw_item)
+    return (
+        result["raw_title"],
+        "",
+        datetime.fromisoformat(result["active_from"]) if result["active_from"] else None,
+        datetime.fromisoformat(result["active_to"]) if result["active_to"] else None,
+        result["body"],
+        raw_items,
+    )
+
+
+def _parse_document_cached(
+    doc_path: str,
+    digest: str,
+    converter: AbstractDocConverter | None,
+    parse_cache: ParseCache,
+) -> tuple[str, str, datetime | None, datetime | None, list[str], list[_RawItem]]:
+    """Return the cached result of ``_parse_document`` for a document, or parse it now."""
+    cached = parse_cache.get_result(digest, "document")
+    if cached is not None:
+        return _load_document(cached)
+
+    raw_title, _, active_from, active_to, body, raw_items = _parse_document(
+        _get_paragraphs(doc_path, converter)
+    )
+    parse_cache.save_result(
+        digest, "document", _dump_document(raw_title, active_from, active_to, body, raw_items)
+    )
+    return raw_title, "", active_from, active_to, body, raw_items
+
+
 # ---------------------------------------------------------------------------
 # Image loading
 # ---------------------------------------------------------------------------
@@ -419,30 +421,28 @@ def _parse_document(  # noqa: PLR0912, PLR0915
 
 def _load_images(
     folder_path: str,
-) -> tuple[tuple[bytes, str] | None, dict[int, list[tuple[bytes, str]]]]:
-    """Load images from the exhibition folder.
+) -> tuple[ImageRef | None, dict[int, list[ImageRef]]]:
+    """Find the images in the exhibition folder (without reading them).
 
     Returns:
-        preview: (data, filename) for the non-КП preview image, or None
-        kp_images: mapping from КП number → list of (data, filename)
+        preview: the non-КП preview image, or None
+        kp_images: mapping from КП number → list of images
     """
     image_exts = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-    preview: tuple[bytes, str] | None = None
-    kp_images: dict[int, list[tuple[bytes, str]]] = {}
+    preview: ImageRef | None = None
+    kp_images: dict[int, list[ImageRef]] = {}
 
     for fname in sorted(os.listdir(folder_path)):
         ext = os.path.splitext(fname)[1].lower()
         if ext not in image_exts:
             continue
         kp_num = _extract_kp_number(fname)
-        filepath = os.path.join(folder_path, fname)
-        with open(filepath, "rb") as fh:
-            data = fh.read()
+        image = ImageRef(path=os.path.join(folder_path, fname))
         if kp_num is not None:
-            kp_images.setdefault(kp_num, []).append((data, fname))
+            kp_images.setdefault(kp_num, []).append(image)
         elif preview is None:
             # Non-КП image — use as exhibition preview/detail
-            preview = (data, fname)
+            preview = image
 
     return preview, kp_images
 
@@ -481,12 +481,16 @@ def _body_lines_to_html(lines: list[str]) -> tuple[str, str]:
 _VYSTAVKA_PREFIX = "Виртуальная выставка"
 
 
-def _prompt_name_and_subtitle(raw_title: str) -> tuple[str, str]:
+def _prompt_name_and_subtitle(
+    raw_title: str, answers: Answers, previous: dict[str, str] | None = None
+) -> tuple[str, str]:
     """Interactively ask the user to confirm the exhibition name and subtitle.
 
     The raw_title is the full title from the document (without dates).
     Default split: first sentence becomes the short title; remainder is the subtitle.
+    *previous* answers ("name", "subtitle"), if any, take precedence as defaults.
     """
+    previous = previous or {}
     typer.echo(f"\nRaw exhibition title from document:\n  {raw_title}")
 
     # Suggest a split at the first '. ' that is not at the very start
@@ -502,44 +506,125 @@ def _prompt_name_and_subtitle(raw_title: str) -> tuple[str, str]:
     suggested_name = f"{_VYSTAVKA_PREFIX} \u00ab{short}\u00bb"
 
     typer.echo()
-    name = typer.prompt("Exhibition name (prop NAME)", default=suggested_name)
-    subtitle = typer.prompt("Exhibition subtitle (prop 196)", default=suggested_sub)
+    name = answers.ask(
+        ["name"], "Exhibition name (prop NAME)", previous.get("name", suggested_name)
+    )
+    subtitle = answers.ask(
+        ["subtitle"], "Exhibition subtitle (prop 196)", previous.get("subtitle", suggested_sub)
+    )
     return name, subtitle
 
 
-def _prompt_dates(
-    active_from: datetime | None,
-    active_to: datetime | None,
-) -> tuple[datetime, datetime]:
-    """Ask the user to confirm or enter the active_from / active_to dates."""
-    typer.echo()
-    from_default = active_from.strftime("%d.%m.%Y") if active_from else ""
-    to_default = active_to.strftime("%d.%m.%Y") if active_to else ""
+def _ask_date(answers: Answers, key: str, text: str, default: str) -> datetime | None:
+    """Ask for a DD.MM.YYYY date until a valid one is given.
 
-    while True:
-        from_str = typer.prompt("Active from (DD.MM.YYYY)", default=from_default)
-        try:
-            confirmed_from = datetime.strptime(from_str, "%d.%m.%Y")
-            break
-        except ValueError:
-            typer.echo("  Invalid date format, please use DD.MM.YYYY")
+    Returns None only when the answers are only collected and the date is
+    missing or invalid: it is then left for the operator to fill in the
+    answers file.
 
+    Raises:
+        ValueError: If a non-interactive answer is not a valid date.
+    """
     while True:
-        to_str = typer.prompt("Active to (DD.MM.YYYY)", default=to_default)
+        value = answers.ask([key], text, default)
         try:
-            confirmed_to = datetime.strptime(to_str, "%d.%m.%Y")
-            break
+            return datetime.strptime(value, "%d.%m.%Y")
         except ValueError:
+            if answers.collect_only:
+                typer.echo(f"  {key} must be filled in (DD.MM.YYYY) in the answers file")
+                return None
+            if not answers.interactive:
+                raise ValueError(f"{key}: {value!r} is not a DD.MM.YYYY date") from None
             typer.echo("  Invalid date format, please use DD.MM.YYYY")
+            answers.reject([key])
+
 
+def _prompt_dates(
+    active_from: datetime | None,
+    active_to: datetime | None,
+    answers: Answers,
+    previous: dict[str, str] | None = None,
+) -> tuple[datetime | None, datetime | None]:
+    """Ask the user to confirm or enter the active_from / active_to dates.
+
+    *previous* answers ("active_from", "active_to"), if any, take precedence as defaults.
+    A date is None only if it is missing while the answers are only collected.
+    """
+    previous = previous or {}
+    typer.echo()
+    from_default = previous.get(
+        "active_from", active_from.strftime("%d.%m.%Y") if active_from else ""
+    )
+    to_default = previous.get("active_to", active_to.strftime("%d.%m.%Y") if active_to else "")
+
+    confirmed_from = _ask_date(answers, "active_from", "Active from (DD.MM.YYYY)", from_default)
+    confirmed_to = _ask_date(answers, "active_to", "Active to (DD.MM.YYYY)", to_default)
     return confirmed_from, confirmed_to
 
 
-def _prompt_item_name(raw_name: str, kp_number: int | None, item_index: int) -> str:
-    """Ask the user to confirm or enter the item name."""
+def _prompt_item_name(
+    raw_name: str,
+    kp_number: int | None,
+    item_index: int,
+    answers: Answers,
+    previous: str | None = None,
+) -> str:
+    """Ask the user to confirm or enter the item name (default: the previous answer, if any)."""
     typer.echo(f"\n--- Item {item_index} (КП {kp_number}) ---")
     default_name = raw_name if raw_name else (f"КП {kp_number}" if kp_number else "")
-    return typer.prompt("  Item name (prop 197)", default=default_name)
+    return answers.ask(
+        ["items", str(item_index), "name"], "  Item name (prop 197)", previous or default_name
+    )
+
+
+def _build_items(
+    raw_items: list[_RawItem],
+    kp_images: dict[int, list[ImageRef]],
+    answers: Answers,
+    previous: dict[str, str],
+    remember: Callable[[str, str], None],
+) -> list[ParsedVirtualExhibitionItem]:
+    """Match the document items to the КП images and confirm their names.
+
+    Each confirmed name is passed to *remember* as the answer to ``"item <n>"``.
+    """
+    # Sort КП image groups by number for deterministic matching
+    sorted_kp = sorted(kp_images.items())  # list of (kp_number, [image, ...])
+
+    # Match items to images by КП number if possible, otherwise by order
+    items: list[ParsedVirtualExhibitionItem] = []
+    for item_idx, raw_item in enumerate(raw_items, start=1):
+        # Determine images for this item
+        if raw_item.kp_number is not None and raw_item.kp_number in kp_images:
+            imgs = kp_images[raw_item.kp_number]
+        elif item_idx - 1 < len(sorted_kp):
+            imgs = sorted_kp[item_idx - 1][1]
+        else:
+            imgs = []
+            typer.echo(f"\nWarning: no images found for item {item_idx}.")
+
+        # Collect name from bold name_lines, stripping a leading index number
+        raw_name = " ".join(raw_item.name_lines).strip()
+        raw_name = re.sub(r"^\d+\s+", "", raw_name)
+        confirmed_name = _prompt_item_name(
+            raw_name, raw_item.kp_number, item_idx, answers, previous.get(f"item {item_idx}")
+        )
+        remember(f"item {item_idx}", confirmed_name)
+
+        bib_html = _bib_lines_to_html(raw_item.bib_lines)
+        desc_html = _desc_lines_to_html(raw_item.desc_lines)
+
+        items.append(
+            ParsedVirtualExhibitionItem(
+                name=confirmed_name,
+                bib_text=bib_html,
+                description=desc_html,
+                kp_number=raw_item.kp_number,
+                images=imgs,
+            )
+        )
+
+    return items
 
 
 # ---------------------------------------------------------------------------
@@ -547,14 +632,30 @@ def _prompt_item_name(raw_name: str, kp_number: int | None, item_index: int) ->
 # ---------------------------------------------------------------------------
 
 
-def parse_virtual_exhibition_folder(folder_path: str) -> ParsedVirtualExhibition:
+def parse_virtual_exhibition_folder(
+    folder_path: str,
+    converter: AbstractDocConverter | None = None,
+    parse_cache: ParseCache | None = None,
+    answers: Answers | None = None,
+) -> ParsedVirtualExhibition | None:
     """Parse a folder into a ParsedVirtualExhibition with interactive prompts.
 
     The folder must contain:
     - Exactly one .doc or .docx document file
     - One non-КП image (preview/detail for the whole exhibition)
     - One or more КП images (one per item or multiple per item sharing the КП number)
+
+    A .doc/.rtf document is converted by *converter* (default: LibreOffice if
+    installed, else textutil on macOS).  A document found in *parse_cache* (by
+    content) is neither converted nor parsed again, and the answers given
+    before for it are offered as the prompt defaults.  Prompts answered by
+    *answers* (e.g. from an answers file) are not asked.
+
+    When *answers* are only collected (to be written to an answers file),
+    nothing is saved to *parse_cache* as confirmed, and None is returned if
+    the dates are missing.
     """
+    answers = answers or Answers()
     # -- Find the document file --
     doc_path: str | None = None
     for fname in os.listdir(folder_path):
@@ -565,9 +666,21 @@ def parse_virtual_exhibition_folder(folder_path: str) -> ParsedVirtualExhibition
     if doc_path is None:
         raise ValueError(f"No .doc/.docx file found in: {folder_path}")
 
+    if parse_cache is None:
+        # Without a cache, parse results and answers only live for this run.
+        parse_cache = ParseCache(Path(":memory:"))
+
     # -- Parse document --
-    paragraphs = _get_paragraphs(doc_path)
-    raw_title, _, active_from, active_to, body_paras, raw_items = _parse_document(paragraphs)
+    digest = ParseCache.digest(doc_path)
+    raw_title, _, active_from, active_to, body_paras, raw_items = _parse_document_cached(
+        doc_path, digest, converter, parse_cache
+    )
+    previous = parse_cache.get_answers(digest)
+
+    def remember(prompt: str, answer: str) -> None:
+        # Answers that are only collected have not been confirmed by anyone.
+        if not answers.collect_only:
+            parse_cache.save_answer(digest, prompt, answer)
 
     # -- Load images --
     preview_image, kp_images = _load_images(folder_path)
@@ -585,49 +698,24 @@ def parse_virtual_exhibition_folder(folder_path: str) -> ParsedVirtualExhibition
         )
 
     # -- Interactive: name + subtitle --
-    name, subtitle = _prompt_name_and_subtitle(raw_title)
+    name, subtitle = _prompt_name_and_subtitle(raw_title, answers, previous)
+    remember("name", name)
+    remember("subtitle", subtitle)
 
     # -- Interactive: dates --
-    confirmed_from, confirmed_to = _prompt_dates(active_from, active_to)
+    confirmed_from, confirmed_to = _prompt_dates(active_from, active_to, answers, previous)
+    if confirmed_from is not None and confirmed_to is not None:
+        remember("active_from", confirmed_from.strftime("%d.%m.%Y"))
+        remember("active_to", confirmed_to.strftime("%d.%m.%Y"))
 
     # -- Body text HTML --
     detail_text, _ = _body_lines_to_html(body_paras)
     preview_text = f"<p>{subtitle}</p>" if subtitle else ""
 
-    # -- Build items --
-    # Sort КП image groups by number for deterministic matching
-    sorted_kp = sorted(kp_images.items())  # list of (kp_number, [(data, fname), ...])
-
-    # Match items to images by КП number if possible, otherwise by order
-    items: list[ParsedVirtualExhibitionItem] = []
-    for item_idx, raw_item in enumerate(raw_items, start=1):
-        # Determine images for this item
-        if raw_item.kp_number is not None and raw_item.kp_number in kp_images:
-            imgs = kp_images[raw_item.kp_number]
-        elif item_idx - 1 < len(sorted_kp):
-            imgs = sorted_kp[item_idx - 1][1]
-        else:
-            imgs = []
-            typer.echo(f"\nWarning: no images found for item {item_idx}.")
-
-        # Collect name from bold name_lines, stripping a leading index number
-        raw_name = " ".join(raw_item.name_lines).strip()
-        raw_name = re.sub(r"^\d+\s+", "", raw_name)
-        confirmed_name = _prompt_item_name(raw_name, raw_item.kp_number, item_idx)
-
-        bib_html = _bib_lines_to_html(raw_item.bib_lines)
-        desc_html = _desc_lines_to_html(raw_item.desc_lines)
-
-        items.append(
-            ParsedVirtualExhibitionItem(
-                name=confirmed_name,
-                bib_text=bib_html,
-                description=desc_html,
-                kp_number=raw_item.kp_number,
-                images=imgs,
-            )
-        )
+    items = _build_items(raw_items, kp_images, answers, previous, remember)
 
+    if confirmed_from is None or confirmed_to is None:
+        return None
     return ParsedVirtualExhibition(
         title=name,
         subtitle=subtitle,
@@ -635,7 +723,6 @@ def parse_virtual_exhibition_folder(folder_path: str) -> ParsedVirtualExhibition
         detail_text=detail_text,
         active_from=confirmed_from,
         active_to=confirmed_to,
-        preview_image_data=preview_image[0],
-        preview_image_filename=preview_image[1],
+        preview_image=preview_image,
         items=items,
     )
@@ -6,6 +6,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
 
+from gogol_cli.schemas import ImageRef
+
 
 class ParsedVirtualExhibitionItem(BaseModel):
     """One item (artifact/object) parsed from the virtual exhibition document."""
@@ -16,7 +18,7 @@ class ParsedVirtualExhibitionItem(BaseModel):
     bib_text: str  # HTML for prop 198 (origin, materials, indices joined)
     description: str  # HTML for prop 199 (optional editorial description)
     kp_number: int | None  # КП inventory number extracted from the bib indices line
-    images: list[tuple[bytes, str]]  # (image_bytes, filename) for prop 200
+    images: list[ImageRef]  # for prop 200
 
 
 class ParsedVirtualExhibition(BaseModel):
@@ -30,6 +32,5 @@ class ParsedVirtualExhibition(BaseModel):
     detail_text: str  # HTML detail text (all body paragraphs)
     active_from: datetime
     active_to: datetime
-    preview_image_data: bytes
-    preview_image_filename: str
+    preview_image: ImageRef
     items: list[ParsedVirtualExhibitionItem]
@@ -0,0 +1,81 @@
+"""Tests of the incremental monthly statistics."""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from gogol_cli.local_cache import StatisticsCache
+from gogol_cli.schemas import StatisticsCount
+from gogol_cli.service import GogolCLIService
+
+
+class FakeDatabaseClient:
+    """Counts "02 files" rows (timestamps, by ID order) like the statistics queries."""
+
+    def __init__(self, timestamps: list[datetime]) -> None:
+        self.timestamps = timestamps
+
+    async def export_statistics(self, start_date, end_date, skip=()):
+        return []
+
+    async def count_statistics_since(self, what, start_date, end_date, after_id=None):
+        counted = [
+            row_id
+            for row_id, ts in enumerate(self.timestamps, start=1)
+            if row_id > (after_id or 0) and start_date <= ts < end_date
+        ]
+        return StatisticsCount(what=what, cnt=len(counted), last_id=max(counted, default=None))
+
+
+class IncrementalExportTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = StatisticsCache(Path(self.tmp_dir.name) / "statistics.sqlite3")
+        now = datetime.now()
+        self.month_number, self.year_suffix = now.month, now.strftime("%y")
+        self.month = now.strftime("%Y-%m")
+        self.start = datetime(now.year, now.month, 1)
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    async def export_files(self, db: FakeDatabaseClient) -> int:
+        service = GogolCLIService(db, statistics_cache=self.cache)
+        statistics = await service.export(self.month_number, self.year_suffix)
+        return {row["what"]: row["cnt"] for row in statistics}.get("02 files", 0)
+
+    async def test_count_is_stable_without_new_rows(self) -> None:
+        db = FakeDatabaseClient([self.start, self.start.replace(second=1)] * 2)
+
+        counts = [await self.export_files(db) for _ in range(3)]
+
+        self.assertEqual(counts, [4, 4, 4])
+
+    async def test_count_is_kept_when_nothing_is_found_from_the_mark(self) -> None:
+        self.cache.save(self.month, [StatisticsCount(what="02 files", cnt=5, last_id=7)], False)
+        db = FakeDatabaseClient([])
+
+        counts = [await self.export_files(db) for _ in range(3)]
+
+        self.assertEqual(counts, [5, 5, 5])
+
+    async def test_new_rows_are_added(self) -> None:
+        db = FakeDatabaseClient([self.start, self.start.replace(second=1)])
+        first = await self.export_files(db)
+        db.timestamps += [self.start.replace(second=1), self.start.replace(second=2)]
+
+        self.assertEqual((first, await self.export_files(db)), (2, 4))
+
+    async def test_copies_with_older_timestamps_are_added(self) -> None:
+        db = FakeDatabaseClient([self.start, self.start.replace(second=2)])
+        first = await self.export_files(db)
+        # A file record copy keeps the timestamp of its source.
+        db.timestamps.append(self.start)
+
+        self.assertEqual((first, await self.export_files(db)), (2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()